@@ -1,8 +1,11 @@
 import sys
-from PyQt5.QtWidgets import QApplication
-from src.core.hand_tracking_app import CameraViewerApp
 
 if __name__ == "__main__":
+    # Imported here so spawned export workers, which re-import this module,
+    # load only the render path and not Qt or the application
+    from PyQt5.QtWidgets import QApplication
+    from src.core.hand_tracking_app import CameraViewerApp
+
     app = QApplication(sys.argv)
     window = CameraViewerApp()
     window.show()
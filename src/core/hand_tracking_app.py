@@ -2,33 +2,87 @@ import sys
 import cv2
 import os
 import csv
+import json
 from PyQt5.QtWidgets import QApplication, QMessageBox, QFileDialog
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QImage, QPixmap
+from PyQt5.QtCore import QEvent, QTimer, Qt
 from src.gui.camera_viewer_gui import CameraViewerGUI
 from src.utils.utils import log_message
-from src.core.hand_landmarks import LANDMARK_DICT, STATS_DICT
 from src.managers.camera_manager import CameraManager
 from src.managers.recording_manager import RecordingManager
 from src.managers.playback_manager import PlaybackManager
 from src.managers.analysis_manager import AnalysisManager
 from src.managers.visualization_manager import VisualizationManager
+from src.managers.export_manager import ExportManager
+from src.managers.playback_renderer import (
+    PlaybackFrame,
+    PlaybackRenderer,
+    render_views,
+)
+from src.utils.analysis_columns import AnalysisColumns
+from src.utils.frame_cache import FrameCache
+from src.utils.display_utils import fit_size, frame_to_pixmap
 import time
+import threading
 from datetime import datetime
 
 
 class CameraViewerApp(CameraViewerGUI):
+    # Index of each view's tab in visualization_tabs
+    VIEW_TABS = {"original": 0, "trailed": 1, "heatmap": 2, "mixed": 3}
+    # Pause after the last slider move before rendering at full resolution
+    SCRUB_REST_MS = 150
+
     def __init__(self):
         super().__init__()
         self.playback_timer = QTimer()
         self.playback_timer.timeout.connect(self.update_playback_frame)
 
         self.camera_manager = CameraManager()
+        self.camera_manager.add_frame_listener(self.on_camera_frame)
+        # Keeps recorded and live-analyzed frames in step when recording stops
+        self.recording_lock = threading.Lock()
         self.recording_manager = RecordingManager()
         self.analysis_manager = AnalysisManager()
-        self.playback_manager = PlaybackManager()
+        self.playback_manager = PlaybackManager(
+            self.settings_handler.get_setting("Performance", "frame_cache_mb") << 20
+        )
         self.visualization_manager = VisualizationManager(self.settings_handler)
 
+        # Rendered trailed/heatmap frames for scrubbing back and forth
+        self.render_cache_mb = self.settings_handler.get_setting(
+            "Performance", "render_cache_mb"
+        )
+        self.render_cache = FrameCache(self.render_cache_mb << 20)
+        self.view_times = {}  # Smoothed per-view render and display cost (ms)
+        self.stale_views = set()  # Tabs not updated since the frame changed
+
+        # Playback frames are decoded and rendered ahead on a worker thread
+        self.playback_renderer = PlaybackRenderer(
+            self.settings_handler, self.playback_manager
+        )
+
+        # Slider moves are coalesced; only the latest position is rendered
+        self.scrub_timer = QTimer()
+        self.scrub_timer.setSingleShot(True)
+        self.scrub_timer.timeout.connect(self.update_frame_from_slider)
+        # The scrubbing proxy is made in the background, polled until ready
+        self.proxy_timer = QTimer()
+        self.proxy_timer.timeout.connect(self.update_thumbnail_strip)
+
+        # Landmark and stats tables, refreshed at most at the display rate
+        self.analysis_columns = None
+        self.table_frame_index = None
+        self.table_refresh_time = 0.0
+        self.table_timer = QTimer()
+        self.table_timer.setSingleShot(True)
+        self.table_timer.timeout.connect(self.refresh_frame_tables)
+
+        # Video exports run on background threads, polled for progress
+        self.export_manager = ExportManager()
+        self.export_description = None
+        self.export_timer = QTimer()
+        self.export_timer.timeout.connect(self.update_export_progress)
+
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_frame)
         self.playback_timer = QTimer()
@@ -47,8 +101,7 @@ class CameraViewerApp(CameraViewerGUI):
     def connect_signals(self):
         # Camera controls
         self.connect_button.clicked.connect(self.toggle_camera)
-        self.camera_combo.currentIndexChanged.connect(self.populate_camera_list)
-        self.refresh_button.clicked.connect(self.on_refresh_clicked)
+        self.refresh_cameras_button.clicked.connect(self.refresh_camera_list)
 
         # Analysis controls
         self.start_analyze_button.clicked.connect(self.start_analyzing)
@@ -60,6 +113,10 @@ class CameraViewerApp(CameraViewerGUI):
         self.generate_trailing_button.clicked.connect(self.generate_full_trailing)
         self.generate_heatmap_button.clicked.connect(self.generate_full_heatmap)
 
+        # Render hidden views when they are shown
+        self.visualization_tabs.currentChanged.connect(self.on_view_visibility_changed)
+        self.tab_widget.currentChanged.connect(self.on_view_visibility_changed)
+
         # Recording controls
         self.recording_combo.currentIndexChanged.connect(
             self.update_recording_selection
@@ -79,10 +136,32 @@ class CameraViewerApp(CameraViewerGUI):
         self.save_part_trailing_button.clicked.connect(self.save_part_of_trailing)
         self.save_part_heatmap_button.clicked.connect(self.save_part_of_heatmap)
         self.save_part_csv_button.clicked.connect(self.save_part_of_csv)
-
-    def populate_camera_list(self):
-        camera_list = self.camera_manager.get_camera_list()
+        self.save_batch_button.clicked.connect(self.save_selected_parts)
+        self.cancel_export_button.clicked.connect(self.cancel_export)
+
+    def populate_camera_list(self, refresh=False):
+        """Fill the camera combo, probing devices only when asked to refresh"""
+        current_selection = self.camera_combo.currentText()
+        probed = refresh or self.camera_manager.camera_list_cache is None
+        camera_list = self.camera_manager.get_camera_list(refresh=refresh)
+        device_count = len(camera_list)
+        if self.settings_handler.get_setting("Camera", "enable_synthetic"):
+            camera_list.append("Synthetic Camera")
+
+        self.camera_combo.clear()
         self.camera_combo.addItems(camera_list)
+        if current_selection in camera_list:
+            self.camera_combo.setCurrentText(current_selection)
+
+        if probed:
+            self.log(
+                f"Found {device_count} cameras in "
+                f"{self.camera_manager.last_enumeration_time * 1000:.0f} ms"
+            )
+
+    def refresh_camera_list(self):
+        """Probe camera devices again"""
+        self.populate_camera_list(refresh=True)
 
     def populate_recording_list(self):
         recording_list = self.recording_manager.get_recording_list()
@@ -100,6 +179,7 @@ class CameraViewerApp(CameraViewerGUI):
         self.save_part_trailing_button.setEnabled(False)
         self.save_part_heatmap_button.setEnabled(False)
         self.save_part_csv_button.setEnabled(False)
+        self.save_batch_button.setEnabled(False)
         self.generate_trailing_button.setEnabled(False)
         self.generate_heatmap_button.setEnabled(False)
 
@@ -118,6 +198,7 @@ class CameraViewerApp(CameraViewerGUI):
         self.save_part_trailing_button.setEnabled(False)
         self.save_part_heatmap_button.setEnabled(False)
         self.save_part_csv_button.setEnabled(False)
+        self.save_batch_button.setEnabled(False)
         self.generate_trailing_button.setEnabled(False)
         self.generate_heatmap_button.setEnabled(False)
 
@@ -145,16 +226,46 @@ class CameraViewerApp(CameraViewerGUI):
 
     def toggle_camera(self):
         if not self.camera_manager.camera:
-            camera_index = int(self.camera_combo.currentText().split()[-1])
+            if not self.camera_combo.currentText():
+                self.log("No camera selected")
+                return
             width, height = self.get_camera_resolution()
 
-            if self.camera_manager.connect_camera(camera_index, width, height):
+            if self.camera_combo.currentText() == "Synthetic Camera":
+                source = self.settings_handler.get_setting("Camera", "synthetic_source")
+                fps = self.settings_handler.get_setting("Camera", "synthetic_fps")
+                connected = self.camera_manager.connect_synthetic_camera(
+                    source or None, width, height, fps
+                )
+            else:
+                camera_index = int(self.camera_combo.currentText().split()[-1])
+                connected = self.camera_manager.connect_camera(
+                    camera_index,
+                    width,
+                    height,
+                    fps=self.settings_handler.get_setting("Camera", "fps"),
+                    fourcc=self.settings_handler.get_setting("Camera", "fourcc"),
+                    buffer_size=self.settings_handler.get_setting(
+                        "Camera", "buffer_size"
+                    ),
+                )
+
+            if connected:
                 actual_width, actual_height = (
                     self.camera_manager.get_actual_resolution()
                 )
                 self.log(
                     f"Camera connected with resolution: {actual_width}x{actual_height} (requested: {width}x{height})"
                 )
+                report = self.camera_manager.get_format_report()
+                if report:
+                    requested = report["requested"]
+                    self.log(
+                        f"Camera format: {report['fourcc']} {report['width']}x{report['height']} "
+                        f"@ {report['fps']:.1f} fps, buffer {report['buffer_size']} "
+                        f"(requested: {requested['fourcc']} {requested['width']}x{requested['height']} "
+                        f"@ {requested['fps']} fps, buffer {requested['buffer_size']})"
+                    )
                 self.connect_button.setText("Disconnect")
                 self.timer.start(30)
                 self.start_analyze_button.setEnabled(True)
@@ -171,10 +282,18 @@ class CameraViewerApp(CameraViewerGUI):
             self.stop_analyze_button.setEnabled(False)
             self.log("Camera disconnected")
 
+    def on_camera_frame(self, frame, capture_time):
+        """Receive every captured frame on the capture thread"""
+        with self.recording_lock:
+            if self.recording_manager.is_recording:
+                self.recording_manager.add_frame(frame)
+                self.analysis_manager.submit_live_frame(frame)
+
     def update_frame(self):
-        ret, frame = self.camera_manager.read_frame()
-        if ret:
-            # Calculate FPS
+        # Only display the newest frame; older ones were already recorded
+        frame, capture_time = self.camera_manager.get_latest_frame()
+        if frame is not None:
+            # Calculate display FPS
             current_time = time.time()
             self.frame_times.append(current_time)
 
@@ -184,46 +303,80 @@ class CameraViewerApp(CameraViewerGUI):
 
             # Update FPS display every second
             if current_time - self.last_fps_update >= self.fps_update_interval:
-                fps = len(self.frame_times)
+                display_fps = len(self.frame_times)
                 actual_width, actual_height = (
                     self.camera_manager.get_actual_resolution()
                 )
-                self.update_resolution_display(actual_width, actual_height, fps)
+                stats = self.camera_manager.get_capture_stats()
+                self.update_resolution_display(
+                    actual_width,
+                    actual_height,
+                    stats["capture_fps"],
+                    display_fps=display_fps,
+                    dropped_frames=stats["dropped_frames"],
+                    latency_ms=stats["latency_ms"],
+                )
                 self.last_fps_update = current_time
 
-            if self.recording_manager.is_recording:
-                self.recording_manager.add_frame(frame)
-
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame_rgb.shape
-            bytes_per_line = ch * w
-            convert_to_qt_format = QImage(
-                frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888
-            )
-            pixmap = QPixmap.fromImage(convert_to_qt_format)
-            self.update_camera_frame(pixmap)
+            self.update_camera_frame(frame)
+            self.camera_manager.mark_displayed(capture_time)
 
     def start_analyzing(self):
         if not self.camera_manager.camera:
             self.log("Cannot start recording: Camera is not connected")
             return
 
-        self.recording_manager.start_recording()
+        with self.recording_lock:
+            self.recording_manager.start_recording()
+            if self.settings_handler.get_setting(
+                "Recording", "analyze_while_recording"
+            ):
+                self.analysis_manager.start_live_analysis(
+                    self.recording_manager.get_current_timestamp()
+                )
         self.start_analyze_button.setEnabled(False)
         self.stop_analyze_button.setEnabled(True)
         self.log("Started recording")
 
     def stop_analyzing(self):
-        self.recording_manager.stop_recording()
-        self.start_analyze_button.setEnabled(True)
+        with self.recording_lock:
+            self.recording_manager.stop_recording()
+            live_worker = self.analysis_manager.finish_live_analysis()
         self.stop_analyze_button.setEnabled(False)
         self.log("Stopped recording")
 
-        # Save recording with timestamp
-        self.recording_manager.save_recording()
+        # Save recording with timestamp (live analysis keeps catching up meanwhile)
+        self.recording_manager.save_recording(
+            fps=self.camera_manager.get_recording_fps()
+        )
+        if live_worker is not None:
+            self.wait_for_live_analysis(live_worker)
+        self.start_analyze_button.setEnabled(self.camera_manager.camera is not None)
         self.populate_recording_list()
         self.log("Recording saved successfully")
 
+    def wait_for_live_analysis(self, worker):
+        """Wait for the live analysis worker to analyze the remaining frames"""
+        self.show_progress_bar(True)
+        try:
+            while worker.is_alive():
+                self.set_progress(worker.get_progress())
+                QApplication.processEvents()
+                worker.join(0.05)
+        finally:
+            self.show_progress_bar(False)
+            self.set_progress(0)
+
+        if worker.error is not None:
+            self.log(f"Live analysis failed: {worker.error}")
+            return
+
+        self.analysis_manager.mark_live_analysis_done(worker)
+        self.log(
+            f"Live analysis saved: {worker.csv_path} "
+            f"({worker.processed_frames} frames)"
+        )
+
     def start_playing(self):
         """Start video playback"""
         if not self.playback_manager.is_playback_ready():
@@ -241,8 +394,8 @@ class CameraViewerApp(CameraViewerGUI):
         if self.playback_timer.isActive():
             return
 
-        # Start the timer
-        self.playback_timer.start(30)  # 30ms for ~30fps
+        # Start the timer, the renderer starts on its first tick
+        self.playback_timer.start(PlaybackManager.TIMER_INTERVAL_MS)
         self.playback_manager.playing = True
         self.playback_manager.paused = False
 
@@ -267,10 +420,11 @@ class CameraViewerApp(CameraViewerGUI):
             self.playback_manager.paused = not self.playback_manager.paused
             if self.playback_manager.paused:
                 self.playback_timer.stop()
+                self.playback_renderer.stop()
                 self.pause_play_button.setText("Resume")
                 self.log("Playback paused")
             else:
-                self.playback_timer.start(30)
+                self.playback_timer.start(PlaybackManager.TIMER_INTERVAL_MS)
                 self.pause_play_button.setText("Pause")
                 self.log("Playback resumed")
 
@@ -285,6 +439,13 @@ class CameraViewerApp(CameraViewerGUI):
         self.playback_manager.paused = False
         self.playback_manager.current_frame_index = 0
         self.playback_timer.stop()
+        if self.playback_renderer.is_running():
+            self.playback_renderer.stop()
+            stats = self.playback_renderer.get_stats()
+            self.log(
+                f"Playback: {stats['shown']} frames shown, "
+                f"{stats['dropped']} dropped"
+            )
 
         # Update button states
         self.start_play_button.setEnabled(True)
@@ -315,7 +476,14 @@ class CameraViewerApp(CameraViewerGUI):
         csv_filename = f"csv_{timestamp}.csv"
         csv_path = os.path.join("src/data/csv_data", csv_filename)
 
-        if os.path.exists(csv_path):
+        if self.analysis_manager.is_live_analysis_complete(csv_path):
+            # Analyzed while recording, no need for the offline pass
+            if not self.load_csv_data(recording_name):
+                self.log("Failed to load analyzed data")
+                return
+            self.log("Loaded analysis data produced while recording")
+            self.enable_analysis_features()
+        elif os.path.exists(csv_path):
             reply = QMessageBox.question(
                 self,
                 "Analysis Exists",
@@ -359,6 +527,7 @@ class CameraViewerApp(CameraViewerGUI):
         self.save_part_trailing_button.setEnabled(True)
         self.save_part_heatmap_button.setEnabled(True)
         self.save_part_csv_button.setEnabled(True)
+        self.save_batch_button.setEnabled(True)
         self.generate_trailing_button.setEnabled(True)
         self.generate_heatmap_button.setEnabled(True)
 
@@ -412,6 +581,7 @@ class CameraViewerApp(CameraViewerGUI):
 
         total_frames = self.playback_manager.get_total_frames()
         self.log(f"Successfully loaded video with {total_frames} frames")
+        self.watch_video_proxy()
 
         # Get video metadata
         cap = cv2.VideoCapture(recording_path)
@@ -460,118 +630,321 @@ class CameraViewerApp(CameraViewerGUI):
         if not self.playback_manager.is_playback_ready():
             return
 
-        frame = self.playback_manager.get_frame(
-            self.playback_manager.current_frame_index
-        )
+        frame_index = self.playback_manager.current_frame_index
+        frame = self.playback_manager.get_frame(frame_index)
         if frame is None:
             return
+        self.update_frame_cache_debug()
 
-        # Convert frame to RGB for display
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = frame_rgb.shape
-        bytes_per_line = ch * w
+        # Frames stay BGR all the way to the labels
+        h, w = frame.shape[:2]
         original_size = (w, h)
-
-        # Calculate target sizes for mixed view based on aspect ratio
-        aspect_ratio = w / h
-        if aspect_ratio > 16 / 9:  # Wider than 16:9
-            mixed_small_w = 640
-            mixed_small_h = int(640 / aspect_ratio)
-        else:  # Taller than or equal to 16:9
-            mixed_small_h = 360
-            mixed_small_w = int(360 * aspect_ratio)
-
-        mixed_large_w = mixed_small_w * 2
-        mixed_large_h = mixed_small_h * 2
-
-        small_size = (mixed_small_w, mixed_small_h)
-        large_size = (mixed_large_w, mixed_large_h)
-
-        # Always show original frame in Original tab and mixed view
-        convert_to_qt_format = QImage(
-            frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888
-        )
-        pixmap = QPixmap.fromImage(convert_to_qt_format)
-        self.update_analyzed_frame(pixmap, original_size)
-        self.update_mixed_frame(self.mixed_original_label, pixmap, small_size)
+        small_size, large_size = self.get_mixed_sizes(w, h)
+
+        # Only render what is on screen; hidden tabs catch up when shown
+        visible = self.get_visible_views()
+        self.stale_views = set(self.VIEW_TABS) - visible
+        mixed_frames = {}  # Views composited into the mixed tab at the end
+
+        # Original frame in Original tab and mixed view
+        if visible & {"original", "mixed"}:
+            start_time = time.perf_counter()
+            if "original" in visible:
+                self.update_analyzed_frame(frame, original_size)
+            if "mixed" in visible:
+                mixed_frames["original"] = frame
+            self.record_view_time("original", start_time)
 
         # Only update analysis-dependent views if we have analysis data
         if self.playback_manager.is_analysis_ready():
             # Update trailed frame if real-time is enabled
-            if self.settings_handler.get_setting("ViewSettings", "trailed_realtime"):
-                trailed_frame = self.visualization_manager.generate_trailed_frame(
-                    frame_rgb.copy(),
-                    self.playback_manager.analyzed_data,
-                    self.playback_manager.current_frame_index,
-                )
-                trailed_rgb = cv2.cvtColor(trailed_frame, cv2.COLOR_BGR2RGB)
-                trailed_qt = QImage(
-                    trailed_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888
+            if self.settings_handler.get_setting(
+                "ViewSettings", "trailed_realtime"
+            ) and (visible & {"trailed", "mixed"}):
+                start_time = time.perf_counter()
+                trailed_size = self.get_render_size(
+                    "trailed", visible, w, h, small_size
                 )
-                trailed_pixmap = QPixmap.fromImage(trailed_qt)
-                self.update_trailed_frame(trailed_pixmap, original_size)
-                self.update_mixed_frame(
-                    self.mixed_trailed_label, trailed_pixmap, small_size
+                trailed = self.get_cached_view(
+                    "trailed",
+                    frame_index,
+                    trailed_size,
+                    lambda: self.visualization_manager.generate_trailed_frame(
+                        frame,
+                        self.playback_manager.analyzed_data,
+                        frame_index,
+                        output_size=trailed_size,
+                    ),
                 )
+                if "trailed" in visible:
+                    self.update_trailed_frame(trailed, original_size)
+                if "mixed" in visible:
+                    mixed_frames["trailed"] = trailed
+                self.record_view_time("trailed", start_time)
 
             # Update heatmap frame if real-time is enabled
-            if self.settings_handler.get_setting("ViewSettings", "heatmap_realtime"):
-                trail_length = self.settings_handler.settings["Trailing"][
-                    "trail_length"
-                ]
-                start_frame = max(
-                    0, self.playback_manager.current_frame_index - trail_length
-                )
-
-                heatmap_frame = self.visualization_manager.generate_heatmap_frame(
-                    frame_rgb.copy(),
-                    self.playback_manager.analyzed_data,
-                    self.playback_manager.current_frame_index,
-                    start_frame=start_frame,
-                    end_frame=self.playback_manager.current_frame_index,
-                )
-                heatmap_rgb = cv2.cvtColor(heatmap_frame, cv2.COLOR_BGR2RGB)
-                heatmap_qt = QImage(
-                    heatmap_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888
-                )
-                heatmap_pixmap = QPixmap.fromImage(heatmap_qt)
-                self.update_heatmap_frame(heatmap_pixmap, original_size)
-                self.update_mixed_frame(
-                    self.mixed_heatmap_label, heatmap_pixmap, large_size
+            if self.settings_handler.get_setting(
+                "ViewSettings", "heatmap_realtime"
+            ) and (visible & {"heatmap", "mixed"}):
+                start_time = time.perf_counter()
+                heatmap_size = self.get_render_size(
+                    "heatmap", visible, w, h, large_size
                 )
+                heatmap = self.get_cached_heatmap_view(frame, frame_index, heatmap_size)
+                if "heatmap" in visible:
+                    self.update_heatmap_frame(heatmap, original_size)
+                if "mixed" in visible:
+                    mixed_frames["heatmap"] = heatmap
+                self.record_view_time("heatmap", start_time)
 
-            # Update landmarks and stats
-            frame_data = self.playback_manager.analyzed_data[
-                self.playback_manager.current_frame_index
-            ]
-            left_landmarks = self.parse_landmarks(frame_data, "left")
-            right_landmarks = self.parse_landmarks(frame_data, "right")
-            self.update_landmarks_table(self.left_landmarks_table, left_landmarks)
-            self.update_landmarks_table(self.right_landmarks_table, right_landmarks)
+            self.update_frame_tables(self.playback_manager.current_frame_index)
 
-            # Update stats table
-            stats = self.parse_stats(frame_data)
-            self.update_stats_table(stats)
+        if "mixed" in visible:
+            start_time = time.perf_counter()
+            self.update_mixed_view(mixed_frames, original_size)
+            self.record_view_time("mixed", start_time)
 
         # Always update frame labels
         self.update_frame_labels()
 
+    def update_frame_tables(self, frame_index):
+        """Show a frame in the landmark and stats tables
+
+        The tables are refreshed at most once per display refresh; frames
+        requested in between only replace the pending one.
+        """
+        self.table_frame_index = frame_index
+        if self.table_timer.isActive():
+            return
+        interval = 1.0 / self.get_display_rate()
+        wait = self.table_refresh_time + interval - time.perf_counter()
+        if wait <= 0:
+            self.refresh_frame_tables()
+        else:
+            self.table_timer.start(int(wait * 1000.0) + 1)
+
+    def get_display_rate(self):
+        """Get the refresh rate of the window's screen (Hz)"""
+        screen = self.screen()
+        rate = screen.refreshRate() if screen is not None else 0.0
+        return rate if rate >= 1.0 else 60.0
+
+    def refresh_frame_tables(self):
+        """Put the pending frame's values into the table models"""
+        self.table_refresh_time = time.perf_counter()
+        frame_index = self.table_frame_index
+        analyzed_data = self.playback_manager.analyzed_data
+        if frame_index is None or not 0 <= frame_index < len(analyzed_data):
+            return
+        if self.analysis_columns is None or not self.analysis_columns.matches(
+            analyzed_data
+        ):
+            self.analysis_columns = AnalysisColumns(analyzed_data)
+        columns = self.analysis_columns
+
+        self.update_landmarks_table(
+            self.left_landmarks_table, columns.get_landmark_values(frame_index, "left")
+        )
+        self.update_landmarks_table(
+            self.right_landmarks_table,
+            columns.get_landmark_values(frame_index, "right"),
+        )
+        self.update_stats_table(columns.get_stat_values(frame_index))
+
+    def get_visible_views(self):
+        """Get the visualization tabs currently on screen
+
+        Returns:
+            set: Names from VIEW_TABS; empty while the Camera View tab is
+                shown or the window is minimized
+        """
+        if self.isMinimized() or self.tab_widget.currentWidget() is self.camera_tab:
+            return set()
+        for name, index in self.VIEW_TABS.items():
+            if index == self.visualization_tabs.currentIndex():
+                return {name}
+        return set()
+
+    def on_view_visibility_changed(self, index=None):
+        """Render views that went stale while hidden once they become visible"""
+        if not self.playback_manager.is_playback_ready():
+            return
+        if self.playback_manager.playing and not self.playback_manager.paused:
+            return  # The next playback tick renders them
+        if self.get_visible_views() & self.stale_views:
+            self.update_frame_display()
+
+    def changeEvent(self, event):
+        # Restoring the window shows the tabs that went stale while minimized
+        if (
+            event.type() == QEvent.WindowStateChange
+            and event.oldState() & Qt.WindowMinimized
+            and not self.isMinimized()
+        ):
+            self.on_view_visibility_changed()
+        super().changeEvent(event)
+
+    def get_render_size(self, view, visible, width, height, mixed_size):
+        """Get the size to render a view at: as shown, at most the source size
+
+        Args:
+            view (str): "trailed" or "heatmap"
+            visible (set): Views currently on screen
+            width (int): Source frame width
+            height (int): Source frame height
+            mixed_size (tuple): Box of the view in the mixed tab
+
+        Returns:
+            tuple: (width, height)
+        """
+        if view in visible:
+            label = getattr(self, f"{view}_label")
+            box = (label.width(), label.height())
+        else:
+            box = mixed_size
+        return fit_size(width, height, box[0], box[1], upscale=False)
+
+    def get_mixed_sizes(self, width, height):
+        """Get the (small, large) tile sizes of the mixed view for a frame size"""
+        tiles = self.get_mixed_tiles(width, height)
+        return tuple(tiles["original"][2:]), tuple(tiles["heatmap"][2:])
+
+    def record_view_time(self, view, start_time):
+        """Track the render and display time of a view for the debug panel"""
+        elapsed = (time.perf_counter() - start_time) * 1000.0
+        previous = self.view_times.get(view)
+        # Exponential moving average keeps the readout stable
+        self.view_times[view] = (
+            elapsed if previous is None else 0.9 * previous + 0.1 * elapsed
+        )
+        self.set_debug_info(
+            "view_times",
+            "View cost: "
+            + ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.view_times.items()),
+        )
+
     def update_playback_frame(self):
-        """Update frame during playback"""
+        """Show the newest due frame from the playback renderer"""
         if not self.playback_manager.is_playback_ready():
             return
+        if not self.playback_manager.playing or self.playback_manager.paused:
+            return
 
-        if self.playback_manager.playing and not self.playback_manager.paused:
-            next_frame = self.playback_manager.current_frame_index + 1
-            end_frame = self.frame_slider.high()
-            start_frame = self.frame_slider.low()
+        renderer = self.playback_renderer
+        if renderer.error:
+            self.log(f"Playback error: {renderer.error}")
+            self.stop_playing()
+            return
 
-            if next_frame > end_frame:
-                next_frame = start_frame
+        width, height = self.playback_manager.get_frame_size()
+        renderer.set_views(
+            self.get_playback_views(width, height), self.get_heatmap_range()
+        )
 
-            self.playback_manager.current_frame_index = next_frame
-            self.update_frame_display()
+        # Frames are paced by the recording's frame rate and the playback speed
+        frame_interval = self.playback_manager.get_frame_interval(
+            self.settings_handler.get_setting("ViewSettings", "playback_rate")
+        )
+        next_frame = self.playback_manager.current_frame_index + 1
+
+        # (Re)start after a pause or when the recording or its data changed
+        if renderer.is_running() and (
+            renderer.video_path != self.playback_manager.current_recording_path
+            or renderer.analyzed_data is not self.playback_manager.analyzed_data
+        ):
+            renderer.stop()
+        if not renderer.is_running():
+            renderer.start(
+                self.playback_manager.analyzed_data,
+                next_frame,
+                self.frame_slider.low(),
+                self.frame_slider.high(),
+                frame_interval,
+                heatmap_index=self.visualization_manager.heatmap_index,
+            )
+        elif renderer.frame_interval != frame_interval:
+            # Speed changed: continue from the frame on screen at the new pace
+            renderer.restart(
+                next_frame,
+                self.frame_slider.low(),
+                self.frame_slider.high(),
+                frame_interval,
+            )
+
+        frame = renderer.get_due_frame()
+        if frame is not None:
+            self.show_playback_frame(frame)
             self.update_frame_labels()
+            self.update_frame_cache_debug()
+            stats = renderer.get_stats()
+            render_ms = stats["render_ms"] or 0.0
+            self.set_debug_info(
+                "playback",
+                f"Playback: {stats['rendered']} rendered, {stats['shown']} shown, "
+                f"{stats['dropped']} dropped, {stats['prefetched']} prefetched, "
+                f"render {render_ms:.1f} ms",
+            )
+
+    def get_playback_views(self, width, height):
+        """Get the views the playback renderer draws and their display sizes
+
+        Args:
+            width (int): Video frame width
+            height (int): Video frame height
+
+        Returns:
+            dict: (width, height) of each view on screen
+        """
+        visible = self.get_visible_views()
+        labels = {
+            "original": self.analyzed_label,
+            "trailed": self.trailed_label,
+            "heatmap": self.heatmap_label,
+        }
+        small_size, large_size = self.get_mixed_sizes(width, height)
+        mixed_sizes = {
+            "original": small_size,
+            "trailed": small_size,
+            "heatmap": large_size,
+        }
+
+        views = {}
+        for view, label in labels.items():
+            if view != "original" and not (
+                self.playback_manager.is_analysis_ready()
+                and self.settings_handler.get_setting(
+                    "ViewSettings", f"{view}_realtime"
+                )
+            ):
+                continue
+            if view in visible:
+                views[view] = fit_size(width, height, label.width(), label.height())
+            elif "mixed" in visible:
+                box = mixed_sizes[view]
+                views[view] = fit_size(width, height, box[0], box[1], upscale=False)
+        return views
+
+    def show_playback_frame(self, frame):
+        """Put a frame rendered by the playback renderer on the labels"""
+        self.playback_manager.current_frame_index = frame.frame_index
+        visible = self.get_visible_views()
+        self.stale_views = set(self.VIEW_TABS) - visible
+
+        # Views are already at their display size, so showing them is a blit
+        tab_updates = {
+            "original": self.update_analyzed_frame,
+            "trailed": self.update_trailed_frame,
+            "heatmap": self.update_heatmap_frame,
+        }
+        for view, image in frame.views.items():
+            if view in visible:
+                tab_updates[view](image, frame.source_size)
+        if "mixed" in visible:
+            # Views are at their tile sizes, compositing only copies them
+            self.update_mixed_view(frame.views, frame.source_size)
+
+        if self.playback_manager.is_analysis_ready():
+            self.update_frame_tables(frame.frame_index)
 
     def load_csv_data(self, recording_name):
         """Load analyzed data from CSV file"""
@@ -609,6 +982,19 @@ class CameraViewerApp(CameraViewerGUI):
             self.playback_manager.analyzed_data = analyzed_data
             self.log(f"Loaded {len(analyzed_data)} frames of analyzed data")
 
+            # Cached renders belong to the previous data
+            self.render_cache.clear()
+
+            # Parse landmark positions once for the trail renderer and tables
+            self.visualization_manager.get_landmark_tracks(analyzed_data)
+            self.analysis_columns = AnalysisColumns(analyzed_data)
+
+            # Precompute range heatmaps in the background
+            if self.playback_manager.is_playback_ready():
+                self.visualization_manager.build_heatmap_index(
+                    analyzed_data, *self.playback_manager.get_frame_size()
+                )
+
             # Enable playback controls
             self.start_play_button.setEnabled(True)
             self.pause_play_button.setEnabled(False)
@@ -650,10 +1036,92 @@ class CameraViewerApp(CameraViewerGUI):
         """Update frame when slider moves"""
         frame_index = self.frame_slider.low()  # Use low value for current frame
         self.playback_manager.current_frame_index = frame_index
+        if self.playback_renderer.is_running():
+            # Prefetched frames belong to the old position or range
+            self.playback_renderer.restart(
+                frame_index + 1, frame_index, self.frame_slider.high()
+            )
         self.update_frame_display()
         self.update_frame_labels()
-        # Generate heatmap when slider moves
-        self.generate_and_display_heatmap()
+
+    def scrub_to_slider(self):
+        """Follow the frame slider, rendering at full resolution once it rests
+
+        While a handle is dragged the low-resolution proxy frame is shown
+        right away and the full-resolution render waits until the handle has
+        rested for SCRUB_REST_MS or is released; other changes render on the
+        next pass of the event loop. Either way a burst of moves renders only
+        the latest position.
+        """
+        if self.frame_slider.isSliderDown() and self.show_scrub_preview():
+            self.scrub_timer.start(self.SCRUB_REST_MS)
+        else:
+            self.scrub_timer.start(0)
+
+    def finish_scrub(self):
+        """Render a pending slider position at full resolution now"""
+        if self.scrub_timer.isActive():
+            self.scrub_timer.stop()
+            self.update_frame_from_slider()
+
+    def show_scrub_preview(self):
+        """Show the slider position from the low-resolution proxy
+
+        Trails and heatmaps are drawn on the proxy frame at its scale and
+        are not cached.
+
+        Returns:
+            bool: False if nothing was shown (no proxy frame yet, or playing)
+        """
+        if not self.playback_manager.is_playback_ready():
+            return False
+        if self.playback_manager.playing and not self.playback_manager.paused:
+            return False  # The playback renderer restarts at the new position
+
+        start_time = time.perf_counter()
+        frame_index = self.frame_slider.low()
+        proxy_frame = self.playback_manager.get_proxy_frame(frame_index)
+        if proxy_frame is None:
+            return False
+        source_size = self.playback_manager.get_frame_size()
+        views = render_views(
+            self.visualization_manager,
+            proxy_frame,
+            self.playback_manager.analyzed_data,
+            frame_index,
+            self.get_playback_views(*source_size),
+            self.get_heatmap_range(),
+            source_size,
+        )
+        self.show_playback_frame(
+            PlaybackFrame(0, frame_index, source_size, views, None)
+        )
+        self.update_frame_labels()
+        self.set_debug_info(
+            "scrub",
+            f"Scrub preview: {(time.perf_counter() - start_time) * 1000.0:.1f} ms",
+        )
+        return True
+
+    def watch_video_proxy(self):
+        """Poll the proxy made for a newly loaded recording"""
+        self.thumbnail_strip_label.hide()
+        self.proxy_timer.start(250)
+
+    def update_thumbnail_strip(self):
+        """Show the thumbnail strip once the proxy is ready"""
+        proxy = self.playback_manager.video_proxy
+        if proxy is None or proxy.finished:
+            self.proxy_timer.stop()
+        if proxy is None or not proxy.ready:
+            return
+        self.proxy_timer.stop()
+        strip = proxy.get_thumbnail_strip(
+            self.frame_slider.width(), self.THUMBNAIL_STRIP_HEIGHT
+        )
+        if strip is not None:
+            self.thumbnail_strip_label.setPixmap(frame_to_pixmap(strip))
+            self.thumbnail_strip_label.show()
 
     def update_frame_labels(self):
         """Update the frame range and current frame labels"""
@@ -683,54 +1151,29 @@ class CameraViewerApp(CameraViewerGUI):
                 frame = self.playback_manager.frames[
                     self.playback_manager.current_frame_index
                 ]
-                frame_data = self.playback_manager.analyzed_data[
-                    self.playback_manager.current_frame_index
-                ]
                 original_size = (frame.shape[1], frame.shape[0])
 
                 # Update original frame
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = frame_rgb.shape
-                bytes_per_line = ch * w
-                convert_to_qt_format = QImage(
-                    frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888
-                )
-                pixmap = QPixmap.fromImage(convert_to_qt_format)
-                self.update_analyzed_frame(pixmap, original_size)
+                self.update_analyzed_frame(frame, original_size)
 
                 # Update trailed frame
                 trailed_frame = self.visualization_manager.generate_trailed_frame(
-                    frame_rgb.copy(),  # Use a copy to keep original frame intact
+                    frame,
                     self.playback_manager.analyzed_data,
                     self.playback_manager.current_frame_index,
                 )
-                trailed_rgb = cv2.cvtColor(trailed_frame, cv2.COLOR_BGR2RGB)
-                trailed_qt = QImage(
-                    trailed_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888
-                )
-                self.update_trailed_frame(QPixmap.fromImage(trailed_qt), original_size)
+                self.update_trailed_frame(trailed_frame, original_size)
 
                 # Update heatmap frame
                 heatmap_frame = self.visualization_manager.generate_heatmap_frame(
-                    frame_rgb.copy(),
+                    frame,
                     self.playback_manager.analyzed_data,
                     self.playback_manager.current_frame_index,
                 )
-                heatmap_rgb = cv2.cvtColor(heatmap_frame, cv2.COLOR_BGR2RGB)
-                heatmap_qt = QImage(
-                    heatmap_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888
-                )
-                self.update_heatmap_frame(QPixmap.fromImage(heatmap_qt), original_size)
+                self.update_heatmap_frame(heatmap_frame, original_size)
 
-                # Update landmarks
-                left_landmarks = self.parse_landmarks(frame_data, "left")
-                right_landmarks = self.parse_landmarks(frame_data, "right")
-                self.update_landmarks_table(self.left_landmarks_table, left_landmarks)
-                self.update_landmarks_table(self.right_landmarks_table, right_landmarks)
-
-                # Update stats table
-                stats = self.parse_stats(frame_data)
-                self.update_stats_table(stats)
+                # Update landmark and stats tables
+                self.update_frame_tables(self.playback_manager.current_frame_index)
             else:
                 self.log(
                     f"Invalid frame index: {self.playback_manager.current_frame_index}"
@@ -738,41 +1181,6 @@ class CameraViewerApp(CameraViewerGUI):
         else:
             self.log("No frames or analyzed data available for display")
 
-    def parse_stats(self, frame_data):
-        parsed_data = {"frame": frame_data.get("frame", 0), "left": {}, "right": {}}
-
-        for hand in ["left", "right"]:
-            for stat_key, stat_name in STATS_DICT.items():
-                value = frame_data.get(f"{hand}_{stat_key}", None)
-                if value is not None:
-                    try:
-                        if isinstance(value, (int, float)):
-                            parsed_data[hand][stat_name] = float(value)
-                        else:
-                            parsed_data[hand][stat_name] = value
-                    except ValueError:
-                        self.log(f"Error parsing stat {stat_name} for {hand} hand")
-                        parsed_data[hand][stat_name] = None
-                else:
-                    parsed_data[hand][stat_name] = None
-
-        return parsed_data
-
-    def parse_landmarks(self, frame_data, hand):
-        landmarks = []
-        frame = frame_data.get("frame", 0)
-        landmarks.append(("FRAME", float(frame)))
-        for item in LANDMARK_DICT.values():
-            x = frame_data.get(f"{hand}_{item}_x", 0.0)
-            y = frame_data.get(f"{hand}_{item}_y", 0.0)
-            z = frame_data.get(f"{hand}_{item}_z", 0.0)
-            if x and y and z:
-                try:
-                    landmarks.append((f"{item}", float(x), float(y), float(z)))
-                except ValueError:
-                    self.log(f"Error parsing landmark {item} for {hand} hand")
-        return landmarks
-
     def update_recording_selection(self):
         """Just update the selected recording name without starting analysis"""
         recording_name = self.recording_combo.currentText()
@@ -792,6 +1200,7 @@ class CameraViewerApp(CameraViewerGUI):
             self.save_part_trailing_button.setEnabled(False)
             self.save_part_heatmap_button.setEnabled(False)
             self.save_part_csv_button.setEnabled(False)
+            self.save_batch_button.setEnabled(False)
             self.generate_trailing_button.setEnabled(False)
             self.generate_heatmap_button.setEnabled(False)
 
@@ -816,6 +1225,9 @@ class CameraViewerApp(CameraViewerGUI):
 
         super().clear_analysis_data()
         self.update_analyzed_frame(None)
+        # A pending table refresh would show the old frame again
+        self.table_timer.stop()
+        self.table_frame_index = None
         self.update_landmarks_table(self.left_landmarks_table, [])
         self.update_landmarks_table(self.right_landmarks_table, [])
         self.update_stats_table(None)
@@ -836,228 +1248,214 @@ class CameraViewerApp(CameraViewerGUI):
             # Generate new timestamp
             return datetime.now().strftime("%d-%H%M%S")
 
-    def save_part_of_movie(self):
-        """Save a portion of the movie based on slider range"""
-        try:
-            # Generate filename
-            timestamp = self.get_timestamp_string()
-            frame_range = self.get_frame_range_string()
-            filename = f"partial_{timestamp}_frames_{frame_range}.mp4"
-            output_path = os.path.join("src/data/partial_movie", filename)
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-            # Get resolution settings
-            use_original = self.settings_handler.get_setting(
-                "SaveResolution", "use_original", True
-            )
-            if use_original:
-                save_width = int(
-                    self.playback_manager.cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-                )
-                save_height = int(
-                    self.playback_manager.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-                )
-            else:
-                save_width = self.settings_handler.get_setting(
-                    "SaveResolution", "width", 1920
-                )
-                save_height = self.settings_handler.get_setting(
-                    "SaveResolution", "height", 1080
-                )
-
-            # Set up video writer with proper resolution
-            fps = self.playback_manager.cap.get(cv2.CAP_PROP_FPS)
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            out = cv2.VideoWriter(output_path, fourcc, fps, (save_width, save_height))
-
-            # Get frame range
-            start_frame = self.frame_slider.low()
-            end_frame = self.frame_slider.high()
-            total_frames = end_frame - start_frame + 1
+    def get_export_size(self):
+        """Get the (width, height) partial exports are saved at"""
+        use_original = self.settings_handler.get_setting(
+            "SaveResolution", "use_original", True
+        )
+        if use_original:
+            return self.playback_manager.get_frame_size()
+        return (
+            self.settings_handler.get_setting("SaveResolution", "width", 1920),
+            self.settings_handler.get_setting("SaveResolution", "height", 1080),
+        )
 
-            self.show_progress_bar(True)
-            try:
-                # Process frames
-                for i in range(start_frame, end_frame + 1):
-                    frame = self.playback_manager.get_frame(i)
-                    if frame is None:
-                        continue
+    def start_export(
+        self,
+        output_paths,
+        video_path,
+        start_frame,
+        end_frame,
+        analyzed_data=None,
+        output_size=None,
+        description="video",
+        workers=1,
+    ):
+        """Start a background export and follow its progress
+
+        Args:
+            output_paths (dict): Output path by kind, see
+                ExportManager.start_batch_export
+            workers (int): Render processes, 1 renders on a thread
+
+        Returns:
+            bool: True if the export started
+        """
+        if self.export_manager.is_exporting():
+            self.log("An export is already running, wait for it to finish")
+            return False
 
-                    # Resize if needed
-                    if frame.shape[:2] != (save_height, save_width):
-                        frame = cv2.resize(frame, (save_width, save_height))
+        self.export_manager.start_batch_export(
+            output_paths,
+            video_path,
+            start_frame,
+            end_frame,
+            self.settings_handler,
+            analyzed_data,
+            output_size,
+            workers,
+        )
+        self.export_description = description
+        self.set_progress(0)
+        self.show_progress_bar(True)
+        self.cancel_export_button.setEnabled(True)
+        self.export_timer.start(100)
+        return True
 
-                    out.write(frame)
-                    progress = int(((i - start_frame + 1) / total_frames) * 100)
-                    self.set_progress(progress)
+    def cancel_export(self):
+        """Stop the running export; its worker processes are shut down"""
+        if self.export_manager.is_exporting():
+            self.export_manager.cancel_export()
+            self.cancel_export_button.setEnabled(False)
+            self.log(f"Cancelling {self.export_description} export...")
+
+    def update_export_progress(self):
+        """Poll the running export and report when it finishes"""
+        export = self.export_manager.current_export
+        if export is None:
+            self.export_timer.stop()
+            self.cancel_export_button.setEnabled(False)
+            return
 
-                self.log(f"Saved partial movie to: {output_path}")
+        self.set_progress(export.get_progress())
+        if export.is_running():
+            return
 
-            finally:
-                out.release()
-                self.show_progress_bar(False)
-                self.set_progress(0)
+        self.export_timer.stop()
+        self.cancel_export_button.setEnabled(False)
+        self.show_progress_bar(False)
+        self.set_progress(0)
+        if export.error is None and export.cancelled:
+            self.log(
+                f"Cancelled {self.export_description} after "
+                f"{export.written_frames} of {export.total_frames} frames"
+            )
+            return
+        if export.error is not None:
+            self.log(f"Error saving {self.export_description}: {str(export.error)}")
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"Failed to save {self.export_description}: {str(export.error)}",
+            )
+            return
+        paths = ", ".join(output.path for output in export.outputs)
+        self.log(
+            f"Saved {self.export_description} to: {paths} "
+            f"({export.written_frames} frames in {export.elapsed:.1f} s, "
+            f"{export.get_fps():.1f} fps)"
+        )
 
-        except Exception as e:
-            self.log(f"Error saving partial movie: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Failed to save movie: {str(e)}")
-            self.show_progress_bar(False)
-            self.set_progress(0)
+    def save_part_of_movie(self):
+        """Save a portion of the movie based on slider range"""
+        self.save_part("raw", "partial_movie", "partial", "partial movie")
 
     def save_part_of_trailing(self):
         """Save a portion of the trailed video based on slider range"""
-        try:
-            # Generate filename
-            timestamp = self.get_timestamp_string()
-            frame_range = self.get_frame_range_string()
-            filename = f"partial_trailing_{timestamp}_frames_{frame_range}.mp4"
-            output_path = os.path.join("src/data/partial_trailing", filename)
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-            # Get resolution settings
-            use_original = self.settings_handler.get_setting(
-                "SaveResolution", "use_original", True
-            )
-            if use_original:
-                save_width = int(
-                    self.playback_manager.cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-                )
-                save_height = int(
-                    self.playback_manager.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-                )
-            else:
-                save_width = self.settings_handler.get_setting(
-                    "SaveResolution", "width", 1920
-                )
-                save_height = self.settings_handler.get_setting(
-                    "SaveResolution", "height", 1080
-                )
-
-            # Set up video writer
-            fps = self.playback_manager.cap.get(cv2.CAP_PROP_FPS)
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            out = cv2.VideoWriter(output_path, fourcc, fps, (save_width, save_height))
-
-            # Get frame range
-            start_frame = self.frame_slider.low()
-            end_frame = self.frame_slider.high()
-            total_frames = end_frame - start_frame + 1
+        self.save_part(
+            "trailed", "partial_trailing", "partial_trailing", "partial trailing video"
+        )
 
-            self.show_progress_bar(True)
-            try:
-                # Process frames
-                for i in range(start_frame, end_frame + 1):
-                    frame = self.playback_manager.get_frame(i)
-                    if frame is None:
-                        continue
-
-                    # Generate trailed frame
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    trailed_frame = self.visualization_manager.generate_trailed_frame(
-                        frame_rgb.copy(), self.playback_manager.analyzed_data, i
-                    )
-                    trailed_frame = cv2.cvtColor(trailed_frame, cv2.COLOR_RGB2BGR)
+    def save_part_of_heatmap(self):
+        """Save a portion of the heatmap video based on slider range"""
+        self.save_part(
+            "heatmap", "partial_heatmap", "partial_heatmap", "partial heatmap video"
+        )
 
-                    # Resize if needed
-                    if trailed_frame.shape[:2] != (save_height, save_width):
-                        trailed_frame = cv2.resize(
-                            trailed_frame, (save_width, save_height)
-                        )
+    def save_selected_parts(self):
+        """Save every checked output of the slider range from one decode pass"""
+        try:
+            if not self.playback_manager.is_playback_ready():
+                self.log("No recording loaded")
+                return
 
-                    out.write(trailed_frame)
-                    progress = int(((i - start_frame + 1) / total_frames) * 100)
-                    self.set_progress(progress)
+            selected = {
+                "raw": self.batch_movie_checkbox.isChecked(),
+                "trailed": self.batch_trailing_checkbox.isChecked(),
+                "heatmap": self.batch_heatmap_checkbox.isChecked(),
+                "mosaic": self.batch_mosaic_checkbox.isChecked(),
+                "csv": self.batch_csv_checkbox.isChecked(),
+            }
+            if not self.playback_manager.is_analysis_ready():
+                for kind in ["trailed", "heatmap", "mosaic"]:
+                    if selected[kind]:
+                        self.log(f"Skipping {kind} output, recording not analyzed")
+                        selected[kind] = False
 
-                self.log(f"Saved partial trailing video to: {output_path}")
+            timestamp = self.get_timestamp_string()
+            frame_range = self.get_frame_range_string()
+            outputs = {
+                "raw": ("partial_movie", "partial", "mp4"),
+                "trailed": ("partial_trailing", "partial_trailing", "mp4"),
+                "heatmap": ("partial_heatmap", "partial_heatmap", "mp4"),
+                "mosaic": ("partial_mosaic", "partial_mosaic", "mp4"),
+                "csv": ("partial_csv", "partial_csv", "csv"),
+            }
+            output_paths = {}
+            for kind, (folder, prefix, extension) in outputs.items():
+                if not selected[kind]:
+                    continue
+                filename = f"{prefix}_{timestamp}_frames_{frame_range}.{extension}"
+                output_paths[kind] = os.path.join("src/data", folder, filename)
+                os.makedirs(os.path.dirname(output_paths[kind]), exist_ok=True)
+
+            if not output_paths:
+                self.log("No outputs selected")
+                return
 
-            finally:
-                out.release()
-                self.show_progress_bar(False)
-                self.set_progress(0)
+            self.start_export(
+                output_paths,
+                self.playback_manager.current_recording_path,
+                self.frame_slider.low(),
+                self.frame_slider.high(),
+                self.playback_manager.analyzed_data,
+                self.get_export_size(),
+                "selected parts",
+            )
 
         except Exception as e:
-            self.log(f"Error saving trailing video: {str(e)}")
+            self.log(f"Error saving selected parts: {str(e)}")
             QMessageBox.critical(
-                self, "Error", f"Failed to save trailing video: {str(e)}"
+                self, "Error", f"Failed to save selected parts: {str(e)}"
             )
             self.show_progress_bar(False)
             self.set_progress(0)
 
-    def save_part_of_heatmap(self):
-        """Save a portion of the heatmap video based on slider range"""
+    def save_part(self, kind, folder, prefix, description):
+        """Export the slider range of the loaded recording
+
+        Args:
+            kind (str): "raw", "trailed" or "heatmap"
+            folder (str): Output folder inside src/data
+            prefix (str): Output filename prefix
+            description (str): Name used in log and error messages
+        """
         try:
+            if not self.playback_manager.is_playback_ready():
+                self.log("No recording loaded")
+                return
+
             # Generate filename
             timestamp = self.get_timestamp_string()
             frame_range = self.get_frame_range_string()
-            filename = f"partial_heatmap_{timestamp}_frames_{frame_range}.mp4"
-            output_path = os.path.join("src/data/partial_heatmap", filename)
+            filename = f"{prefix}_{timestamp}_frames_{frame_range}.mp4"
+            output_path = os.path.join("src/data", folder, filename)
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-            # Get resolution settings
-            use_original = self.settings_handler.get_setting(
-                "SaveResolution", "use_original", True
+            self.start_export(
+                {kind: output_path},
+                self.playback_manager.current_recording_path,
+                self.frame_slider.low(),
+                self.frame_slider.high(),
+                self.playback_manager.analyzed_data,
+                self.get_export_size(),
+                description,
             )
-            if use_original:
-                save_width = int(
-                    self.playback_manager.cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-                )
-                save_height = int(
-                    self.playback_manager.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-                )
-            else:
-                save_width = self.settings_handler.get_setting(
-                    "SaveResolution", "width", 1920
-                )
-                save_height = self.settings_handler.get_setting(
-                    "SaveResolution", "height", 1080
-                )
-
-            # Set up video writer
-            fps = self.playback_manager.cap.get(cv2.CAP_PROP_FPS)
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            out = cv2.VideoWriter(output_path, fourcc, fps, (save_width, save_height))
-
-            # Get frame range
-            start_frame = self.frame_slider.low()
-            end_frame = self.frame_slider.high()
-            total_frames = end_frame - start_frame + 1
-
-            self.show_progress_bar(True)
-            try:
-                # Process frames
-                for i in range(start_frame, end_frame + 1):
-                    # Get frame directly using OpenCV like in full heatmap
-                    self.playback_manager.cap.set(cv2.CAP_PROP_POS_FRAMES, i)
-                    ret, frame = self.playback_manager.cap.read()
-                    if not ret:
-                        continue
-
-                    # Generate heatmap frame (keeping BGR color space)
-                    heatmap_frame = self.visualization_manager.generate_heatmap_frame(
-                        frame, self.playback_manager.analyzed_data, i
-                    )
-
-                    # Resize if needed
-                    if heatmap_frame.shape[:2] != (save_height, save_width):
-                        heatmap_frame = cv2.resize(
-                            heatmap_frame, (save_width, save_height)
-                        )
-
-                    out.write(heatmap_frame)
-                    progress = int(((i - start_frame + 1) / total_frames) * 100)
-                    self.set_progress(progress)
-
-                self.log(f"Saved partial heatmap video to: {output_path}")
-
-            finally:
-                out.release()
-                self.show_progress_bar(False)
-                self.set_progress(0)
 
         except Exception as e:
-            self.log(f"Error saving heatmap video: {str(e)}")
+            self.log(f"Error saving {description}: {str(e)}")
             QMessageBox.critical(
-                self, "Error", f"Failed to save heatmap video: {str(e)}"
+                self, "Error", f"Failed to save {description}: {str(e)}"
             )
             self.show_progress_bar(False)
             self.set_progress(0)
@@ -1164,93 +1562,21 @@ class CameraViewerApp(CameraViewerGUI):
 
     def generate_full_trailing(self):
         """Generate full trailing video"""
-        recording_name = self.recording_combo.currentText()
-        if not recording_name:
-            self.log("No recording selected")
-            return
-
-        # Check if CSV exists
-        timestamp = recording_name[10:-4]
-        csv_filename = f"csv_{timestamp}.csv"
-        csv_path = os.path.join("src/data/csv_data", csv_filename)
-
-        if not os.path.exists(csv_path):
-            QMessageBox.warning(
-                self,
-                "Warning",
-                "CSV data not found. Please analyze the recording first.",
-            )
-            return
-
-        # Create output directory
-        output_dir = "src/data/trailed_movie"
-        os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.join(output_dir, f"trailed_{timestamp}.mp4")
-
-        if os.path.exists(output_path):
-            reply = QMessageBox.question(
-                self,
-                "File exists",
-                "A file with this name already exists. Do you want to replace it?",
-                QMessageBox.Yes | QMessageBox.No,
-            )
-            if reply == QMessageBox.No:
-                return
-
-        try:
-            self.show_progress_bar(True)
-            self.set_progress(0)
-
-            # Load the recording
-            recording_path = os.path.join("src/data/raw_movie", recording_name)
-            cap = cv2.VideoCapture(recording_path)
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-
-            # Load CSV data
-            analyzed_data = []
-            with open(csv_path, mode="r") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    analyzed_data.append(row)
-
-            # Create video writer
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
-
-            # Process all frames
-            for frame_idx in range(total_frames):
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                # Generate trailed frame
-                trailed_frame = self.visualization_manager.generate_trailed_frame(
-                    frame, analyzed_data, frame_idx
-                )
-                out.write(trailed_frame)
-
-                # Update progress
-                progress = int(((frame_idx + 1) / total_frames) * 100)
-                self.set_progress(progress)
-
-            cap.release()
-            out.release()
-            self.log(f"Generated full trailing video: {output_path}")
-
-        except Exception as e:
-            QMessageBox.critical(
-                self, "Error", f"Failed to generate trailing video: {str(e)}"
-            )
-        finally:
-            self.show_progress_bar(False)
-            self.set_progress(0)
+        self.generate_full("trailed", "trailed_movie", "trailed", "trailing video")
 
     def generate_full_heatmap(self):
         """Generate full heatmap video"""
+        self.generate_full("heatmap", "heatmap_movie", "heatmap", "heatmap video")
+
+    def generate_full(self, kind, folder, prefix, description):
+        """Export a whole recording with its analyzed data
+
+        Args:
+            kind (str): "trailed" or "heatmap"
+            folder (str): Output folder inside src/data
+            prefix (str): Output filename prefix
+            description (str): Name used in log and error messages
+        """
         recording_name = self.recording_combo.currentText()
         if not recording_name:
             self.log("No recording selected")
@@ -1270,9 +1596,9 @@ class CameraViewerApp(CameraViewerGUI):
             return
 
         # Create output directory
-        output_dir = "src/data/heatmap_movie"
+        output_dir = os.path.join("src/data", folder)
         os.makedirs(output_dir, exist_ok=True)
-        output_path = os.path.join(output_dir, f"heatmap_{timestamp}.mp4")
+        output_path = os.path.join(output_dir, f"{prefix}_{timestamp}.mp4")
 
         if os.path.exists(output_path):
             reply = QMessageBox.question(
@@ -1285,16 +1611,11 @@ class CameraViewerApp(CameraViewerGUI):
                 return
 
         try:
-            self.show_progress_bar(True)
-            self.set_progress(0)
-
             # Load the recording
             recording_path = os.path.join("src/data/raw_movie", recording_name)
             cap = cv2.VideoCapture(recording_path)
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
             total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            cap.release()
 
             # Load CSV data
             analyzed_data = []
@@ -1303,88 +1624,120 @@ class CameraViewerApp(CameraViewerGUI):
                 for row in reader:
                     analyzed_data.append(row)
 
-            # Create video writer
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
-
-            # Process all frames
-            for frame_idx in range(total_frames):
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                # Generate heatmap frame
-                heatmap_frame = self.visualization_manager.generate_heatmap_frame(
-                    frame, analyzed_data, frame_idx
-                )
-                out.write(heatmap_frame)
-
-                # Update progress
-                progress = int(((frame_idx + 1) / total_frames) * 100)
-                self.set_progress(progress)
-
-            cap.release()
-            out.release()
-            self.log(f"Generated full heatmap video: {output_path}")
+            self.start_export(
+                {kind: output_path},
+                recording_path,
+                0,
+                total_frames - 1,
+                analyzed_data,
+                description=f"full {description}",
+                workers=self.settings_handler.get_setting(
+                    "Performance", "export_workers"
+                ),
+            )
 
         except Exception as e:
             QMessageBox.critical(
-                self, "Error", f"Failed to generate heatmap video: {str(e)}"
+                self, "Error", f"Failed to generate {description}: {str(e)}"
             )
-        finally:
             self.show_progress_bar(False)
             self.set_progress(0)
 
-    def generate_and_display_heatmap(self):
-        """Generate and display the heatmap for the current frame"""
-        if not self.playback_manager.is_playback_ready():
-            return
+    def get_cached_view(self, view, frame_index, size, render, extra=None):
+        """Get a rendered view of a frame from the cache or render it
+
+        Args:
+            view (str): View name, part of the cache key
+            frame_index (int): Frame being shown
+            size (tuple): Output (width, height)
+            render: Callable producing the frame on a cache miss
+            extra: Anything else the rendering depends on (e.g. a frame range)
+
+        Returns:
+            np.ndarray: The rendered frame
+        """
+        render_cache_mb = self.settings_handler.get_setting(
+            "Performance", "render_cache_mb"
+        )
+        if render_cache_mb != self.render_cache_mb:
+            self.render_cache_mb = render_cache_mb
+            self.render_cache.set_max_bytes(render_cache_mb << 20)
+
+        # Views rendered with other trail/heatmap settings just age out
+        render_settings = json.dumps(
+            [
+                self.settings_handler.settings.get("Trailing"),
+                self.settings_handler.settings.get("Heatmap"),
+            ],
+            sort_keys=True,
+        )
+        key = (
+            self.playback_manager.current_recording_path,
+            frame_index,
+            view,
+            hash(render_settings),
+            tuple(size),
+            extra,
+        )
+        frame = self.render_cache.get(key)
+        if frame is None:
+            frame = render()
+            self.render_cache.put(key, frame)
+        self.update_render_cache_debug()
+        return frame
+
+    def get_cached_heatmap_view(self, frame, frame_index, size):
+        """Get the displayed heatmap (BGR) for a frame"""
+        return self.get_cached_view(
+            "heatmap",
+            frame_index,
+            size,
+            lambda: self.generate_view_heatmap(frame, frame_index, size),
+            self.get_heatmap_range(),
+        )
 
-        frame = self.playback_manager.get_frame(
-            self.playback_manager.current_frame_index
+    def update_render_cache_debug(self):
+        """Show render cache hit rate and memory use in the debug panel"""
+        stats = self.render_cache.get_stats()
+        self.set_debug_info(
+            "render_cache",
+            f"Render cache: {stats['hit_rate'] * 100:.0f}% hits "
+            f"({stats['hits']}/{stats['hits'] + stats['misses']}), "
+            f"{stats['entries']} frames, "
+            f"{stats['used_bytes'] / (1 << 20):.0f}/{stats['max_bytes'] / (1 << 20):.0f} MB",
         )
-        if frame is not None:
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame_rgb.shape
-            bytes_per_line = ch * w
-
-            # Calculate target sizes for mixed view based on aspect ratio
-            aspect_ratio = w / h
-            if aspect_ratio > 16 / 9:  # Wider than 16:9
-                mixed_large_w = 1280
-                mixed_large_h = int(1280 / aspect_ratio)
-            else:  # Taller than or equal to 16:9
-                mixed_large_h = 720
-                mixed_large_w = int(720 * aspect_ratio)
-
-            # Use the same logic as realtime display
-            trail_length = self.settings_handler.settings["Trailing"]["trail_length"]
-            start_frame = max(
-                0, self.playback_manager.current_frame_index - trail_length
-            )
 
-            # Generate heatmap for the current frame range
-            heatmap_frame = self.visualization_manager.generate_heatmap_frame(
-                frame_rgb.copy(),
-                self.playback_manager.analyzed_data,
-                self.playback_manager.current_frame_index,
-                start_frame=start_frame,
-                end_frame=self.playback_manager.current_frame_index,
-            )
+    def update_frame_cache_debug(self):
+        """Show decoded frame cache hits and memory use in the debug panel"""
+        stats = self.playback_manager.get_cache_stats()
+        hits = stats["cache_hits"] + stats["read_ahead_hits"]
+        lookups = hits + stats["misses"]
+        hit_rate = hits / lookups if lookups else 0.0
+        self.set_debug_info(
+            "frame_cache",
+            f"Frame cache: {hit_rate * 100:.0f}% hits "
+            f"({stats['cache_hits']} cached, {stats['read_ahead_hits']} read ahead, "
+            f"{stats['misses']} decoded), {stats['cache_entries']} frames, "
+            f"{stats['cache_bytes'] / (1 << 20):.0f}"
+            f"/{stats['cache_max_bytes'] / (1 << 20):.0f} MB",
+        )
 
-            # Convert and display heatmap
-            heatmap_rgb = cv2.cvtColor(heatmap_frame, cv2.COLOR_BGR2RGB)
-            heatmap_qt = QImage(
-                heatmap_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888
-            )
-            self.heatmap_label.setPixmap(QPixmap.fromImage(heatmap_qt))
+    def generate_view_heatmap(self, frame, frame_index, size=None):
+        """Generate the heatmap shown in the heatmap and mixed views at size"""
+        return self.visualization_manager.generate_view_heatmap_frame(
+            frame,
+            self.playback_manager.analyzed_data,
+            frame_index,
+            self.get_heatmap_range(),
+            output_size=size,
+        )
 
-            # Update mixed view heatmap
-            heatmap_pixmap = QPixmap.fromImage(heatmap_qt)
-            self.update_mixed_frame(
-                self.mixed_heatmap_label, heatmap_pixmap, (mixed_large_w, mixed_large_h)
-            )
+    def get_heatmap_range(self):
+        """Get the frame range of a range heatmap, None for the trail window"""
+        if self.settings_handler.get_setting("Heatmap", "range_mode"):
+            # Everything inside the selected slider range
+            return self.frame_slider.low(), self.frame_slider.high()
+        return None
 
     def on_camera_connected(self):
         """Handle camera connection"""
@@ -1470,6 +1823,7 @@ class CameraViewerApp(CameraViewerGUI):
 
             # Store the current recording path
             self.playback_manager.current_recording_path = recording_path
+            self.watch_video_proxy()
 
             # Clear any existing analysis data
             self.playback_manager.analyzed_data = []
@@ -1501,6 +1855,7 @@ class CameraViewerApp(CameraViewerGUI):
             self.stop_play_button.setEnabled(False)
             self.save_part_button.setEnabled(True)
             self.save_part_csv_button.setEnabled(True)  # Enable CSV save in raw mode
+            self.save_batch_button.setEnabled(True)
 
             # Disable analysis-dependent buttons
             self.save_part_trailing_button.setEnabled(False)
@@ -1540,32 +1895,13 @@ class CameraViewerApp(CameraViewerGUI):
         )
 
         if frame is not None:
-            # Update frame display
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame_rgb.shape
-            bytes_per_line = ch * w
-            original_size = (w, h)
-
             # Show original frame
-            convert_to_qt_format = QImage(
-                frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888
-            )
-            pixmap = QPixmap.fromImage(convert_to_qt_format)
-            self.update_analyzed_frame(pixmap, original_size)
+            h, w = frame.shape[:2]
+            self.update_analyzed_frame(frame, (w, h))
 
             # Update frame labels
             self.update_frame_labels()
 
-    def on_refresh_clicked(self):
-        """Handle refresh button click based on current tab"""
-        current_tab = self.tab_widget.currentWidget()
-        if current_tab == self.camera_tab:
-            self.populate_camera_list()  # Refresh cameras
-            self.log("Refreshed camera list")
-        else:
-            self.refresh_recordings()  # Refresh recordings
-            self.log("Refreshed recording list")
-
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -20,16 +20,25 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 from src.managers.settings_handler import SettingsHandler
+from src.gui.mosaic_view import MosaicView
 from src.gui.table_view import TableView
+from src.core.hand_landmarks import LANDMARK_DICT, STATS_DICT
 import os
 import time
 import cv2
 import csv
 from src.utils.slider import RangeSlider
-from PyQt5.QtGui import QPixmap, QPainter
+from src.utils.display_utils import fit_size, frame_to_pixmap
+from src.utils.mosaic_compositor import MosaicCompositor
+from PyQt5.QtGui import QPainter
 
 
 class CameraViewerGUI(QMainWindow):
+    # Playback speeds offered next to the playback buttons
+    PLAYBACK_RATES = [0.25, 0.5, 1, 2, 4, 8]
+    # Height of the thumbnail strip above the frame slider
+    THUMBNAIL_STRIP_HEIGHT = 40
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Camera Viewer App")
@@ -93,6 +102,9 @@ class CameraViewerGUI(QMainWindow):
         self.camera_combo = QComboBox()
         control_layout.addWidget(self.camera_combo)
 
+        self.refresh_cameras_button = QPushButton("Refresh Cameras")
+        control_layout.addWidget(self.refresh_cameras_button)
+
         self.connect_button = QPushButton("Connect")
         control_layout.addWidget(self.connect_button)
 
@@ -235,67 +247,35 @@ class CameraViewerGUI(QMainWindow):
         heatmap_layout.addWidget(self.heatmap_realtime_checkbox)
         self.visualization_tabs.addTab(heatmap_tab, "Heatmap")
 
-        # Mixed tab
+        # Mixed tab: original and trailed above the heatmap, composited into
+        # one image so the tab costs a single paint per frame
         mixed_tab = QWidget()
-        mixed_layout = QGridLayout(mixed_tab)
-
-        # Original view
-        mixed_original_group = QGroupBox("Original")
-        mixed_original_layout = QVBoxLayout(mixed_original_group)
-        self.mixed_original_label = QLabel()
-        self.mixed_original_label.setAlignment(Qt.AlignCenter)
-        self.mixed_original_label.setSizePolicy(
-            QSizePolicy.Expanding, QSizePolicy.Expanding
-        )
-        self.mixed_original_label.setMinimumSize(
-            320, 180
-        )  # 16:9 ratio, smaller minimum
-        self.mixed_original_label.setMaximumSize(640, 360)  # Maximum size for high res
-        self.mixed_original_realtime_checkbox = QCheckBox("Real-time Update")
+        mixed_layout = QVBoxLayout(mixed_tab)
+        self.mixed_compositor = MosaicCompositor(
+            [["original", "trailed"], ["heatmap"]], spacing=4, reuse_canvas=True
+        )
+        self.mixed_frames = {}  # Latest image of each view in the mosaic
+        self.mixed_view = MosaicView()
+        self.mixed_view.setMinimumSize(640, 540)
+        mixed_layout.addWidget(self.mixed_view, 1)
+
+        mixed_checkbox_layout = QHBoxLayout()
+        self.mixed_original_realtime_checkbox = QCheckBox("Original Real-time Update")
         self.mixed_original_realtime_checkbox.setChecked(
             self.settings_handler.get_setting("ViewSettings", "original_realtime")
         )
-        mixed_original_layout.addWidget(self.mixed_original_label)
-        mixed_original_layout.addWidget(self.mixed_original_realtime_checkbox)
-        mixed_layout.addWidget(mixed_original_group, 0, 0)
-
-        # Trailed view
-        mixed_trailed_group = QGroupBox("Trailed")
-        mixed_trailed_layout = QVBoxLayout(mixed_trailed_group)
-        self.mixed_trailed_label = QLabel()
-        self.mixed_trailed_label.setAlignment(Qt.AlignCenter)
-        self.mixed_trailed_label.setSizePolicy(
-            QSizePolicy.Expanding, QSizePolicy.Expanding
-        )
-        self.mixed_trailed_label.setMinimumSize(320, 180)  # 16:9 ratio, smaller minimum
-        self.mixed_trailed_label.setMaximumSize(640, 360)  # Maximum size for high res
-        self.mixed_trailed_realtime_checkbox = QCheckBox("Real-time Update")
+        mixed_checkbox_layout.addWidget(self.mixed_original_realtime_checkbox)
+        self.mixed_trailed_realtime_checkbox = QCheckBox("Trailed Real-time Update")
         self.mixed_trailed_realtime_checkbox.setChecked(
             self.settings_handler.get_setting("ViewSettings", "trailed_realtime")
         )
-        mixed_trailed_layout.addWidget(self.mixed_trailed_label)
-        mixed_trailed_layout.addWidget(self.mixed_trailed_realtime_checkbox)
-        mixed_layout.addWidget(mixed_trailed_group, 0, 1)
-
-        # Heatmap view
-        mixed_heatmap_group = QGroupBox("Heatmap")
-        mixed_heatmap_layout = QVBoxLayout(mixed_heatmap_group)
-        self.mixed_heatmap_label = QLabel()
-        self.mixed_heatmap_label.setAlignment(Qt.AlignCenter)
-        self.mixed_heatmap_label.setSizePolicy(
-            QSizePolicy.Expanding, QSizePolicy.Expanding
-        )
-        self.mixed_heatmap_label.setMinimumSize(
-            640, 360
-        )  # 16:9 ratio, larger since it spans two columns
-        self.mixed_heatmap_label.setMaximumSize(1280, 720)  # Maximum size for high res
-        self.mixed_heatmap_realtime_checkbox = QCheckBox("Real-time Update")
+        mixed_checkbox_layout.addWidget(self.mixed_trailed_realtime_checkbox)
+        self.mixed_heatmap_realtime_checkbox = QCheckBox("Heatmap Real-time Update")
         self.mixed_heatmap_realtime_checkbox.setChecked(
             self.settings_handler.get_setting("ViewSettings", "heatmap_realtime")
         )
-        mixed_heatmap_layout.addWidget(self.mixed_heatmap_label)
-        mixed_heatmap_layout.addWidget(self.mixed_heatmap_realtime_checkbox)
-        mixed_layout.addWidget(mixed_heatmap_group, 1, 0, 1, 2)
+        mixed_checkbox_layout.addWidget(self.mixed_heatmap_realtime_checkbox)
+        mixed_layout.addLayout(mixed_checkbox_layout)
 
         self.visualization_tabs.addTab(mixed_tab, "Mixed")
 
@@ -306,6 +286,18 @@ class CameraViewerGUI(QMainWindow):
         playback_layout.addWidget(self.start_play_button)
         playback_layout.addWidget(self.pause_play_button)
         playback_layout.addWidget(self.stop_play_button)
+        playback_layout.addWidget(QLabel("Speed:"))
+        self.playback_rate_combo = QComboBox()
+        self.playback_rate_combo.addItems(
+            [f"{rate:g}x" for rate in self.PLAYBACK_RATES]
+        )
+        self.playback_rate_combo.setCurrentText(
+            f"{self.settings_handler.get_setting('ViewSettings', 'playback_rate'):g}x"
+        )
+        self.playback_rate_combo.currentTextChanged.connect(
+            self.on_playback_rate_changed
+        )
+        playback_layout.addWidget(self.playback_rate_combo)
         recorded_layout.addLayout(playback_layout)
 
         # Frame slider and frame number
@@ -320,11 +312,23 @@ class CameraViewerGUI(QMainWindow):
         self.max_frame_spin.valueChanged.connect(self.on_max_frame_changed)
         slider_layout.addWidget(self.max_frame_spin)
 
+        # Thumbnails of the recording above the slider, once they are made
+        slider_column = QVBoxLayout()
+        slider_column.setSpacing(0)
+        self.thumbnail_strip_label = QLabel()
+        self.thumbnail_strip_label.setFixedHeight(self.THUMBNAIL_STRIP_HEIGHT)
+        self.thumbnail_strip_label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Fixed)
+        self.thumbnail_strip_label.setScaledContents(True)
+        self.thumbnail_strip_label.hide()
+        slider_column.addWidget(self.thumbnail_strip_label)
+
         self.frame_slider = RangeSlider(Qt.Horizontal)
         self.frame_slider.setMinimum(0)
         self.frame_slider.setMaximum(0)
         self.frame_slider.sliderMoved.connect(self.on_slider_moved)
-        slider_layout.addWidget(self.frame_slider, 9)
+        self.frame_slider.sliderReleased.connect(self.on_slider_released)
+        slider_column.addWidget(self.frame_slider)
+        slider_layout.addLayout(slider_column, 9)
         self.frame_number_label = QLabel("Frames: 0-0")
         slider_layout.addWidget(self.frame_number_label, 1)
         recorded_layout.addLayout(slider_layout)
@@ -523,13 +527,25 @@ class CameraViewerGUI(QMainWindow):
 
         # Analysis controls
         analysis_group = QGroupBox("Analysis Control")
+        analysis_group_layout = QVBoxLayout()
         analysis_controls = QHBoxLayout()
         self.start_analyze_button = QPushButton("Start Recording")
         self.stop_analyze_button = QPushButton("Stop Recording")
         self.stop_analyze_button.setEnabled(False)
         analysis_controls.addWidget(self.start_analyze_button)
         analysis_controls.addWidget(self.stop_analyze_button)
-        analysis_group.setLayout(analysis_controls)
+        analysis_group_layout.addLayout(analysis_controls)
+
+        # Analyze frames while recording so the CSV is ready when it stops
+        self.analyze_while_recording_checkbox = QCheckBox("Analyze While Recording")
+        self.analyze_while_recording_checkbox.setChecked(
+            self.settings_handler.get_setting("Recording", "analyze_while_recording")
+        )
+        self.analyze_while_recording_checkbox.stateChanged.connect(
+            self.on_analyze_while_recording_changed
+        )
+        analysis_group_layout.addWidget(self.analyze_while_recording_checkbox)
+        analysis_group.setLayout(analysis_group_layout)
         settings_layout.addWidget(analysis_group)
 
         # Display controls
@@ -626,6 +642,16 @@ class CameraViewerGUI(QMainWindow):
         self.alpha_fade_checkbox.stateChanged.connect(self.on_alpha_fade_changed)
         trailing_layout.addWidget(self.alpha_fade_checkbox, 5, 0, 1, 2)
 
+        # Persistent canvas checkbox
+        self.persistent_canvas_checkbox = QCheckBox("Persistent Trail Canvas (faster)")
+        self.persistent_canvas_checkbox.setChecked(
+            self.settings_handler.get_setting("Trailing", "persistent_canvas")
+        )
+        self.persistent_canvas_checkbox.stateChanged.connect(
+            self.on_persistent_canvas_changed
+        )
+        trailing_layout.addWidget(self.persistent_canvas_checkbox, 6, 0, 1, 2)
+
         trailing_group.setLayout(trailing_layout)
         display_layout.addWidget(trailing_group)
 
@@ -705,6 +731,28 @@ class CameraViewerGUI(QMainWindow):
         )
         heatmap_layout.addWidget(self.heatmap_accumulate_checkbox, 5, 0, 1, 2)
 
+        # Selected range checkbox
+        self.heatmap_range_mode_checkbox = QCheckBox("Heatmap of Selected Range")
+        self.heatmap_range_mode_checkbox.setChecked(
+            self.settings_handler.get_setting("Heatmap", "range_mode")
+        )
+        self.heatmap_range_mode_checkbox.stateChanged.connect(
+            self.on_heatmap_range_mode_changed
+        )
+        heatmap_layout.addWidget(self.heatmap_range_mode_checkbox, 6, 0, 1, 2)
+
+        # Density downscale of the live view (1 = full resolution)
+        heatmap_layout.addWidget(QLabel("Density Downscale:"), 7, 0)
+        self.heatmap_downscale_input = QSpinBox()
+        self.heatmap_downscale_input.setRange(1, 8)
+        self.heatmap_downscale_input.setValue(
+            self.settings_handler.get_setting("Heatmap", "density_downscale")
+        )
+        self.heatmap_downscale_input.valueChanged.connect(
+            self.on_heatmap_downscale_changed
+        )
+        heatmap_layout.addWidget(self.heatmap_downscale_input, 7, 1)
+
         heatmap_group.setLayout(heatmap_layout)
         display_layout.addWidget(heatmap_group)
 
@@ -718,6 +766,18 @@ class CameraViewerGUI(QMainWindow):
         self.generate_heatmap_button = QPushButton("Generate Full Heatmap")
         generate_layout.addWidget(self.generate_trailing_button)
         generate_layout.addWidget(self.generate_heatmap_button)
+
+        # Render processes for full videos (1 = in this process, 0 = all cores but one)
+        workers_layout = QHBoxLayout()
+        workers_layout.addWidget(QLabel("Export Workers (0 = auto):"))
+        self.export_workers_input = QSpinBox()
+        self.export_workers_input.setRange(0, 64)
+        self.export_workers_input.setValue(
+            self.settings_handler.get_setting("Performance", "export_workers")
+        )
+        self.export_workers_input.valueChanged.connect(self.on_export_workers_changed)
+        workers_layout.addWidget(self.export_workers_input)
+        generate_layout.addLayout(workers_layout)
         generate_group.setLayout(generate_layout)
         settings_layout.addWidget(generate_group)
 
@@ -733,9 +793,50 @@ class CameraViewerGUI(QMainWindow):
         save_layout.addWidget(self.save_part_heatmap_button)
         save_layout.addWidget(self.save_part_csv_button)
 
+        # Batch export: every checked output from one pass over the range
+        batch_layout = QGridLayout()
+        self.batch_movie_checkbox = QCheckBox("Movie")
+        self.batch_trailing_checkbox = QCheckBox("Trailing")
+        self.batch_heatmap_checkbox = QCheckBox("Heatmap")
+        self.batch_mosaic_checkbox = QCheckBox("Mosaic")
+        self.batch_csv_checkbox = QCheckBox("CSV")
+        for i, checkbox in enumerate(
+            [
+                self.batch_movie_checkbox,
+                self.batch_trailing_checkbox,
+                self.batch_heatmap_checkbox,
+                self.batch_mosaic_checkbox,
+                self.batch_csv_checkbox,
+            ]
+        ):
+            checkbox.setChecked(True)
+            batch_layout.addWidget(checkbox, i // 3, i % 3)
+        save_layout.addLayout(batch_layout)
+        self.save_batch_button = QPushButton("Save Selected Parts")
+        self.save_batch_button.setEnabled(False)
+        save_layout.addWidget(self.save_batch_button)
+        self.cancel_export_button = QPushButton("Cancel Export")
+        self.cancel_export_button.setEnabled(False)
+        save_layout.addWidget(self.cancel_export_button)
+
         save_group.setLayout(save_layout)
         settings_layout.addWidget(save_group)
 
+        # Debug panel with cache and timing statistics
+        self.debug_info = {}
+        self.debug_group = QGroupBox("Debug Info")
+        self.debug_group.setCheckable(True)
+        self.debug_group.setChecked(
+            self.settings_handler.get_setting("Performance", "show_debug_panel")
+        )
+        debug_layout = QVBoxLayout()
+        self.debug_label = QLabel("")
+        self.debug_label.setVisible(self.debug_group.isChecked())
+        debug_layout.addWidget(self.debug_label)
+        self.debug_group.setLayout(debug_layout)
+        self.debug_group.toggled.connect(self.on_debug_panel_toggled)
+        settings_layout.addWidget(self.debug_group)
+
         self.settings_widget.setLayout(settings_layout)
 
     def connect_resolution_signals(self):
@@ -761,10 +862,17 @@ class CameraViewerGUI(QMainWindow):
                 for preset in self.resolution_presets[ratio]:
                     self.save_resolution_combo.addItem(preset[0])
 
-    def update_resolution_display(self, width, height, fps):
-        self.camera_resolution_label.setText(
-            f"Resolution: {width}x{height} | FPS: {fps:.1f}"
-        )
+    def update_resolution_display(
+        self, width, height, fps, display_fps=None, dropped_frames=None, latency_ms=None
+    ):
+        text = f"Resolution: {width}x{height} | FPS: {fps:.1f}"
+        if display_fps is not None:
+            text += f" | Display: {display_fps:.1f}"
+        if dropped_frames is not None:
+            text += f" | Dropped: {dropped_frames}"
+        if latency_ms is not None:
+            text += f" | Latency: {latency_ms:.0f} ms"
+        self.camera_resolution_label.setText(text)
 
     def save_settings(self):
         # Save current selected resolution for camera
@@ -808,6 +916,11 @@ class CameraViewerGUI(QMainWindow):
         self.settings_handler.set_setting(
             "Trailing", "alpha_fade", self.alpha_fade_checkbox.isChecked()
         )
+        self.settings_handler.set_setting(
+            "Trailing",
+            "persistent_canvas",
+            self.persistent_canvas_checkbox.isChecked(),
+        )
 
         # Save Heatmap settings
         self.settings_handler.set_setting(
@@ -830,6 +943,20 @@ class CameraViewerGUI(QMainWindow):
         self.settings_handler.set_setting(
             "Heatmap", "accumulate", self.heatmap_accumulate_checkbox.isChecked()
         )
+        self.settings_handler.set_setting(
+            "Heatmap", "range_mode", self.heatmap_range_mode_checkbox.isChecked()
+        )
+        self.settings_handler.set_setting(
+            "Heatmap", "density_downscale", self.heatmap_downscale_input.value()
+        )
+        self.settings_handler.set_setting(
+            "Performance", "export_workers", self.export_workers_input.value()
+        )
+        self.settings_handler.set_setting(
+            "ViewSettings",
+            "playback_rate",
+            float(self.playback_rate_combo.currentText()[:-1]),
+        )
 
         # Save settings to file
         self.settings_handler.save_settings()
@@ -912,24 +1039,29 @@ class CameraViewerGUI(QMainWindow):
         else:
             self.log("Camera is not connected. Settings saved.")
 
-    def update_camera_frame(self, pixmap):
-        scaled_pixmap = pixmap.scaled(
-            self.camera_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-        self.camera_label.setPixmap(scaled_pixmap)
-
-    def update_analyzed_frame(self, pixmap, original_size=None):
+    def show_frame(self, label, frame, box_size=None, upscale=True):
+        """Show a BGR frame on a label, scaled once to fit while keeping aspect ratio
+
+        Args:
+            label (QLabel): Label to show the frame on
+            frame (np.ndarray): BGR frame
+            box_size (tuple): (width, height) to fit into, defaults to the label size
+            upscale (bool): Allow showing the frame larger than it is
+        """
+        height, width = frame.shape[:2]
+        if box_size is None:
+            box_size = (label.width(), label.height())
+        size = fit_size(width, height, box_size[0], box_size[1], upscale)
+        label.setPixmap(frame_to_pixmap(frame, size))
+
+    def update_camera_frame(self, frame):
+        """Show a BGR camera frame"""
+        self.show_frame(self.camera_label, frame)
+
+    def update_analyzed_frame(self, frame, original_size=None):
         """Update the analyzed frame display, maintaining aspect ratio without black background"""
-        if pixmap:
-            # Scale to fit the label while maintaining aspect ratio
-            label_size = self.analyzed_label.size()
-            scaled_pixmap = pixmap.scaled(
-                label_size.width(),
-                label_size.height(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
-            self.analyzed_label.setPixmap(scaled_pixmap)
+        if frame is not None:
+            self.show_frame(self.analyzed_label, frame)
 
             if original_size:
                 current_text = self.original_resolution_label.text()
@@ -945,18 +1077,10 @@ class CameraViewerGUI(QMainWindow):
             self.analyzed_label.clear()
             self.original_resolution_label.setText("Original: --x-- | FPS: --")
 
-    def update_trailed_frame(self, pixmap, original_size=None):
+    def update_trailed_frame(self, frame, original_size=None):
         """Update the trailed frame display, maintaining aspect ratio without black background"""
-        if pixmap:
-            # Scale to fit the label while maintaining aspect ratio
-            label_size = self.trailed_label.size()
-            scaled_pixmap = pixmap.scaled(
-                label_size.width(),
-                label_size.height(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
-            self.trailed_label.setPixmap(scaled_pixmap)
+        if frame is not None:
+            self.show_frame(self.trailed_label, frame)
 
             if original_size:
                 current_text = self.trailed_resolution_label.text()
@@ -972,18 +1096,10 @@ class CameraViewerGUI(QMainWindow):
             self.trailed_label.clear()
             self.trailed_resolution_label.setText("Original: --x-- | FPS: --")
 
-    def update_heatmap_frame(self, pixmap, original_size=None):
+    def update_heatmap_frame(self, frame, original_size=None):
         """Update the heatmap frame display, maintaining aspect ratio without black background"""
-        if pixmap:
-            # Scale to fit the label while maintaining aspect ratio
-            label_size = self.heatmap_label.size()
-            scaled_pixmap = pixmap.scaled(
-                label_size.width(),
-                label_size.height(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
-            self.heatmap_label.setPixmap(scaled_pixmap)
+        if frame is not None:
+            self.show_frame(self.heatmap_label, frame)
 
             if original_size:
                 current_text = self.heatmap_resolution_label.text()
@@ -1045,16 +1161,24 @@ class CameraViewerGUI(QMainWindow):
         high = max(self.frame_slider.minimum(), min(high, self.frame_slider.maximum()))
         high = max(high, low)  # Ensure high is not less than low
 
-        # Update display
+        # Update display; the spin boxes would schedule the same update again
         self.frame_number_label.setText(f"Frames: {low}-{high}")
-        self.min_frame_spin.setValue(low)
-        self.max_frame_spin.setValue(high)
-        self.update_frame_from_slider()  # This will call the app's method through inheritance
+        for spin, value in ((self.min_frame_spin, low), (self.max_frame_spin, high)):
+            spin.blockSignals(True)
+            spin.setValue(value)
+            spin.blockSignals(False)
+        self.scrub_to_slider()  # This will call the app's method through inheritance
+
+    def on_slider_released(self):
+        """Render the slider position at full resolution once a handle is let go"""
+        self.finish_scrub()
 
     def clear_analysis_data(self):
         self.update_analyzed_frame(None)
         self.update_trailed_frame(None)
         self.update_heatmap_frame(None)
+        self.mixed_frames = {}
+        self.mixed_view.clear()
         self.left_landmarks_table.clear_data()
         self.right_landmarks_table.clear_data()
         self.overall_stats_table.clear_data()
@@ -1065,65 +1189,27 @@ class CameraViewerGUI(QMainWindow):
         self.recording_combo.clear()
         self.recording_combo.addItems(mp4_files)
 
-    def format_value(self, value):
-        try:
-            num_value = float(value)
-            return f"{num_value:.5f}"
-        except (ValueError, TypeError):
-            return str(value)
-
-    def update_landmarks_table(self, table, landmarks):
-        if not landmarks:
+    def update_landmarks_table(self, table, values):
+        """Show a hand's landmarks (21 rows of frame, x, y, z, or None to clear)"""
+        if values is None or len(values) == 0:
             table.clear_data()
             return
+        table.update_data(
+            values,
+            row_labels=list(LANDMARK_DICT.values()),
+            column_labels=["Frame", "X", "Y", "Z"],
+        )
 
-        # Extract frame number
-        frame_number = (
-            landmarks[0][1] if landmarks and landmarks[0][0] == "FRAME" else 0
-        )
-        landmarks = landmarks[1:]  # Remove frame entry from landmarks
-
-        # Prepare data for table
-        data = []
-        column_labels = ["Frame", "X", "Y", "Z"]
-        row_labels = []
-
-        for landmark in landmarks:
-            name, x, y, z = landmark
-            row_labels.append(name)
-            data.append(
-                [
-                    str(frame_number),
-                    self.format_value(x),
-                    self.format_value(y),
-                    self.format_value(z),
-                ]
-            )
-
-        table.update_data(data, row_labels=row_labels, column_labels=column_labels)
-        table.resizeRowsToContents()
-
-    def update_stats_table(self, parsed_data):
-        if parsed_data is None or (
-            isinstance(parsed_data, list) and len(parsed_data) == 0
-        ):
+    def update_stats_table(self, values):
+        """Show the stats of both hands (rows of left, right, or None to clear)"""
+        if values is None or len(values) == 0:
             self.overall_stats_table.clear_data()
             return
-
-        # Prepare data for overall stats table
-        data = []
-        row_labels = list(parsed_data.get("left", {}).keys())
-        column_labels = ["LEFT", "RIGHT"]
-
-        for stat_name in row_labels:
-            left_value = parsed_data.get("left", {}).get(stat_name, "N/A")
-            right_value = parsed_data.get("right", {}).get(stat_name, "N/A")
-            data.append([self.format_value(left_value), self.format_value(right_value)])
-
         self.overall_stats_table.update_data(
-            data, row_labels=row_labels, column_labels=column_labels
+            values,
+            row_labels=list(STATS_DICT.values()),
+            column_labels=["LEFT", "RIGHT"],
         )
-        self.overall_stats_table.resizeRowsToContents()
 
     def update_resolution_label(self, frame):
         if frame is not None:
@@ -1255,7 +1341,7 @@ class CameraViewerGUI(QMainWindow):
             self.frame_number_label.setText(
                 f"Frames: {min_val}-{self.frame_slider.high()}"
             )
-            self.update_frame_from_slider()
+            self.scrub_to_slider()
 
     def on_max_frame_changed(self, value):
         """Handle maximum frame spinbox change"""
@@ -1414,6 +1500,11 @@ class CameraViewerGUI(QMainWindow):
         self.settings_handler.set_setting("Trailing", "alpha_fade", state)
         self.settings_handler.save_settings()
 
+    def on_persistent_canvas_changed(self, state):
+        """Handle changes to persistent trail canvas checkbox"""
+        self.settings_handler.set_setting("Trailing", "persistent_canvas", bool(state))
+        self.settings_handler.save_settings()
+
     def on_heatmap_radius_changed(self, value):
         """Handle changes to heatmap radius"""
         self.settings_handler.set_setting("Heatmap", "radius", value)
@@ -1444,6 +1535,56 @@ class CameraViewerGUI(QMainWindow):
         self.settings_handler.set_setting("Heatmap", "accumulate", bool(state))
         self.settings_handler.save_settings()
 
+    def on_debug_panel_toggled(self, checked):
+        """Show or hide the debug panel"""
+        self.debug_label.setVisible(checked)
+        self.settings_handler.set_setting("Performance", "show_debug_panel", checked)
+        self.settings_handler.save_settings()
+        self.refresh_debug_panel()
+
+    def set_debug_info(self, section, text):
+        """Set one line of the debug panel
+
+        Args:
+            section (str): Key of the line, so it can be updated in place
+            text (str): Line text
+        """
+        self.debug_info[section] = text
+        self.refresh_debug_panel()
+
+    def refresh_debug_panel(self):
+        if self.debug_group.isChecked():
+            self.debug_label.setText("\n".join(self.debug_info.values()))
+
+    def on_heatmap_downscale_changed(self, value):
+        """Handle changes to heatmap density downscale"""
+        self.settings_handler.set_setting("Heatmap", "density_downscale", value)
+        self.settings_handler.save_settings()
+
+    def on_playback_rate_changed(self, text):
+        """Handle changes to the playback speed ("2x" etc.)"""
+        self.settings_handler.set_setting(
+            "ViewSettings", "playback_rate", float(text[:-1])
+        )
+        self.settings_handler.save_settings()
+
+    def on_export_workers_changed(self, value):
+        """Handle changes to the number of export worker processes"""
+        self.settings_handler.set_setting("Performance", "export_workers", value)
+        self.settings_handler.save_settings()
+
+    def on_heatmap_range_mode_changed(self, state):
+        """Handle changes to heatmap selected range checkbox"""
+        self.settings_handler.set_setting("Heatmap", "range_mode", bool(state))
+        self.settings_handler.save_settings()
+
+    def on_analyze_while_recording_changed(self, state):
+        """Handle changes to analyze while recording checkbox"""
+        self.settings_handler.set_setting(
+            "Recording", "analyze_while_recording", bool(state)
+        )
+        self.settings_handler.save_settings()
+
     def on_trailing_opacity_changed(self, value):
         """Handle changes to trailing opacity"""
         self.settings_handler.set_setting("Trailing", "opacity", value)
@@ -1457,28 +1598,34 @@ class CameraViewerGUI(QMainWindow):
         self.save_preset_combo.setEnabled(not bool(state))
         self.save_resolution_combo.setEnabled(not bool(state))
 
-    def update_mixed_frame(self, label, pixmap, target_size):
-        """Update a frame in the mixed view with proper scaling"""
-        if pixmap:
-            # Get original image size
-            original_width = pixmap.width()
-            original_height = pixmap.height()
-            target_width, target_height = target_size
-
-            # If original is smaller than target in both dimensions, keep original size
-            if original_width <= target_width and original_height <= target_height:
-                label.setPixmap(pixmap)
-            else:
-                # Scale down while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    target_width,
-                    target_height,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation,
-                )
-                label.setPixmap(scaled_pixmap)
-        else:
-            label.clear()
+    def get_mixed_tiles(self, width, height):
+        """Get the tile of each view in the Mixed tab for a frame size
+
+        Returns:
+            dict: (x, y, width, height) of "original", "trailed" and "heatmap"
+        """
+        _, tiles = self.mixed_compositor.get_layout(
+            (width, height), self.mixed_view.width(), self.mixed_view.height()
+        )
+        return tiles
+
+    def update_mixed_view(self, frames, source_size):
+        """Composite views into the Mixed tab and show them in one paint
+
+        Args:
+            frames (dict): BGR frame of "original", "trailed" and/or
+                "heatmap", ideally at their tile size; views left out keep
+                their last image
+            source_size (tuple): (width, height) of the recording
+        """
+        self.mixed_frames.update(frames)
+        canvas = self.mixed_compositor.compose(
+            self.mixed_frames,
+            source_size,
+            self.mixed_view.width(),
+            self.mixed_view.height(),
+        )
+        self.mixed_view.set_frame(canvas)
 
     def on_record_preset_changed(self, text):
         """Handle record resolution preset change"""
@@ -0,0 +1,34 @@
+from PyQt5.QtGui import QPainter
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+from src.utils.display_utils import bgr_to_qimage
+
+
+class MosaicView(QWidget):
+    """Shows a composited BGR canvas, centered, with one QImage blit per paint
+
+    The image shares the canvas memory, so the canvas may be overwritten by
+    the next composite; the view always paints the latest one.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.frame = None  # Keeps the canvas alive while the image uses it
+        self.image = None
+
+    def set_frame(self, frame):
+        """Show a BGR canvas, or nothing for None"""
+        self.frame = frame
+        self.image = None if frame is None else bgr_to_qimage(frame)
+        self.update()
+
+    def clear(self):
+        self.set_frame(None)
+
+    def paintEvent(self, event):
+        if self.image is None:
+            return
+        painter = QPainter(self)
+        x = (self.width() - self.image.width()) // 2
+        y = (self.height() - self.image.height()) // 2
+        painter.drawImage(x, y, self.image)
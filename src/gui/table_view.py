@@ -1,42 +1,108 @@
-from PyQt5.QtWidgets import (
-    QTableWidget,
-    QTableWidgetItem,
-    QHeaderView,
-)
+import numbers
+import numpy as np
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtWidgets import QHeaderView, QTableView
 
 
-class TableView(QTableWidget):
+class FrameTableModel(QAbstractTableModel):
+    """Table model over a grid of cell values that is swapped per frame
+
+    Values are formatted only when a view asks for a visible cell. When a
+    new grid with the same shape and labels is set, only the cells whose
+    value changed are reported with dataChanged; anything else resets the
+    model.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.values = np.empty((0, 0), dtype=object)
+        self.row_labels = []
+        self.column_labels = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.values.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.values.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self.format_value(self.values[index.row(), index.column()])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        labels = self.column_labels if orientation == Qt.Horizontal else self.row_labels
+        if section < len(labels):
+            return labels[section]
+        return str(section + 1)
+
+    @staticmethod
+    def format_value(value):
+        """Format a cell: floats with 5 decimals, nothing for missing values"""
+        if value is None:
+            return ""
+        if isinstance(value, numbers.Integral):
+            return str(value)
+        if isinstance(value, numbers.Real):
+            return f"{value:.5f}"
+        return str(value)
+
+    def set_values(self, values, row_labels=None, column_labels=None):
+        """Show a new grid of values
+
+        Args:
+            values: 2D array-like of cell values
+            row_labels (list): Vertical header labels
+            column_labels (list): Horizontal header labels
+        """
+        values = np.asarray(values, dtype=object)
+        if values.ndim == 1:
+            values = values.reshape(1, -1)
+        row_labels = list(row_labels or [])
+        column_labels = list(column_labels or [])
+
+        if (
+            values.shape != self.values.shape
+            or row_labels != self.row_labels
+            or column_labels != self.column_labels
+        ):
+            self.beginResetModel()
+            self.values = values.copy()
+            self.row_labels = row_labels
+            self.column_labels = column_labels
+            self.endResetModel()
+            return
+
+        changed = np.asarray(values != self.values, dtype=bool)
+        if not changed.any():
+            return
+        self.values = values.copy()
+        # One signal per column that changed, spanning its changed rows
+        for column in np.flatnonzero(changed.any(axis=0)):
+            rows = np.flatnonzero(changed[:, column])
+            self.dataChanged.emit(
+                self.index(int(rows[0]), int(column)),
+                self.index(int(rows[-1]), int(column)),
+                [Qt.DisplayRole],
+            )
+
+
+class TableView(QTableView):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setStyleSheet("QTableView { font-size: 10pt; }")
         self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.verticalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.setModel(FrameTableModel(self))
 
     def update_data(self, data, row_labels=None, column_labels=None):
-        self.clear()
-        if not data:
+        """Show a grid of values (rows of cells, or a single row)"""
+        if data is None or len(data) == 0:
+            self.clear_data()
             return
-
-        if isinstance(data[0], list):  # 2D data
-            self.setRowCount(len(data))
-            self.setColumnCount(len(data[0]))
-        else:  # 1D data
-            self.setRowCount(1)
-            self.setColumnCount(len(data))
-
-        for i, row in enumerate(data):
-            if isinstance(row, list):
-                for j, value in enumerate(row):
-                    self.setItem(i, j, QTableWidgetItem(str(value)))
-            else:
-                self.setItem(0, i, QTableWidgetItem(str(row)))
-
-        if row_labels:
-            self.setVerticalHeaderLabels(row_labels)
-        if column_labels:
-            self.setHorizontalHeaderLabels(column_labels)
+        self.model().set_values(data, row_labels, column_labels)
 
     def clear_data(self):
-        self.clear()
-        self.setRowCount(0)
-        self.setColumnCount(0)
+        self.model().set_values(np.empty((0, 0), dtype=object))
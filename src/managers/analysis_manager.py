@@ -1,12 +1,90 @@
 import os
 import csv
+import queue
+import threading
 from src.core.hand_analyzer import HandAnalyzer
 import cv2
 
 
+class FrameCsvWriter:
+    """Write analyzed frames to CSV, taking the header from the first frame"""
+
+    def __init__(self, csvfile):
+        self.csvfile = csvfile
+        self.writer = None  # Will be initialized after first frame
+
+    def write(self, frame_data):
+        # Initialize writer with fields from first frame
+        if self.writer is None and frame_data:
+            fieldnames = ["frame"] + sorted(
+                [k for k in frame_data.keys() if k != "frame"]
+            )
+            self.writer = csv.DictWriter(self.csvfile, fieldnames=fieldnames)
+            self.writer.writeheader()
+
+        # Write frame data immediately
+        if self.writer is not None:
+            self.writer.writerow(frame_data)
+
+
+class LiveAnalysisWorker(threading.Thread):
+    """Analyze frames on a background thread while they are being recorded"""
+
+    def __init__(self, csv_path):
+        super().__init__(name="LiveAnalysis", daemon=True)
+        self.csv_path = csv_path
+        self.frames = queue.Queue()
+        self.accepting = True
+        self.submitted_frames = 0
+        self.processed_frames = 0
+        self.error = None
+
+    def submit(self, frame):
+        """Queue a captured frame for analysis"""
+        if self.accepting:
+            self.submitted_frames += 1
+            self.frames.put(frame)
+
+    def finish(self):
+        """Stop accepting frames; the worker exits once the queue is drained"""
+        self.accepting = False
+        self.frames.put(None)
+
+    def get_progress(self):
+        """Get the share of submitted frames already analyzed (0-100)"""
+        if self.submitted_frames == 0:
+            return 100
+        return int(self.processed_frames / self.submitted_frames * 100)
+
+    def run(self):
+        try:
+            # Fresh analyzer so tracking state doesn't leak between recordings
+            hand_analyzer = HandAnalyzer()
+            with open(self.csv_path, mode="w", newline="") as csvfile:
+                writer = FrameCsvWriter(csvfile)
+                while True:
+                    frame = self.frames.get()
+                    if frame is None:
+                        break
+                    frame_data = hand_analyzer.analyze_frame(
+                        frame, self.processed_frames
+                    )
+                    writer.write(frame_data)
+                    self.processed_frames += 1
+        except Exception as e:
+            self.error = e
+            print(f"Error during live analysis: {str(e)}")
+
+
 class AnalysisManager:
     def __init__(self):
         self.hand_analyzer = HandAnalyzer()
+        self.live_worker = None
+        self.live_csv_paths = set()  # CSVs completed while recording
+
+    def get_csv_path(self, timestamp):
+        """Get the CSV path matching a raw movie timestamp"""
+        return os.path.join("src/data/csv_data", f"csv_{timestamp}.csv")
 
     def analyze_video(self, video_path, progress_callback=None):
         """Analyze video frame by frame and save directly to CSV"""
@@ -16,10 +94,10 @@ class AnalysisManager:
         # Create CSV file
         os.makedirs("src/data/csv_data", exist_ok=True)
         timestamp = os.path.basename(video_path)[10:-4]
-        csv_path = os.path.join("src/data/csv_data", f"csv_{timestamp}.csv")
+        csv_path = self.get_csv_path(timestamp)
 
         with open(csv_path, mode="w", newline="") as csvfile:
-            writer = None  # Will be initialized after first frame
+            writer = FrameCsvWriter(csvfile)
 
             for frame_idx in range(total_frames):
                 # Read and analyze single frame
@@ -28,18 +106,7 @@ class AnalysisManager:
                     break
 
                 frame_data = self.hand_analyzer.analyze_frame(frame, frame_idx)
-
-                # Initialize writer with fields from first frame
-                if writer is None and frame_data:
-                    fieldnames = ["frame"] + sorted(
-                        [k for k in frame_data.keys() if k != "frame"]
-                    )
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-
-                # Write frame data immediately
-                if writer is not None:
-                    writer.writerow(frame_data)
+                writer.write(frame_data)
 
                 # Update progress
                 if progress_callback:
@@ -50,4 +117,38 @@ class AnalysisManager:
                 frame = None
 
         cap.release()
+        self.live_csv_paths.discard(csv_path)
         return csv_path
+
+    def start_live_analysis(self, timestamp):
+        """Start analyzing recorded frames in the background
+
+        Args:
+            timestamp (str): Timestamp of the raw movie being recorded, so the
+                CSV gets the same name the offline analysis would use
+        """
+        os.makedirs("src/data/csv_data", exist_ok=True)
+        self.live_worker = LiveAnalysisWorker(self.get_csv_path(timestamp))
+        self.live_worker.start()
+
+    def submit_live_frame(self, frame):
+        """Pass a recorded frame to the live analysis worker, if running"""
+        if self.live_worker is not None:
+            self.live_worker.submit(frame)
+
+    def finish_live_analysis(self):
+        """Stop feeding the live worker and return it so callers can wait on it"""
+        worker = self.live_worker
+        self.live_worker = None
+        if worker is not None:
+            worker.finish()
+        return worker
+
+    def mark_live_analysis_done(self, worker):
+        """Remember a finished live analysis so the offline pass can be skipped"""
+        if worker.error is None and not worker.is_alive():
+            self.live_csv_paths.add(worker.csv_path)
+
+    def is_live_analysis_complete(self, csv_path):
+        """Check if a CSV was fully written by live analysis"""
+        return csv_path in self.live_csv_paths
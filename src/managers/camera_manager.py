@@ -1,41 +1,376 @@
+import glob
+import re
+import sys
+import threading
+import time
 import cv2
 from PyQt5.QtCore import QTimer
+from src.utils.synthetic_capture import SyntheticCapture
 
 class CameraManager:
+    # Pixel formats in order of achievable throughput at high resolutions
+    FOURCC_CANDIDATES = ["MJPG", "YUYV"]
+
     def __init__(self):
         self.camera = None
+        self.camera_index = None
+        self.format_report = None
         self.frame_timer = QTimer()
-        
-    def get_camera_list(self):
-        camera_list = []
-        for i in range(10):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                camera_list.append(f"Camera {i}")
-                cap.release()
-        return camera_list
-    
-    def connect_camera(self, camera_index, width, height):
+
+        # Camera enumeration cache
+        self.camera_list_cache = None
+        self.probe_timeout = 2.0  # Seconds to wait for slow device probes
+        self.last_enumeration_time = 0.0
+
+        # Capture thread state
+        self.capture_thread = None
+        self.capture_stop = None  # Event telling the capture thread to exit
+        self.frame_listeners = []
+        # Latest captured frame as (sequence, capture_time, frame). The slot is
+        # replaced as a whole by the capture thread, so readers never need a lock.
+        self.latest_frame = None
+        self.reset_capture_stats()
+
+    def reset_capture_stats(self):
+        """Reset capture and display statistics"""
+        self.captured_frames = 0
+        self.capture_fps = 0.0
+        self.dropped_frames = 0
+        self.latency_ms = 0.0
+        self.last_consumed_sequence = 0
+
+    def get_camera_list(self, refresh=False):
+        """Get available cameras, probing devices only on first use or refresh
+
+        Args:
+            refresh (bool): Probe the devices again instead of using the cache
+
+        Returns:
+            list: Camera names in the form "Camera <index>"
+        """
+        if self.camera_list_cache is not None and not refresh:
+            return list(self.camera_list_cache)
+
+        start_time = time.monotonic()
+        available = set(self.probe_cameras(self.get_candidate_indices()))
+
+        # The connected camera is busy and may fail its probe, keep it listed
+        if self.camera is not None and self.camera_index is not None:
+            available.add(self.camera_index)
+
+        self.camera_list_cache = [f"Camera {i}" for i in sorted(available)]
+        self.last_enumeration_time = time.monotonic() - start_time
+        return list(self.camera_list_cache)
+
+    def get_candidate_indices(self):
+        """Get camera indices worth probing"""
+        if sys.platform.startswith("linux"):
+            # Only probe device nodes that actually exist
+            indices = []
+            for path in glob.glob("/dev/video*"):
+                match = re.fullmatch(r"/dev/video(\d+)", path)
+                if match:
+                    indices.append(int(match.group(1)))
+            return sorted(indices)
+        return list(range(10))
+
+    def probe_cameras(self, indices):
+        """Probe camera indices in parallel, skipping probes that time out"""
+        results = {}
+        # Daemon threads, so hung devices never hold up interpreter exit
+        threads = {
+            index: threading.Thread(
+                target=self._probe_camera,
+                args=(index, results),
+                name=f"CameraProbe{index}",
+                daemon=True,
+            )
+            for index in indices
+        }
+        for thread in threads.values():
+            thread.start()
+
+        deadline = time.monotonic() + self.probe_timeout
+        available = []
+        for index, thread in threads.items():
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                print(f"Camera {index} probe timed out")
+            elif results.get(index):
+                available.append(index)
+        return available
+
+    def _probe_camera(self, index, results):
+        cap = cv2.VideoCapture(index)
+        try:
+            results[index] = cap.isOpened()
+        finally:
+            cap.release()
+
+    def connect_camera(
+        self, camera_index, width, height, fps=30, fourcc="MJPG", buffer_size=1
+    ):
         self.camera = cv2.VideoCapture(camera_index)
+        self.camera_index = camera_index
+        if self.camera.isOpened():
+            self.format_report = self.negotiate_format(
+                width, height, fps, fourcc, buffer_size
+            )
+            self.start_capture()
+            return True
+        return False
+
+    def negotiate_format(self, width, height, fps, fourcc="MJPG", buffer_size=1):
+        """Pick the highest-throughput pixel format that fits the resolution
+
+        Compressed MJPG usually allows full frame rates at high resolutions
+        over USB2, while YUYV often falls back to a few frames per second.
+        Each candidate format is requested and read back, and the one that
+        keeps the requested resolution at the highest granted FPS wins.
+
+        Args:
+            width (int): Requested frame width
+            height (int): Requested frame height
+            fps (float): Requested frame rate
+            fourcc (str): Preferred pixel format, tried first
+            buffer_size (int): Driver buffer size in frames (1 = lowest latency)
+
+        Returns:
+            dict: Requested and granted format, resolution, FPS and buffer size
+        """
+        candidates = [fourcc] + [f for f in self.FOURCC_CANDIDATES if f != fourcc]
+
+        best = None
+        for candidate in candidates:
+            granted = self._apply_format(candidate, width, height, fps)
+            fits = granted["fourcc"] == candidate and (
+                granted["width"],
+                granted["height"],
+            ) == (width, height)
+            if fits and (best is None or granted["fps"] > best["fps"]):
+                best = granted
+            if fits and granted["fps"] >= fps:
+                break  # Candidates are ordered by throughput, no need to go on
+
+        # Re-apply the winner unless it was the last mode tried; if nothing
+        # fits exactly, let the driver pick a resolution for the preferred format
+        if best is None:
+            granted = self._apply_format(fourcc, width, height, fps)
+        elif best is not granted:
+            granted = self._apply_format(best["fourcc"], width, height, fps)
+
+        self.camera.set(cv2.CAP_PROP_BUFFERSIZE, buffer_size)
+        granted["buffer_size"] = int(self.camera.get(cv2.CAP_PROP_BUFFERSIZE))
+        granted["requested"] = {
+            "fourcc": fourcc,
+            "width": width,
+            "height": height,
+            "fps": fps,
+            "buffer_size": buffer_size,
+        }
+        return granted
+
+    def _apply_format(self, fourcc, width, height, fps):
+        """Request a format and read back what the driver granted"""
+        # Pixel format has to be set before the resolution to take effect
+        self.camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+        self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.camera.set(cv2.CAP_PROP_FPS, fps)
+        return {
+            "fourcc": self.decode_fourcc(self.camera.get(cv2.CAP_PROP_FOURCC)),
+            "width": int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": float(self.camera.get(cv2.CAP_PROP_FPS)),
+        }
+
+    @staticmethod
+    def decode_fourcc(value):
+        """Turn a CAP_PROP_FOURCC value into its four character code"""
+        value = int(value)
+        return "".join(chr((value >> (8 * i)) & 0xFF) for i in range(4))
+
+    def get_format_report(self):
+        """Get the negotiated camera format, or None for non-negotiated sources"""
+        return self.format_report
+
+    def connect_synthetic_camera(self, source, width, height, fps=30.0):
+        """Connect a synthetic camera replaying a file or generating frames
+
+        Args:
+            source: Video file path to replay, or None for procedural frames
+            width (int): Frame width
+            height (int): Frame height
+            fps (float): Exact frame rate to deliver
+
+        Returns:
+            bool: True if the source opened
+        """
+        self.camera = SyntheticCapture(source, width, height, fps)
+        self.camera_index = None
+        self.format_report = None
         if self.camera.isOpened():
-            self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-            self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            self.start_capture()
             return True
+        self.camera = None
         return False
-    
+
     def get_actual_resolution(self):
         if self.camera:
             actual_width = int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH))
             actual_height = int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
             return actual_width, actual_height
         return None
-    
+
     def disconnect_camera(self):
-        if self.camera:
+        if self.capture_thread is not None:
+            # The capture thread releases the camera once its read returns
+            self.stop_capture()
+        elif self.camera:
             self.camera.release()
-            self.camera = None
-    
+        self.camera = None
+
+    def add_frame_listener(self, callback):
+        """Register a callback receiving every captured frame
+
+        Args:
+            callback: Called as callback(frame, capture_time) from the capture
+                thread for each frame, so it must be quick and thread-safe
+        """
+        if callback not in self.frame_listeners:
+            self.frame_listeners.append(callback)
+
+    def remove_frame_listener(self, callback):
+        """Unregister a frame callback"""
+        if callback in self.frame_listeners:
+            self.frame_listeners.remove(callback)
+
+    def start_capture(self):
+        """Start reading frames on a dedicated thread at the camera's native rate"""
+        if self.camera is None or self.capture_thread is not None:
+            return
+        self.latest_frame = None
+        self.reset_capture_stats()
+        self.capture_stop = threading.Event()
+        self.capture_thread = threading.Thread(
+            target=self._capture_loop,
+            args=(self.camera, self.capture_stop),
+            name="CameraCapture",
+            daemon=True,
+        )
+        self.capture_thread.start()
+
+    def stop_capture(self):
+        """Stop the capture thread, which then releases the camera
+
+        Waits up to 2 s for the thread to finish; a thread stuck in a read
+        exits and releases the camera on its own once the read returns.
+        """
+        if self.capture_thread is not None:
+            self.capture_stop.set()
+            self.capture_thread.join(timeout=2.0)
+            if self.capture_thread.is_alive():
+                print("Camera capture thread still blocked in a read")
+            self.capture_thread = None
+            self.capture_stop = None
+
+    def _capture_loop(self, camera, stop):
+        """Capture thread body: read, timestamp and publish frames
+
+        Args:
+            camera: Capture to read from; released when the loop exits
+            stop (threading.Event): Set to end the loop
+        """
+        sequence = 0
+        window_start = time.monotonic()
+        window_frames = 0
+
+        try:
+            while not stop.is_set():
+                ret, frame = camera.read()
+                capture_time = time.monotonic()
+                if stop.is_set():
+                    break  # Stopped during the read, don't publish the frame
+                if not ret:
+                    time.sleep(0.005)
+                    continue
+
+                sequence += 1
+                self.latest_frame = (sequence, capture_time, frame)
+                self.captured_frames = sequence
+
+                for callback in list(self.frame_listeners):
+                    try:
+                        callback(frame, capture_time)
+                    except Exception as e:
+                        print(f"Error in frame listener: {e}")
+
+                # Update capture FPS once per second
+                window_frames += 1
+                elapsed = capture_time - window_start
+                if elapsed >= 1.0:
+                    self.capture_fps = window_frames / elapsed
+                    window_start = capture_time
+                    window_frames = 0
+        finally:
+            # Released here so it never races a read still in progress
+            camera.release()
+
+    def get_latest_frame(self):
+        """Get the newest captured frame not yet consumed
+
+        Returns:
+            tuple: (frame, capture_time) or (None, None) if no new frame arrived
+        """
+        latest = self.latest_frame
+        if latest is None:
+            return None, None
+
+        sequence, capture_time, frame = latest
+        if sequence == self.last_consumed_sequence:
+            return None, None
+
+        # Frames published but overwritten before anyone consumed them
+        if self.last_consumed_sequence:
+            self.dropped_frames += sequence - self.last_consumed_sequence - 1
+        self.last_consumed_sequence = sequence
+        return frame, capture_time
+
+    def mark_displayed(self, capture_time):
+        """Record capture-to-display latency for a frame that was just shown"""
+        latency = (time.monotonic() - capture_time) * 1000.0
+        # Exponential moving average keeps the readout stable
+        self.latency_ms = latency if not self.latency_ms else (
+            0.9 * self.latency_ms + 0.1 * latency
+        )
+
+    def get_capture_stats(self):
+        """Get capture FPS, dropped frame count and display latency"""
+        return {
+            "capture_fps": self.capture_fps,
+            "captured_frames": self.captured_frames,
+            "dropped_frames": self.dropped_frames,
+            "source_dropped_frames": getattr(self.camera, "dropped_frames", 0),
+            "latency_ms": self.latency_ms,
+        }
+
+    def get_recording_fps(self):
+        """Get the rate frames are captured at, for writing recordings
+
+        Returns:
+            float: Measured capture FPS, or the granted FPS before the first
+                measurement, or 30 if the source doesn't report one
+        """
+        if self.capture_fps > 0:
+            return self.capture_fps
+        if self.camera is not None:
+            fps = self.camera.get(cv2.CAP_PROP_FPS)
+            if fps and fps > 0:
+                return float(fps)
+        return 30.0
+
     def read_frame(self):
-        if self.camera:
-            return self.camera.read()
+        frame, _ = self.get_latest_frame()
+        if frame is not None:
+            return True, frame
         return False, None
@@ -0,0 +1,551 @@
+import csv
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import cv2
+from src.managers.settings_handler import SettingsHandler
+from src.managers.visualization_manager import VisualizationManager
+from src.utils.heatmap_accumulator import HeatmapAccumulator
+from src.utils.keyframe_index import KeyframeIndex
+from src.utils.mosaic_compositor import MosaicCompositor
+from src.utils.trail_canvas import TrailCanvas
+
+# Views rendered from each decoded frame; the mosaic puts them side by side
+VIEW_KINDS = ["raw", "trailed", "heatmap"]
+VIDEO_KINDS = VIEW_KINDS + ["mosaic"]
+
+
+def create_view_renderer(kind, visualization_manager, analyzed_data, output_size=None):
+    """Create a function rendering one view of a frame
+
+    Args:
+        kind (str): "raw", "trailed" or "heatmap"
+        visualization_manager (VisualizationManager): Manager to render with
+        analyzed_data (list): Per-frame landmark data
+        output_size (tuple): (width, height) to render at, or None for the
+            source size
+
+    Returns:
+        Callable taking (frame, frame_index) and returning the BGR view
+    """
+    if kind == "raw":
+
+        def render_raw(frame, frame_index):
+            if output_size and (frame.shape[1], frame.shape[0]) != tuple(output_size):
+                return cv2.resize(frame, tuple(output_size))
+            return frame
+
+        return render_raw
+    if kind == "trailed":
+        canvas = TrailCanvas()
+        return lambda frame, frame_index: visualization_manager.generate_trailed_frame(
+            frame, analyzed_data, frame_index, canvas=canvas, output_size=output_size
+        )
+    if kind == "heatmap":
+        accumulator = HeatmapAccumulator()
+        return lambda frame, frame_index: visualization_manager.generate_heatmap_frame(
+            frame,
+            analyzed_data,
+            frame_index,
+            accumulator=accumulator,
+            output_size=output_size,
+        )
+    raise ValueError(f"Unknown export kind: {kind}")
+
+
+def create_renderer(kinds, settings_handler, analyzed_data, output_size=None):
+    """Create a function rendering every requested output of a frame
+
+    Each view is rendered once per frame even if several outputs use it,
+    e.g. the heatmap for both the heatmap video and the mosaic. Trails and
+    heatmaps are drawn directly at output_size rather than rendered at the
+    source size and resized.
+
+    Args:
+        kinds (list): Any of "raw", "trailed", "heatmap" and "mosaic"
+        settings_handler (SettingsHandler): Settings to render with; pass a
+            snapshot so changes in the GUI don't affect a running export
+        analyzed_data (list): Per-frame landmark data
+        output_size (tuple): (width, height) of each view, or None to keep
+            the source size
+
+    Returns:
+        Callable taking (frame, frame_index) and returning a dict of BGR
+        frames by requested kind
+    """
+    needed = set(kinds)
+    if "mosaic" in needed:
+        needed.update(VIEW_KINDS)
+
+    # Own manager, so the export's caches don't interfere with the views
+    visualization_manager = VisualizationManager(settings_handler)
+    view_renderers = {
+        kind: create_view_renderer(
+            kind, visualization_manager, analyzed_data, output_size
+        )
+        for kind in VIEW_KINDS
+        if kind in needed
+    }
+    # New canvas per frame: outputs are queued to the writer thread
+    mosaic = MosaicCompositor([VIEW_KINDS])
+
+    def render(frame, frame_index):
+        views = {
+            kind: render_view(frame, frame_index)
+            for kind, render_view in view_renderers.items()
+        }
+        if "mosaic" in needed:
+            height, width = views["raw"].shape[:2]
+            views["mosaic"] = mosaic.compose(
+                views, (width, height), width * len(VIEW_KINDS), height
+            )
+        return {kind: views[kind] for kind in kinds}
+
+    return render
+
+
+class VideoOutput:
+    """Video file written from one kind of rendered frame"""
+
+    def __init__(self, kind, path, fps):
+        self.kind = kind
+        self.path = path
+        self.fps = fps
+        self.writer = None
+
+    def write(self, frame_index, views):
+        frame = views[self.kind]
+        if self.writer is None:
+            # Frame size is known once the first frame is rendered
+            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+            self.writer = cv2.VideoWriter(
+                self.path, fourcc, self.fps, (frame.shape[1], frame.shape[0])
+            )
+        self.writer.write(frame)
+
+    def release(self):
+        if self.writer is not None:
+            self.writer.release()
+
+
+class CsvOutput:
+    """CSV file with the analyzed data row of every exported frame
+
+    Without analyzed data only the frame numbers are written.
+    """
+
+    kind = "csv"
+
+    def __init__(self, path, analyzed_data=None):
+        self.path = path
+        self.analyzed_data = analyzed_data or []
+        self.file = open(path, mode="w", newline="")
+        if self.analyzed_data:
+            self.writer = csv.DictWriter(
+                self.file, fieldnames=list(self.analyzed_data[0].keys())
+            )
+            self.writer.writeheader()
+        else:
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(["frame"])
+
+    def write(self, frame_index, views):
+        if not self.analyzed_data:
+            self.writer.writerow([frame_index])
+        elif frame_index < len(self.analyzed_data):
+            self.writer.writerow(self.analyzed_data[frame_index])
+
+    def release(self):
+        self.file.close()
+
+
+class VideoExport:
+    """Export a frame range of a video on background threads
+
+    A decode thread reads the range sequentially after a single seek to its
+    start, a render thread turns each frame into all requested outputs and
+    an encode thread writes them. Bounded queues between them keep memory
+    flat and let the three stages overlap. Every output shares one decode.
+    """
+
+    QUEUE_SIZE = 8
+
+    def __init__(self, video_path, outputs, start_frame, end_frame, render):
+        """
+        Args:
+            video_path (str): Source video
+            outputs (list): VideoOutput/CsvOutput objects to write
+            start_frame (int): First frame to export
+            end_frame (int): Last frame to export (inclusive)
+            render: Callable (frame, frame_index) -> dict of frames by kind
+        """
+        self.video_path = video_path
+        self.outputs = outputs
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.render = render
+
+        self.total_frames = max(0, end_frame - start_frame + 1)
+        self.decoded_frames = 0
+        self.rendered_frames = 0
+        self.written_frames = 0
+        self.error = None
+        self.cancelled = False
+        self.start_time = None
+        self.elapsed = 0.0
+
+        self.decode_queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.encode_queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.threads = []
+
+    def start(self):
+        """Start the decode, render and encode threads"""
+        self.start_time = time.monotonic()
+        for name, target in [
+            ("ExportDecode", self._decode_loop),
+            ("ExportRender", self._render_loop),
+            ("ExportEncode", self._encode_loop),
+        ]:
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def cancel(self):
+        """Stop the export; the partial output files are kept"""
+        self.cancelled = True
+
+    def is_running(self):
+        return any(thread.is_alive() for thread in self.threads)
+
+    def get_progress(self):
+        """Get the share of frames written (0-100)"""
+        if self.total_frames == 0:
+            return 100
+        return min(100, int(self.written_frames / self.total_frames * 100))
+
+    def get_fps(self):
+        """Get the average export rate in frames per second"""
+        elapsed = self.elapsed or (
+            time.monotonic() - self.start_time if self.start_time else 0.0
+        )
+        return self.written_frames / elapsed if elapsed > 0 else 0.0
+
+    def _fail(self, stage, e):
+        if self.error is None:
+            self.error = e
+            print(f"Error during export ({stage}): {str(e)}")
+        self.cancelled = True
+
+    def _put(self, target_queue, item):
+        """Put an item, giving up if the export gets cancelled meanwhile"""
+        while True:
+            try:
+                target_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                if self.cancelled:
+                    return False
+
+    def _get(self, source_queue):
+        """Get an item, returning None (end) if the export gets cancelled"""
+        while True:
+            try:
+                return source_queue.get(timeout=0.1)
+            except queue.Empty:
+                if self.cancelled:
+                    return None
+
+    def _decode_loop(self):
+        cap = cv2.VideoCapture(self.video_path)
+        try:
+            if not cap.isOpened():
+                raise IOError(f"Failed to open video: {self.video_path}")
+            # One seek to the start of the range, then sequential reads
+            keyframe_index = KeyframeIndex(self.video_path)
+            keyframe_index.load()
+            keyframe_index.seek(cap, self.start_frame, 0)
+            for frame_index in range(self.start_frame, self.end_frame + 1):
+                if self.cancelled:
+                    break
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                self.decoded_frames += 1
+                if not self._put(self.decode_queue, (frame_index, frame)):
+                    break
+        except Exception as e:
+            self._fail("decode", e)
+        finally:
+            cap.release()
+            self._put(self.decode_queue, None)
+
+    def _render_loop(self):
+        try:
+            while True:
+                item = self._get(self.decode_queue)
+                if item is None:
+                    break
+                frame_index, frame = item
+                views = self.render(frame, frame_index)
+                self.rendered_frames += 1
+                if not self._put(self.encode_queue, (frame_index, views)):
+                    break
+        except Exception as e:
+            self._fail("render", e)
+        finally:
+            self._put(self.encode_queue, None)
+
+    def _encode_loop(self):
+        try:
+            while True:
+                item = self._get(self.encode_queue)
+                if item is None:
+                    break
+                frame_index, views = item
+                for output in self.outputs:
+                    output.write(frame_index, views)
+                self.written_frames += 1
+        except Exception as e:
+            self._fail("encode", e)
+        finally:
+            for output in self.outputs:
+                output.release()
+            self.elapsed = time.monotonic() - self.start_time
+
+
+# Per-process state of the parallel export workers
+_worker = {}
+
+
+def _init_worker(video_path, kinds, settings, analyzed_data, output_size):
+    """Set up a worker process with its own capture and renderer"""
+    # The processes already use every core, keep OpenCV from oversubscribing
+    cv2.setNumThreads(1)
+    _worker["cap"] = cv2.VideoCapture(video_path)
+    _worker["keyframe_index"] = KeyframeIndex(video_path)
+    _worker["keyframe_index"].load()
+    _worker["render"] = create_renderer(
+        kinds, SettingsHandler(settings), analyzed_data, output_size
+    )
+    _worker["next_frame"] = 0
+
+
+def _render_chunk(start_frame, end_frame):
+    """Render frames [start_frame, end_frame] in a worker process
+
+    Chunks reach a worker in increasing order, so its heatmap accumulator
+    only moves forward and the capture seeks once per chunk at most; it
+    grabs over the chunks of the other workers instead when that decodes
+    less.
+
+    Returns:
+        tuple: (start_frame, list of (frame_index, views))
+    """
+    cap = _worker["cap"]
+    _worker["keyframe_index"].seek(cap, start_frame, _worker["next_frame"])
+    rendered = []
+    for frame_index in range(start_frame, end_frame + 1):
+        ret, frame = cap.read()
+        if not ret:
+            break
+        rendered.append((frame_index, _worker["render"](frame, frame_index)))
+    _worker["next_frame"] = start_frame + len(rendered)
+    return start_frame, rendered
+
+
+class ParallelVideoExport(VideoExport):
+    """Export with decoding and rendering spread over worker processes
+
+    The range is split into contiguous chunks rendered by a process pool,
+    each worker with its own VideoCapture. Rendered frames come back in
+    chunk order and go through the same encode thread as a sequential
+    export, so the output file is identical to it. Only a few chunks per
+    worker are in flight, which bounds the memory held by rendered frames.
+    """
+
+    CHUNK_BYTES = 64 << 20  # Rendered frames per chunk, roughly
+    CHUNKS_PER_WORKER = 2  # Chunks in flight per worker
+
+    def __init__(
+        self,
+        video_path,
+        outputs,
+        start_frame,
+        end_frame,
+        workers,
+        worker_args,
+        frame_bytes,
+    ):
+        """
+        Args:
+            workers (int): Number of worker processes
+            worker_args (tuple): (kinds, settings dict, analyzed_data,
+                output_size) to build each worker's renderer from
+            frame_bytes (int): Size of one frame's rendered views, used to
+                size the chunks
+            Other arguments as for VideoExport
+        """
+        super().__init__(video_path, outputs, start_frame, end_frame, None)
+        self.workers = workers
+        self.worker_args = worker_args
+        self.chunk_size = max(1, min(256, self.CHUNK_BYTES // max(1, frame_bytes)))
+
+    def start(self):
+        """Start the worker pool and the collect and encode threads"""
+        self.start_time = time.monotonic()
+        for name, target in [
+            ("ExportCollect", self._collect_loop),
+            ("ExportEncode", self._encode_loop),
+        ]:
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def _collect_loop(self):
+        """Feed chunks to the pool and pass rendered frames on in order"""
+        chunks = [
+            (start, min(start + self.chunk_size - 1, self.end_frame))
+            for start in range(self.start_frame, self.end_frame + 1, self.chunk_size)
+        ]
+        # Spawn instead of fork: the parent runs Qt and other threads
+        context = multiprocessing.get_context("spawn")
+        pool = context.Pool(
+            self.workers,
+            initializer=_init_worker,
+            initargs=(self.video_path,) + tuple(self.worker_args),
+        )
+        try:
+            pending = []
+            next_chunk = 0
+            while next_chunk < len(chunks) or pending:
+                if self.cancelled:
+                    break
+                while (
+                    next_chunk < len(chunks)
+                    and len(pending) < self.workers * self.CHUNKS_PER_WORKER
+                ):
+                    chunk = chunks[next_chunk]
+                    pending.append((chunk, pool.apply_async(_render_chunk, chunk)))
+                    next_chunk += 1
+
+                (start, end), result = pending.pop(0)
+                rendered = self._wait_for_chunk(result)
+                if rendered is None:
+                    break
+                self.decoded_frames += len(rendered)
+                self.rendered_frames += len(rendered)
+                for item in rendered:
+                    if not self._put(self.encode_queue, item):
+                        break
+                if len(rendered) < end - start + 1:
+                    break  # Video ended early, later chunks are empty too
+        except Exception as e:
+            self._fail("render", e)
+        finally:
+            # Reap the workers so a cancelled export leaves no processes
+            pool.terminate()
+            pool.join()
+            self._put(self.encode_queue, None)
+
+    def _wait_for_chunk(self, result):
+        """Wait for a rendered chunk, returning None if the export gets cancelled"""
+        while True:
+            try:
+                return result.get(timeout=0.1)[1]
+            except multiprocessing.TimeoutError:
+                if self.cancelled:
+                    return None
+
+
+class ExportManager:
+    def __init__(self):
+        self.current_export = None
+
+    def is_exporting(self):
+        """Check if an export is still running"""
+        return self.current_export is not None and self.current_export.is_running()
+
+    def start_batch_export(
+        self,
+        output_paths,
+        video_path,
+        start_frame,
+        end_frame,
+        settings_handler,
+        analyzed_data=None,
+        output_size=None,
+        workers=1,
+    ):
+        """Export several outputs of one frame range from a single decode
+
+        Args:
+            output_paths (dict): Output path by kind ("raw", "trailed",
+                "heatmap", "mosaic" or "csv")
+            video_path (str): Source video
+            start_frame (int): First frame
+            end_frame (int): Last frame (inclusive)
+            settings_handler (SettingsHandler): Settings to snapshot
+            analyzed_data (list): Landmark data, needed for all but raw/csv
+            output_size (tuple): (width, height) of each view, or None for
+                the source size; the mosaic is three views wide
+            workers (int): Worker processes to render with; 1 renders on a
+                thread of this process, 0 uses all cores but one
+
+        Returns:
+            VideoExport: The running export, to poll for progress
+        """
+        analyzed_data = analyzed_data or []
+        video_kinds = [kind for kind in VIDEO_KINDS if kind in output_paths]
+        settings = settings_handler.snapshot()
+        # The coarse density grid is a preview approximation, exports are exact
+        settings.set_setting("Heatmap", "density_downscale", 1)
+
+        cap = cv2.VideoCapture(video_path)
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        cap.release()
+
+        outputs = [VideoOutput(kind, output_paths[kind], fps) for kind in video_kinds]
+        if "csv" in output_paths:
+            outputs.append(CsvOutput(output_paths["csv"], analyzed_data))
+
+        if workers == 0:
+            workers = max(1, (os.cpu_count() or 1) - 1)
+        if workers > 1 and self.can_render_in_parallel(video_kinds, settings):
+            view_width, view_height = output_size or (width, height)
+            views = len(video_kinds) + (2 if "mosaic" in video_kinds else 0)
+            self.current_export = ParallelVideoExport(
+                video_path,
+                outputs,
+                start_frame,
+                end_frame,
+                min(workers, end_frame - start_frame + 1),
+                (video_kinds, settings.settings, analyzed_data, output_size),
+                view_width * view_height * 3 * views,
+            )
+        else:
+            render = create_renderer(video_kinds, settings, analyzed_data, output_size)
+            self.current_export = VideoExport(
+                video_path, outputs, start_frame, end_frame, render
+            )
+        self.current_export.start()
+        return self.current_export
+
+    @staticmethod
+    def can_render_in_parallel(video_kinds, settings_handler):
+        """Check if chunks rendered separately match a sequential render
+
+        The persistent trail canvas carries decayed history from every
+        earlier frame, so it has to be rendered in one sequential pass.
+        """
+        if "trailed" not in video_kinds and "mosaic" not in video_kinds:
+            return True
+        trailing = settings_handler.settings["Trailing"]
+        return not (trailing["persistent_canvas"] and trailing["alpha_fade"])
+
+    def cancel_export(self):
+        if self.current_export is not None:
+            self.current_export.cancel()
@@ -1,9 +1,42 @@
+import threading
+import time
 import cv2
+from src.utils.frame_cache import FrameCache
+from src.utils.keyframe_index import KeyframeIndex
+from src.utils.video_proxy import VideoProxy
 
 
 class PlaybackManager:
-    def __init__(self):
+    """Loaded recording, its analysis data and decoded frames
+
+    Decoded frames are kept in two byte-limited caches: recently requested
+    frames (LRU), so scrubbing back and looping a range don't decode again,
+    and frames a read-ahead thread decodes past the last request while the
+    requests are sequential (or at a fixed small stride, as in
+    fast-forward). A lock serializes all access to the capture, so frames
+    can be requested from any thread.
+
+    Jumps use the recording's keyframe index (scanned in the background on
+    load, then read from disk) to grab forward instead of seeking whenever
+    that decodes less.
+
+    A low-resolution, all-intra proxy of the recording and a thumbnail strip
+    are made in the background on load (then read from disk), for previews
+    while the frame slider is dragged.
+    """
+
+    # Playback timer period; frames are paced by the clock, not by ticks
+    TIMER_INTERVAL_MS = 10
+    # Frame rate assumed when the container doesn't report one
+    DEFAULT_FPS = 30.0
+    READ_AHEAD_BYTES = 64 << 20
+    MAX_READ_AHEAD_STRIDE = 16
+
+    def __init__(self, frame_cache_bytes=256 << 20):
         self.cap = None
+        self.fps = self.DEFAULT_FPS
+        self.total_frames = 0
+        self.frame_size = (0, 0)
         self.frames = []
         self.analyzed_data = []
         self.current_frame_index = 0
@@ -12,58 +45,256 @@ class PlaybackManager:
         self.current_recording_path = None
         self.is_analyzed = False
 
+        self.keyframe_index = None
+        self.video_proxy = None
+        self.frame_cache = FrameCache(frame_cache_bytes)
+        self.read_ahead = FrameCache(self.READ_AHEAD_BYTES)
+        self.condition = threading.Condition()  # Guards the capture and caches
+        self.position = None  # Frame the capture decodes next
+        self.last_request = None
+        self.read_ahead_stride = None  # None while requests aren't sequential
+        self.read_ahead_next = None
+        self.loop_range = None
+        self.frame_bytes = 0
+        self.read_ahead_thread = None
+        self.closing = False
+
     def load_recording(self, recording_path):
         """Load a video recording"""
         try:
-            if self.cap is not None:
-                self.cap.release()
+            with self.condition:
+                if self.cap is not None:
+                    self.cap.release()
+                self.frame_cache.clear()
+                self.read_ahead.clear()
+                self.position = None
+                self.last_request = None
+                self.read_ahead_next = None
+
+                self.cap = cv2.VideoCapture(recording_path)
+                if not self.cap.isOpened():
+                    print(f"Failed to open video: {recording_path}")
+                    self.cap = None
+                    return False
+
+                fps = self.cap.get(cv2.CAP_PROP_FPS)
+                self.fps = fps if fps and 1.0 <= fps <= 1000.0 else self.DEFAULT_FPS
+                self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+                self.frame_size = (
+                    int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                    int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                )
 
-            self.cap = cv2.VideoCapture(recording_path)
-            if not self.cap.isOpened():
-                print(f"Failed to open video: {recording_path}")
-                return False
+                # Set initial position
+                self.current_frame_index = 0
+                self.current_recording_path = recording_path
+                self.is_analyzed = False  # Reset analysis flag for the new recording
 
-            # Set initial position
-            self.current_frame_index = 0
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            self.current_recording_path = recording_path
-            self.is_analyzed = False  # Reset analysis flag when loading new recording
+                self.keyframe_index = KeyframeIndex(recording_path)
+                threading.Thread(
+                    target=self.keyframe_index.load_or_build,
+                    name="KeyframeIndex",
+                    daemon=True,
+                ).start()
 
+                if self.video_proxy is not None:
+                    self.video_proxy.cancel()
+                    self.video_proxy.close()
+                self.video_proxy = VideoProxy(recording_path)
+                threading.Thread(
+                    target=self.video_proxy.load_or_build,
+                    name="VideoProxy",
+                    daemon=True,
+                ).start()
+
+            if self.read_ahead_thread is None:
+                self.read_ahead_thread = threading.Thread(
+                    target=self._run_read_ahead, name="ReadAhead", daemon=True
+                )
+                self.read_ahead_thread.start()
             return True
         except Exception as e:
             print(f"Error loading video: {str(e)}")
             return False
 
     def get_frame(self, frame_index):
-        """Get a specific frame from the video"""
-        if self.cap is None:
-            return None
+        """Get a specific frame from the video (from any thread)
 
-        try:
-            # Check if we need to seek to the frame
-            current_pos = int(self.cap.get(cv2.CAP_PROP_POS_FRAMES))
-            if current_pos != frame_index:
-                self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
-
-            ret, frame = self.cap.read()
-            if ret:
-                # Reset position if we reached the end
-                if frame_index >= self.get_total_frames() - 1:
-                    self.current_frame_index = 0
-                    self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                else:
-                    self.current_frame_index = frame_index
+        The array is shared with the frame cache and read-only.
+        """
+        with self.condition:
+            if self.cap is None:
+                return None
+
+            try:
+                frame = self.frame_cache.get(frame_index)
+                if frame is None:
+                    frame = self.read_ahead.pop(frame_index)
+                    if frame is None:
+                        frame = self._decode(frame_index)
+                        if frame is None:
+                            print(f"Failed to read frame {frame_index}")
+                            return None
+                    self.frame_cache.put(frame_index, frame)
+
+                self._update_read_ahead(frame_index)
                 return frame
-            else:
-                print(f"Failed to read frame {frame_index}")
+            except Exception as e:
+                print(f"Error getting frame: {str(e)}")
                 return None
+
+    def get_proxy_frame(self, frame_index):
+        """Get a frame of the low-resolution proxy (GUI thread only)
+
+        Returns:
+            np.ndarray: BGR proxy frame, or None until the proxy is ready
+        """
+        if self.video_proxy is None:
+            return None
+        try:
+            return self.video_proxy.get_frame(frame_index)
         except Exception as e:
-            print(f"Error getting frame: {str(e)}")
+            print(f"Error getting proxy frame: {str(e)}")
             return None
 
+    def set_loop_range(self, start_frame, end_frame):
+        """Set the frame range playback loops over, so read-ahead wraps with it"""
+        with self.condition:
+            self.loop_range = (start_frame, max(start_frame, end_frame))
+
+    def set_frame_cache_bytes(self, max_bytes):
+        """Change the budget of the recently used frames cache"""
+        with self.condition:
+            self.frame_cache.set_max_bytes(max_bytes)
+
+    def get_cache_stats(self):
+        """Get hit/miss counts and memory use of the decoded frame caches
+
+        Returns:
+            dict: cache_hits and read_ahead_hits (frames served without
+                decoding), misses (frames decoded on request), and the
+                entries and bytes used by each cache
+        """
+        with self.condition:
+            return {
+                "cache_hits": self.frame_cache.hits,
+                "read_ahead_hits": self.read_ahead.hits,
+                "misses": self.read_ahead.misses,
+                "cache_entries": len(self.frame_cache.frames),
+                "cache_bytes": self.frame_cache.used_bytes,
+                "cache_max_bytes": self.frame_cache.max_bytes,
+                "read_ahead_entries": len(self.read_ahead.frames),
+                "read_ahead_bytes": self.read_ahead.used_bytes,
+            }
+
+    def _decode(self, frame_index):
+        """Decode a frame, grabbing forward when it beats a seek (lock held)"""
+        self.keyframe_index.seek(self.cap, frame_index, self.position)
+        ret, frame = self.cap.read()
+        if not ret:
+            self.position = None
+            return None
+        self.position = frame_index + 1
+        self.frame_bytes = frame.nbytes
+        # Shared between threads and caches, so nobody may draw on it
+        frame.flags.writeable = False
+        return frame
+
+    def _get_following(self, frame_index, stride):
+        """Get the frame requested after frame_index, wrapping in the loop range"""
+        following = frame_index + stride
+        if self.loop_range is not None:
+            start_frame, end_frame = self.loop_range
+            if start_frame <= frame_index <= end_frame and following > end_frame:
+                length = end_frame - start_frame + 1
+                following = start_frame + (following - start_frame) % length
+        return following if following < self.total_frames else None
+
+    def _update_read_ahead(self, frame_index):
+        """Follow the request pattern after a request (lock held)"""
+        stride = None
+        if self.last_request is not None:
+            for candidate in range(1, self.MAX_READ_AHEAD_STRIDE + 1):
+                if self._get_following(self.last_request, candidate) == frame_index:
+                    stride = candidate
+                    break
+        self.last_request = frame_index
+
+        if stride is None:
+            # A seek: frames read ahead for the old position are useless
+            self.read_ahead.clear()
+            self.read_ahead_stride = None
+            self.read_ahead_next = None
+            return
+        if stride != self.read_ahead_stride:
+            self.read_ahead.clear()
+            self.read_ahead_stride = stride
+        self.read_ahead_next = self._get_following(frame_index, stride)
+        self.condition.notify_all()
+
+    def _get_read_ahead_index(self):
+        """Get the next frame to read ahead, or None when done (lock held)"""
+        if self.cap is None or self.read_ahead_next is None:
+            return None
+        if self.read_ahead.used_bytes + self.frame_bytes > self.read_ahead.max_bytes:
+            return None
+
+        # Skip frames that are already decoded, e.g. on later passes of a loop
+        index = self.read_ahead_next
+        for _ in range(self.total_frames):
+            if index is None:
+                return None
+            if (
+                index not in self.frame_cache.frames
+                and index not in self.read_ahead.frames
+            ):
+                return index
+            index = self._get_following(index, self.read_ahead_stride)
+        return None
+
+    def _run_read_ahead(self):
+        """Decode frames ahead of the requests while they are sequential"""
+        while True:
+            with self.condition:
+                index = self._get_read_ahead_index()
+                while not self.closing and index is None:
+                    self.condition.wait()
+                    index = self._get_read_ahead_index()
+                if self.closing:
+                    return
+                try:
+                    frame = self._decode(index)
+                except Exception as e:
+                    print(f"Error reading ahead: {str(e)}")
+                    frame = None
+                if frame is None:
+                    self.read_ahead_next = None
+                else:
+                    self.read_ahead.put(index, frame)
+                    self.read_ahead_next = self._get_following(
+                        index, self.read_ahead_stride
+                    )
+            # Let requests waiting for the lock in between frames
+            time.sleep(0)
+
     def get_total_frames(self):
         """Get total number of frames in video"""
-        return int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT)) if self.cap else 0
+        return self.total_frames if self.cap else 0
+
+    def get_frame_size(self):
+        """Get the (width, height) of the video frames"""
+        return self.frame_size if self.cap else (0, 0)
+
+    def get_frame_interval(self, rate=1.0):
+        """Get the seconds between frames at a playback rate
+
+        Args:
+            rate (float): Playback speed, 1.0 for real time
+
+        Returns:
+            float: Frame period in seconds
+        """
+        return 1.0 / (self.fps * rate)
 
     def is_playback_ready(self):
         """Check if playback is ready"""
@@ -78,7 +309,7 @@ class PlaybackManager:
         if self.cap is not None:
             self.playing = True
             self.paused = False
-            timer.start(30)  # 30ms for ~30fps
+            timer.start(self.TIMER_INTERVAL_MS)
             return True
         return False
 
@@ -89,7 +320,7 @@ class PlaybackManager:
             if self.paused:
                 timer.stop()
             else:
-                timer.start(30)
+                timer.start(self.TIMER_INTERVAL_MS)
             return True
         return False
 
@@ -103,5 +334,11 @@ class PlaybackManager:
 
     def __del__(self):
         """Clean up video capture object"""
+        with self.condition:
+            self.closing = True
+            self.condition.notify_all()
         if self.cap is not None:
             self.cap.release()
+        if self.video_proxy is not None:
+            self.video_proxy.cancel()
+            self.video_proxy.close()
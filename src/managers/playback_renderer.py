@@ -0,0 +1,333 @@
+import math
+import threading
+import time
+from collections import deque
+from src.managers.visualization_manager import VisualizationManager
+from src.utils.display_utils import fit_size, resize_frame
+
+
+def render_views(
+    visualization_manager,
+    frame,
+    analyzed_data,
+    frame_index,
+    views,
+    heatmap_range,
+    source_size=None,
+):
+    """Render each requested view of a frame at its display size
+
+    Args:
+        visualization_manager (VisualizationManager): Manager to render with,
+            used by one thread only
+        frame (np.ndarray): Decoded BGR frame
+        analyzed_data (list): Per-frame landmark data
+        frame_index (int): Index of the frame
+        views (dict): (width, height) to show each view at
+        heatmap_range (tuple): (start, end) of a range heatmap, or None
+        source_size (tuple): Recording size when frame is the scrubbing
+            proxy, so pixel sizes are drawn at proxy scale
+
+    Returns:
+        dict: BGR frame of each view at its display size
+    """
+    height, width = frame.shape[:2]
+    rendered = {}
+    for view, size in views.items():
+        # Draw at most at the frame size, anything larger is scaled up
+        render_size = fit_size(width, height, size[0], size[1], upscale=False)
+        if view == "trailed":
+            image = visualization_manager.generate_trailed_frame(
+                frame,
+                analyzed_data,
+                frame_index,
+                output_size=render_size,
+                source_size=source_size,
+            )
+        elif view == "heatmap":
+            image = visualization_manager.generate_view_heatmap_frame(
+                frame,
+                analyzed_data,
+                frame_index,
+                heatmap_range,
+                output_size=render_size,
+                source_size=source_size,
+            )
+        else:
+            image = frame
+        rendered[view] = resize_frame(image, size)
+    return rendered
+
+
+class PlaybackFrame:
+    """A decoded and rendered playback frame waiting to be shown"""
+
+    def __init__(self, sequence, frame_index, source_size, views, key):
+        self.sequence = sequence  # Number of frames after the first on the clock
+        self.frame_index = frame_index
+        self.source_size = source_size  # (width, height) of the video
+        self.views = views  # BGR frame of each view, at its display size
+        self.key = key  # Render settings version and views it was rendered for
+
+
+class PlaybackRenderer:
+    """Decodes and renders playback frames ahead of time on a background thread
+
+    A monotonic clock advances one video frame every `frame_interval`
+    seconds (the recording's frame period divided by the playback speed).
+    The worker stays up to RING_SIZE frames ahead of it and keeps the
+    rendered frames in a ring; the GUI thread only takes the newest frame
+    that is due and puts it on the labels. Frames that are late because the
+    GUI was busy are dropped instead of slowing the clock down, and when
+    rendering falls behind the worker skips ahead to the frame that is due.
+
+    Above MAX_DISPLAY_FPS (fast-forward) only every `step`-th frame is
+    rendered; the playback manager skips the frames in between with grab(),
+    which reads without converting the image.
+
+    Frames come from the playback manager, so its caches serve frames that
+    were already decoded, e.g. on later passes of a loop.
+    """
+
+    RING_SIZE = 4
+    MAX_READ_FAILURES = 10
+    MAX_DISPLAY_FPS = 60
+
+    def __init__(self, settings_handler, playback_manager):
+        self.settings_handler = settings_handler
+        self.playback_manager = playback_manager
+        # Own manager, its buffers, trail canvas and heatmap accumulator are
+        # only touched by the worker thread
+        self.visualization_manager = VisualizationManager(settings_handler)
+        self.frame_interval = 1.0 / 30
+        self.step = 1  # Frames advanced per rendered frame
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+        self.ring = deque()
+
+        self.video_path = None
+        self.analyzed_data = []
+        self.views = {}
+        self.heatmap_range = None
+
+        # Clock: frame `sequence` is due frame_interval * (sequence + 1) after
+        # clock_start and shows frame get_frame_index(sequence)
+        self.generation = 0
+        self.clock_start = 0.0
+        self.first_frame = 0
+        self.start_frame = 0
+        self.end_frame = 0
+        self.next_sequence = 0
+
+        self.rendered_frames = 0
+        self.shown_frames = 0
+        self.dropped_frames = 0
+        self.render_time = None  # Smoothed render time per frame (s)
+        self.error = None
+
+    def start(
+        self,
+        analyzed_data,
+        first_frame,
+        start_frame,
+        end_frame,
+        frame_interval,
+        heatmap_index=None,
+    ):
+        """Start rendering from first_frame, looping over [start_frame, end_frame]
+
+        Args:
+            analyzed_data (list): Per-frame landmark data
+            first_frame (int): First frame to render, due one interval from now
+            start_frame (int): First frame of the loop
+            end_frame (int): Last frame of the loop
+            frame_interval (float): Seconds between video frames on the clock
+            heatmap_index (HeatmapIndex): Index built for the live views,
+                shared for range heatmaps
+        """
+        self.stop()
+        self.video_path = self.playback_manager.current_recording_path
+        self.analyzed_data = analyzed_data
+        self.visualization_manager.heatmap_index = heatmap_index
+        self.rendered_frames = 0
+        self.shown_frames = 0
+        self.dropped_frames = 0
+        self.render_time = None
+        self.error = None
+        self.running = True
+        self.restart(first_frame, start_frame, end_frame, frame_interval)
+
+        self.thread = threading.Thread(
+            target=self._run, name="PlaybackRenderer", daemon=True
+        )
+        self.thread.start()
+
+    def restart(self, first_frame, start_frame, end_frame, frame_interval=None):
+        """Continue from another frame, range or speed; drops prefetched frames"""
+        with self.condition:
+            if frame_interval is not None:
+                self.frame_interval = frame_interval
+                self.step = max(
+                    1, round(1.0 / (self.MAX_DISPLAY_FPS * frame_interval))
+                )
+            self.generation += 1
+            self.ring.clear()
+            self.first_frame = first_frame
+            self.start_frame = start_frame
+            self.end_frame = max(start_frame, end_frame)
+            self.playback_manager.set_loop_range(start_frame, self.end_frame)
+            self.next_sequence = 0
+            self.clock_start = time.monotonic()
+            self.condition.notify_all()
+
+    def stop(self):
+        """Stop the worker and wait for it to finish its current frame"""
+        with self.condition:
+            self.running = False
+            self.ring.clear()
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def is_running(self):
+        """Check if the worker is running"""
+        return self.thread is not None
+
+    def set_views(self, views, heatmap_range=None):
+        """Set the views to render and the size each is shown at
+
+        Args:
+            views (dict): (width, height) of "original", "trailed" and/or
+                "heatmap"; views left out are not rendered
+            heatmap_range (tuple): (start, end) of a range heatmap, or None
+                for the trail window
+        """
+        with self.condition:
+            if views != self.views or heatmap_range != self.heatmap_range:
+                self.views = dict(views)
+                self.heatmap_range = heatmap_range
+
+    def get_frame_index(self, sequence):
+        """Get the video frame shown at a position of the clock"""
+        length = self.end_frame - self.start_frame + 1
+        offset = self.first_frame - self.start_frame + sequence
+        return self.start_frame + offset % length
+
+    def get_settings_version(self):
+        """Get the version of the settings the rendered views depend on"""
+        return self.settings_handler.get_version("Trailing", "Heatmap")
+
+    def get_due_sequence(self):
+        """Get the position of the clock (-1 until the first frame is due)"""
+        elapsed = time.monotonic() - self.clock_start
+        return int(elapsed / self.frame_interval) - 1
+
+    def get_due_frame(self):
+        """Take the newest frame that is due, dropping the older ones
+
+        Called from the GUI thread on every timer tick.
+
+        Returns:
+            PlaybackFrame: Frame to show, or None if no new frame is due
+        """
+        with self.condition:
+            due = self.get_due_sequence()
+            due_frames = []
+            while self.ring and self.ring[0].sequence <= due:
+                due_frames.append(self.ring.popleft())
+            if due_frames:
+                self.condition.notify_all()
+
+            # Frames rendered before a settings or layout change are stale
+            key = (self.get_settings_version(), self.views, self.heatmap_range)
+            current = [frame for frame in due_frames if frame.key == key]
+            frame = current[-1] if current else None
+            self.dropped_frames += len(due_frames) - (frame is not None)
+            self.shown_frames += frame is not None
+            return frame
+
+    def get_stats(self):
+        """Get the frame counters for the debug panel and log
+
+        Returns:
+            dict: rendered, shown and dropped frame counts, prefetched frames
+                in the ring and the smoothed render time (ms, or None)
+        """
+        with self.condition:
+            return {
+                "rendered": self.rendered_frames,
+                "shown": self.shown_frames,
+                "dropped": self.dropped_frames,
+                "prefetched": len(self.ring),
+                "render_ms": (
+                    None if self.render_time is None else self.render_time * 1000.0
+                ),
+            }
+
+    def _run(self):
+        read_failures = 0
+        try:
+            while True:
+                with self.condition:
+                    while self.running and len(self.ring) >= self.RING_SIZE:
+                        self.condition.wait()
+                    if not self.running:
+                        return
+
+                    # Skip frames that are already late instead of rendering them
+                    sequence = max(self.next_sequence, self.get_due_sequence())
+                    self.dropped_frames += math.ceil(
+                        (sequence - self.next_sequence) / self.step
+                    )
+                    self.next_sequence = sequence + self.step
+                    frame_index = self.get_frame_index(sequence)
+                    generation = self.generation
+                    views = self.views
+                    heatmap_range = self.heatmap_range
+                    key = (self.get_settings_version(), views, heatmap_range)
+
+                rendered = {}
+                source_size = None
+                start_time = time.perf_counter()
+                if views:
+                    frame = self.playback_manager.get_frame(frame_index)
+                    if frame is None:
+                        read_failures += 1
+                        if read_failures >= self.MAX_READ_FAILURES:
+                            self.error = f"Failed to read frame {frame_index}"
+                            return
+                        with self.condition:
+                            self.dropped_frames += 1
+                        continue
+                    read_failures = 0
+                    source_size = (frame.shape[1], frame.shape[0])
+                    rendered = render_views(
+                        self.visualization_manager,
+                        frame,
+                        self.analyzed_data,
+                        frame_index,
+                        views,
+                        heatmap_range,
+                    )
+                elapsed = time.perf_counter() - start_time
+
+                with self.condition:
+                    if not self.running or generation != self.generation:
+                        continue  # Restarted while rendering
+                    self.ring.append(
+                        PlaybackFrame(
+                            sequence, frame_index, source_size, rendered, key
+                        )
+                    )
+                    if views:
+                        self.rendered_frames += 1
+                        # Exponential moving average keeps the readout stable
+                        self.render_time = (
+                            elapsed
+                            if self.render_time is None
+                            else 0.9 * self.render_time + 0.1 * elapsed
+                        )
+        except Exception as e:
+            self.error = f"Error rendering frame: {str(e)}"
@@ -28,7 +28,12 @@ class RecordingManager:
     def get_recording_list(self):
         return [f for f in os.listdir("src/data/raw_movie") if f.endswith(".mp4")]
 
-    def save_recording(self):
+    def save_recording(self, fps=30):
+        """Save the recorded frames at the rate they were captured at
+
+        Args:
+            fps (float): Capture frame rate written to the movie file
+        """
         if not self.frames:
             return None
 
@@ -42,7 +47,7 @@ class RecordingManager:
         output_path = os.path.join(
             "src/data/raw_movie", f"raw_movie_{self.current_timestamp}.mp4"
         )
-        return save_raw_movie(self.frames, output_path)
+        return save_raw_movie(self.frames, output_path, fps=fps)
 
     def get_current_timestamp(self):
         return self.current_timestamp
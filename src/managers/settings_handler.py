@@ -1,10 +1,21 @@
+import copy
 import json
 
 
 class SettingsHandler:
-    def __init__(self):
+    def __init__(self, settings=None):
+        """
+        Args:
+            settings (dict): Use a copy of these settings instead of loading
+                settings.json, e.g. for a snapshot used by a background export
+        """
         self.settings_file = "settings.json"
-        self.settings = self.load_settings()
+        if settings is None:
+            self.settings = self.load_settings()
+        else:
+            self.settings = copy.deepcopy(settings)
+        # Change count per section, for cache invalidation
+        self.section_versions = {}
 
     def is_valid_resolution(self, width, height):
         """Validate resolution settings"""
@@ -143,6 +154,7 @@ class SettingsHandler:
                 "opacity": 0.3,
                 "black_background": True,
                 "alpha_fade": True,
+                "persistent_canvas": False,
             },
             "Heatmap": {
                 "intensity": 1.5,
@@ -154,11 +166,31 @@ class SettingsHandler:
                 "blur_amount": 20,
                 "black_background": True,
                 "accumulate": False,
+                "range_mode": False,
+                "density_downscale": 4,
             },
             "ViewSettings": {
                 "original_realtime": True,
                 "trailed_realtime": True,
                 "heatmap_realtime": True,
+                "playback_rate": 1.0,
+            },
+            "Recording": {
+                "analyze_while_recording": False,
+            },
+            "Camera": {
+                "fourcc": "MJPG",
+                "fps": 30,
+                "buffer_size": 1,
+                "enable_synthetic": False,
+                "synthetic_source": "",
+                "synthetic_fps": 30,
+            },
+            "Performance": {
+                "render_cache_mb": 256,
+                "frame_cache_mb": 256,
+                "export_workers": 0,
+                "show_debug_panel": False,
             },
         }
 
@@ -182,6 +214,10 @@ class SettingsHandler:
             self.save_settings(settings)
             return settings
 
+    def snapshot(self):
+        """Get an independent handler with a copy of the current settings"""
+        return SettingsHandler(self.settings)
+
     def save_settings(self, settings=None):
         """Save settings to file"""
         if settings is None:
@@ -209,8 +245,21 @@ class SettingsHandler:
                 else self.get_default_settings().get(section, {}).get(key)
             )
 
+    def get_version(self, *sections):
+        """Get a key that changes whenever a setting in the sections changes
+
+        Args:
+            sections (str): Settings section names
+
+        Returns:
+            tuple: Change count of each section
+        """
+        return tuple(self.section_versions.get(section, 0) for section in sections)
+
     def set_setting(self, section, key, value):
         """Set a setting value"""
         if section not in self.settings:
             self.settings[section] = {}
+        if self.settings[section].get(key) != value:
+            self.section_versions[section] = self.section_versions.get(section, 0) + 1
         self.settings[section][key] = value
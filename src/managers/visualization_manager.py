@@ -1,92 +1,172 @@
+import math
+import threading
 import cv2
 import numpy as np
-from src.utils.drawing_utils import get_hand_colors, get_finger_idx
-from src.core.hand_landmarks import LANDMARK_DICT
+from src.utils.drawing_utils import get_landmark_color_table
+from src.utils.heatmap_accumulator import HeatmapAccumulator
+from src.utils.heatmap_index import HeatmapIndex
+from src.utils.landmark_tracks import LandmarkTracks
+from src.utils.render_context import RenderContext
+from src.utils.trail_canvas import TrailCanvas
 
 
 class VisualizationManager:
     def __init__(self, settings_handler):
         self.settings_handler = settings_handler
+        # Shared by the live views; exports pass their own accumulator
+        self.heatmap_accumulator = HeatmapAccumulator()
+        self.heatmap_index = None
+        self.landmark_tracks = None
+        self.trail_canvas = TrailCanvas()
+        self.landmark_colors = np.array(get_landmark_color_table(), dtype=np.float64)
+        # Settings snapshot, scratch buffers and colormap tables
+        self.render_context = RenderContext(settings_handler)
 
-    def generate_trailed_frame(self, current_frame, analyzed_data, current_frame_index):
+    def get_landmark_tracks(self, analyzed_data):
+        """Get the parsed landmark arrays for analyzed_data, building them once"""
+        if self.landmark_tracks is None or not self.landmark_tracks.matches(
+            analyzed_data
+        ):
+            self.landmark_tracks = LandmarkTracks(analyzed_data)
+        return self.landmark_tracks
+
+    def get_output_frame(
+        self, current_frame, output_size, background_name, source_size=None
+    ):
+        """Get the background to render onto at the output size
+
+        Landmark positions are normalized, so rendering at another size only
+        needs the background resized and pixel sizes (landmark size, radius,
+        blur) scaled; nothing is rendered at the source size first.
+
+        Args:
+            current_frame (np.ndarray): Source frame
+            output_size (tuple): (width, height) to render at, or None for
+                the source size
+            background_name (str): Settings section whose black_background
+                option applies
+            source_size (tuple): (width, height) of the recording the pixel
+                size settings refer to, when current_frame is a scaled copy
+                (e.g. the scrubbing proxy); defaults to its own size
+
+        Returns:
+            tuple: (frame, scale) where scale converts source pixel sizes to
+                the output; the frame is only read, never modified
+        """
+        context = self.render_context
+        height, width = current_frame.shape[:2]
+        if output_size is None:
+            output_size = (width, height)
+        output_width, output_height = output_size
+        shape = (output_height, output_width) + current_frame.shape[2:]
+        source_width, source_height = source_size or (width, height)
+        scale = math.sqrt(
+            output_width / source_width * output_height / source_height
+        )
+
+        if context.get_settings(background_name)["black_background"]:
+            return context.get_zeros(f"{background_name}_background", shape), scale
+        if (output_width, output_height) == (width, height):
+            return current_frame, scale
+        frame = cv2.resize(
+            current_frame,
+            (output_width, output_height),
+            dst=context.get_buffer(f"{background_name}_resized", shape),
+            interpolation=cv2.INTER_LINEAR,
+        )
+        return frame, scale
+
+    @staticmethod
+    def scale_size(value, scale):
+        """Scale a pixel size to the output, keeping non-zero sizes at least 1"""
+        if scale == 1.0 or value <= 0:
+            return value
+        return max(1, int(round(value * scale)))
+
+    def generate_trailed_frame(
+        self,
+        current_frame,
+        analyzed_data,
+        current_frame_index,
+        canvas=None,
+        output_size=None,
+        source_size=None,
+    ):
+        """Generate a frame with the trails of the previous landmark positions
+
+        Args:
+            canvas (TrailCanvas): Persistent overlay used when the
+                persistent_canvas setting and alpha fade are on; sequential
+                calls then only stamp the newest frame. Defaults to the
+                shared one.
+            output_size (tuple): (width, height) to render at, defaults to
+                the size of current_frame
+            source_size (tuple): Recording size when current_frame is a
+                scaled copy (see get_output_frame)
+        """
         # Get settings
-        trail_length = self.settings_handler.settings["Trailing"]["trail_length"]
-        landmark_size = self.settings_handler.settings["Trailing"]["landmark_size"]
-        alpha = self.settings_handler.settings["Trailing"]["alpha"]
-        opacity = self.settings_handler.settings["Trailing"]["opacity"]
-        black_background = self.settings_handler.settings["Trailing"][
-            "black_background"
-        ]
-        alpha_fade = self.settings_handler.settings["Trailing"]["alpha_fade"]
-
-        # Create frame based on background setting
-        if black_background:
-            frame = np.zeros_like(current_frame)
-        else:
-            frame = current_frame.copy()
+        context = self.render_context
+        settings = context.get_settings("Trailing")
+        trail_length = settings["trail_length"]
+        alpha = settings["alpha"]
+        opacity = settings["opacity"]
+        alpha_fade = settings["alpha_fade"]
+        persistent_canvas = settings["persistent_canvas"]
+
+        # Background to blend onto, at the output size
+        frame, scale = self.get_output_frame(
+            current_frame, output_size, "Trailing", source_size
+        )
+        landmark_size = self.scale_size(settings["landmark_size"], scale)
+
+        if persistent_canvas and alpha_fade and len(analyzed_data) > 0:
+            # Decaying overlay kept between frames
+            height, width = frame.shape[:2]
+            if canvas is None:
+                canvas = self.trail_canvas
+            overlay = canvas.get_overlay(
+                self.get_landmark_tracks(analyzed_data),
+                np.trunc(self.landmark_colors * alpha),
+                width,
+                height,
+                current_frame_index,
+                trail_length,
+                landmark_size,
+            )
+            return cv2.addWeighted(frame, opacity, overlay, 1.0, 0)
 
         # Create an overlay for the trails
-        overlay = np.zeros_like(frame)
+        overlay = context.get_zeros("trail_overlay", frame.shape)
 
         # Get previous frames' data
         start_idx = max(0, current_frame_index - trail_length)
-        trail_data = analyzed_data[start_idx:current_frame_index]
-
-        # Draw trails for each hand
-        for hand in ["left", "right"]:
-            is_left_hand = hand == "left"
-            hand_colors = get_hand_colors(is_left_hand)
-
-            for frame_idx, trail_frame in enumerate(trail_data):
-                # Calculate fade factor if alpha fade is enabled
-                if alpha_fade:
-                    # Older frames should be more transparent
-                    fade_factor = (frame_idx + 1) / len(trail_data)
-                else:
-                    fade_factor = 1.0
-
-                frame_alpha = alpha * fade_factor
-
-                for landmark_idx, landmark in enumerate(LANDMARK_DICT.values()):
-                    try:
-                        x = trail_frame.get(f"{hand}_{landmark}_x", None)
-                        y = trail_frame.get(f"{hand}_{landmark}_y", None)
-                        if x is not None and y is not None:
-                            try:
-                                x_float = float(
-                                    str(x).split(".")[0] + "." + str(x).split(".")[1]
-                                )
-                                y_float = float(
-                                    str(y).split(".")[0] + "." + str(y).split(".")[1]
-                                )
-                                pos_x = int(x_float * frame.shape[1])
-                                pos_y = int(y_float * frame.shape[0])
-
-                                if (
-                                    0 <= pos_x < frame.shape[1]
-                                    and 0 <= pos_y < frame.shape[0]
-                                ):
-                                    # Get finger color based on landmark index
-                                    finger_idx = get_finger_idx(landmark_idx)
-                                    # Apply fade factor to the color intensity
-                                    color = tuple(
-                                        int(c * frame_alpha)
-                                        for c in hand_colors[finger_idx]
-                                    )
-                                    cv2.circle(
-                                        overlay,
-                                        (pos_x, pos_y),
-                                        landmark_size,
-                                        color,
-                                        -1,
-                                    )
-                            except (ValueError, IndexError):
-                                continue
-                    except Exception as e:
-                        print(
-                            f"Error processing coordinates for {hand}_{landmark}: {e}"
-                        )
-                        continue
+        end_idx = min(max(current_frame_index, start_idx), len(analyzed_data))
+        trail_count = max(0, end_idx - start_idx)
+
+        if trail_count > 0:
+            height, width = frame.shape[:2]
+            pixels, valid = self.get_landmark_tracks(analyzed_data).get_pixels(
+                width, height
+            )
+
+            # Older frames should be more transparent if alpha fade is enabled
+            if alpha_fade:
+                fade = np.arange(1, trail_count + 1) / trail_count
+            else:
+                fade = np.ones(trail_count)
+            frame_alpha = alpha * fade
+            colors = np.trunc(
+                self.landmark_colors[:, np.newaxis, :, :]
+                * frame_alpha[np.newaxis, :, np.newaxis, np.newaxis]
+            ).astype(np.int32)
+
+            # Draw hand by hand, oldest frame first, so newer dots end on top
+            trail_pixels = pixels[start_idx:end_idx].transpose(1, 0, 2, 3)
+            trail_valid = valid[start_idx:end_idx].transpose(1, 0, 2)
+            for position, color in zip(
+                trail_pixels[trail_valid].tolist(), colors[trail_valid].tolist()
+            ):
+                cv2.circle(overlay, position, landmark_size, color, -1)
 
         # Blend with the frame using opacity
         result = cv2.addWeighted(frame, opacity, overlay, 1.0, 0)
@@ -99,23 +179,22 @@ class VisualizationManager:
         current_frame_index,
         start_frame=None,
         end_frame=None,
+        accumulator=None,
+        output_size=None,
+        source_size=None,
     ):
-        # Get heatmap settings
-        radius = self.settings_handler.settings["Heatmap"]["radius"]
-        opacity = self.settings_handler.settings["Heatmap"]["opacity"]
-        color_map = self.settings_handler.settings["Heatmap"]["color_map"]
-        blur_amount = self.settings_handler.settings["Heatmap"]["blur_amount"]
-        black_background = self.settings_handler.settings["Heatmap"]["black_background"]
-        accumulate = self.settings_handler.settings["Heatmap"]["accumulate"]
-
-        # Create frame based on background setting
-        if black_background:
-            frame = np.zeros_like(current_frame)
-        else:
-            frame = current_frame.copy()
+        """Generate a heatmap of landmark positions over a range of frames
 
-        # Create heatmap overlay
-        heatmap = np.zeros(frame.shape[:2], dtype=np.float32)
+        Args:
+            accumulator (HeatmapAccumulator): Running heatmap state to update;
+                sequential calls with one accumulator only process the frames
+                entering and leaving the range. Defaults to the shared one.
+            output_size (tuple): (width, height) to render at, defaults to
+                the size of current_frame
+            source_size (tuple): Recording size when current_frame is a
+                scaled copy (see get_output_frame)
+        """
+        accumulate = self.render_context.get_settings("Heatmap")["accumulate"]
 
         # Determine frame range based on accumulate setting and provided range
         if start_frame is None and end_frame is None:
@@ -127,64 +206,197 @@ class VisualizationManager:
             start_frame = start_frame if accumulate else current_frame_index
             end_frame = end_frame if end_frame is not None else current_frame_index
 
-        # Create a list of coordinates for all landmarks
-        coordinates = []
-        for frame_dict in analyzed_data[start_frame : end_frame + 1]:
-            for hand in ["left", "right"]:
-                for landmark in LANDMARK_DICT.values():
-                    x = frame_dict.get(f"{hand}_{landmark}_x")
-                    y = frame_dict.get(f"{hand}_{landmark}_y")
-                    if x is not None and y is not None:
-                        try:
-                            x_float = float(
-                                str(x).split(".")[0] + "." + str(x).split(".")[1]
-                            )
-                            y_float = float(
-                                str(y).split(".")[0] + "." + str(y).split(".")[1]
-                            )
-                            pos_x = int(x_float * heatmap.shape[1])
-                            pos_y = int(y_float * heatmap.shape[0])
-                            if (
-                                0 <= pos_x < heatmap.shape[1]
-                                and 0 <= pos_y < heatmap.shape[0]
-                            ):
-                                coordinates.append((pos_x, pos_y))
-                        except (ValueError, IndexError):
-                            continue
-
-        # Draw all circles with the specified radius
-        for pos_x, pos_y in coordinates:
-            cv2.circle(heatmap, (pos_x, pos_y), radius, 1, -1)
-
-        # Apply Gaussian blur with specified amount
-        if blur_amount > 0:
-            heatmap = cv2.GaussianBlur(
-                heatmap, (blur_amount * 2 + 1, blur_amount * 2 + 1), 0
+        if accumulator is None:
+            accumulator = self.heatmap_accumulator
+        return self._render_heatmap(
+            current_frame,
+            analyzed_data,
+            start_frame,
+            end_frame,
+            accumulator,
+            output_size,
+            source_size,
+        )
+
+    def generate_range_heatmap_frame(
+        self,
+        current_frame,
+        analyzed_data,
+        start_frame,
+        end_frame,
+        output_size=None,
+        source_size=None,
+    ):
+        """Generate a heatmap accumulated over an arbitrary frame range
+
+        Uses the heatmap index when it is built for this data and frame size,
+        so the cost doesn't depend on the range length; until then it falls
+        back to the exact accumulator.
+        """
+        # The index is built for the recording's size, not a scaled copy's
+        width, height = source_size or (current_frame.shape[1], current_frame.shape[0])
+        source = self.get_heatmap_index(analyzed_data, width, height)
+        if source is None:
+            source = self.heatmap_accumulator
+        return self._render_heatmap(
+            current_frame,
+            analyzed_data,
+            start_frame,
+            end_frame,
+            source,
+            output_size,
+            source_size,
+        )
+
+    def generate_view_heatmap_frame(
+        self,
+        current_frame,
+        analyzed_data,
+        current_frame_index,
+        frame_range=None,
+        output_size=None,
+        source_size=None,
+    ):
+        """Generate the heatmap shown in the heatmap and mixed views
+
+        Args:
+            frame_range (tuple): (start, end) to show everything in a range
+                ("Heatmap of Selected Range"), or None for the trail window
+                ending at the current frame
+            output_size (tuple): (width, height) to render at, defaults to
+                the size of current_frame
+            source_size (tuple): Recording size when current_frame is a
+                scaled copy (see get_output_frame)
+        """
+        if frame_range is not None:
+            return self.generate_range_heatmap_frame(
+                current_frame,
+                analyzed_data,
+                frame_range[0],
+                frame_range[1],
+                output_size=output_size,
+                source_size=source_size,
+            )
+
+        trail_length = self.render_context.get_settings("Trailing")["trail_length"]
+        return self.generate_heatmap_frame(
+            current_frame,
+            analyzed_data,
+            current_frame_index,
+            start_frame=max(0, current_frame_index - trail_length),
+            end_frame=current_frame_index,
+            output_size=output_size,
+            source_size=source_size,
+        )
+
+    def build_heatmap_index(self, analyzed_data, width, height):
+        """Start building the range heatmap index on a background thread"""
+        if self.heatmap_index is not None:
+            if self.heatmap_index.matches(analyzed_data, width, height):
+                return
+            self.heatmap_index.cancel()
+
+        self.heatmap_index = HeatmapIndex(analyzed_data, width, height)
+        threading.Thread(
+            target=self.heatmap_index.build, name="HeatmapIndex", daemon=True
+        ).start()
+
+    def get_heatmap_index(self, analyzed_data, width, height):
+        """Get the heatmap index if it is ready for this data and frame size"""
+        index = self.heatmap_index
+        if index is not None and index.ready and index.matches(
+            analyzed_data, width, height
+        ):
+            return index
+        return None
+
+    def _render_heatmap(
+        self,
+        current_frame,
+        analyzed_data,
+        start_frame,
+        end_frame,
+        source,
+        output_size=None,
+        source_size=None,
+    ):
+        """Render the heatmap of frames [start_frame, end_frame] over the frame"""
+        # Get heatmap settings
+        context = self.render_context
+        settings = context.get_settings("Heatmap")
+        opacity = settings["opacity"]
+        color_map = settings["color_map"]
+        downscale = settings["density_downscale"]
+
+        # Background to blend onto, at the output size
+        frame, scale = self.get_output_frame(
+            current_frame, output_size, "Heatmap", source_size
+        )
+        radius = self.scale_size(settings["radius"], scale)
+        blur_amount = self.scale_size(settings["blur_amount"], scale)
+
+        if downscale > 1:
+            # Splat and blur on a coarse grid
+            height, width = frame.shape[:2]
+            grid_shape = (math.ceil(height / downscale), math.ceil(width / downscale))
+            heatmap = source.get_mask(
+                analyzed_data,
+                grid_shape,
+                int(round(radius / downscale)),
+                start_frame,
+                end_frame,
             )
+            if blur_amount > 0:
+                # Sigma OpenCV derives for the full resolution kernel, scaled
+                ksize = blur_amount * 2 + 1
+                sigma = 0.3 * ((ksize - 1) * 0.5 - 1) + 0.8
+                heatmap = cv2.GaussianBlur(
+                    heatmap,
+                    (0, 0),
+                    sigma / downscale,
+                    dst=context.get_buffer("heatmap_blur", heatmap.shape, np.float32),
+                )
+        else:
+            # Landmark circles of all frames in the range
+            heatmap = source.get_mask(
+                analyzed_data, frame.shape[:2], radius, start_frame, end_frame
+            )
+
+            # Apply Gaussian blur with specified amount
+            if blur_amount > 0:
+                heatmap = cv2.GaussianBlur(
+                    heatmap,
+                    (blur_amount * 2 + 1, blur_amount * 2 + 1),
+                    0,
+                    dst=context.get_buffer("heatmap_blur", heatmap.shape, np.float32),
+                )
 
         # Normalize and apply colormap
         if np.max(heatmap) > 0:
-            # Normalize to 0-255
-            heatmap = cv2.normalize(heatmap, None, 0, 255, cv2.NORM_MINMAX).astype(
-                np.uint8
+            # Normalize to 0-255, truncating to uint8
+            normalized = cv2.normalize(
+                heatmap,
+                context.get_buffer("heatmap_normalized", heatmap.shape, np.float32),
+                0,
+                255,
+                cv2.NORM_MINMAX,
             )
+            heatmap = context.get_buffer("heatmap_gray", heatmap.shape)
+            np.copyto(heatmap, normalized, casting="unsafe")
+            if heatmap.shape[:2] != frame.shape[:2]:
+                # Coarse density: upsample once, right before the colormap
+                heatmap = cv2.resize(
+                    heatmap,
+                    (frame.shape[1], frame.shape[0]),
+                    dst=context.get_buffer("heatmap_full", frame.shape[:2]),
+                    interpolation=cv2.INTER_LINEAR,
+                )
 
             # Apply selected colormap
-            colormap_dict = {
-                "jet": cv2.COLORMAP_JET,
-                "hot": cv2.COLORMAP_HOT,
-                "rainbow": cv2.COLORMAP_RAINBOW,
-                "ocean": cv2.COLORMAP_OCEAN,
-                "viridis": cv2.COLORMAP_VIRIDIS,
-                "plasma": cv2.COLORMAP_PLASMA,
-                "magma": cv2.COLORMAP_MAGMA,
-                "inferno": cv2.COLORMAP_INFERNO,
-            }
-            colormap_value = colormap_dict.get(color_map, cv2.COLORMAP_JET)
-            heatmap_colored = cv2.applyColorMap(heatmap, colormap_value)
+            heatmap_colored = context.apply_colormap(heatmap, color_map)
 
             # Blend with original frame using specified opacity
             result = cv2.addWeighted(frame, 1 - opacity, heatmap_colored, opacity, 0)
             return result
 
-        return frame
+        return frame.copy()
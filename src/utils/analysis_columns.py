@@ -0,0 +1,89 @@
+import numpy as np
+from src.core.hand_landmarks import LANDMARK_DICT, STATS_DICT
+
+HANDS = ["left", "right"]
+
+
+def parse_table_value(value):
+    """Parse a landmark coordinate the way the landmark tables show it
+
+    Returns:
+        float: The coordinate, NaN if it is missing, zero or not a number
+    """
+    if not value:
+        return np.nan
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+class AnalysisColumns:
+    """Per-frame values of the landmark and stats tables as arrays
+
+    The analysis rows are dicts keyed by CSV column. They are read once into
+    a (frames, 2 hands, 21 landmarks, x/y/z) float array, NaN for landmarks
+    the tables leave empty, and a (frames, stats, 2 hands) array of the raw
+    stat values, so showing a frame is an array lookup instead of parsing
+    the row again.
+    """
+
+    def __init__(self, analyzed_data):
+        self.data = analyzed_data
+        self.data_length = len(analyzed_data)
+        self.frame_numbers = np.array(
+            [frame_dict.get("frame", 0) for frame_dict in analyzed_data],
+            dtype=object,
+        )
+
+        self.landmarks = np.full(
+            (self.data_length, len(HANDS), len(LANDMARK_DICT), 3), np.nan
+        )
+        for hand_idx, hand in enumerate(HANDS):
+            for landmark_idx, landmark in enumerate(LANDMARK_DICT.values()):
+                for axis, suffix in enumerate(["x", "y", "z"]):
+                    key = f"{hand}_{landmark}_{suffix}"
+                    self.landmarks[:, hand_idx, landmark_idx, axis] = [
+                        parse_table_value(frame_dict.get(key))
+                        for frame_dict in analyzed_data
+                    ]
+        # A landmark is shown only with all three coordinates
+        missing = np.isnan(self.landmarks).any(axis=-1)
+        self.landmarks[missing] = np.nan
+
+        self.stats = np.empty(
+            (self.data_length, len(STATS_DICT), len(HANDS)), dtype=object
+        )
+        for hand_idx, hand in enumerate(HANDS):
+            for stat_idx, stat_key in enumerate(STATS_DICT):
+                key = f"{hand}_{stat_key}"
+                self.stats[:, stat_idx, hand_idx] = [
+                    frame_dict.get(key) for frame_dict in analyzed_data
+                ]
+
+    def matches(self, analyzed_data):
+        """Check if the columns were built from this data"""
+        return analyzed_data is self.data and len(analyzed_data) == self.data_length
+
+    def get_landmark_values(self, frame_index, hand):
+        """Get the landmark table cells of a frame
+
+        Returns:
+            np.ndarray: (21, 4) object array of frame number, x, y and z,
+                None where a landmark is missing
+        """
+        hand_idx = HANDS.index(hand)
+        values = np.empty((len(LANDMARK_DICT), 4), dtype=object)
+        coordinates = self.landmarks[frame_index, hand_idx]
+        values[:, 1:] = coordinates
+        values[:, 1:][np.isnan(coordinates)] = None
+        values[:, 0] = self.frame_numbers[frame_index]
+        return values
+
+    def get_stat_values(self, frame_index):
+        """Get the stats table cells of a frame
+
+        Returns:
+            np.ndarray: (stats, 2) object array of left and right values
+        """
+        return self.stats[frame_index]
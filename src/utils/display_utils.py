@@ -0,0 +1,67 @@
+import cv2
+import numpy as np
+from PyQt5.QtGui import QImage, QPixmap
+
+
+def fit_size(width, height, max_width, max_height, upscale=True):
+    """Get the largest size with the frame's aspect ratio inside a box
+
+    Args:
+        width (int): Frame width
+        height (int): Frame height
+        max_width (int): Box width
+        max_height (int): Box height
+        upscale (bool): Allow sizes larger than the frame
+
+    Returns:
+        tuple: (width, height), at least 1x1
+    """
+    scale = min(max_width / width, max_height / height)
+    if not upscale:
+        scale = min(scale, 1.0)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def bgr_to_qimage(frame):
+    """Wrap a BGR frame in a QImage without copying or converting it
+
+    The QImage shares the array's memory, so the array must stay alive and
+    unchanged for as long as the image is used.
+    """
+    if not frame.flags["C_CONTIGUOUS"]:
+        frame = np.ascontiguousarray(frame)
+    height, width = frame.shape[:2]
+    return QImage(frame.data, width, height, frame.strides[0], QImage.Format_BGR888)
+
+
+def resize_frame(frame, size):
+    """Scale a frame to its display size, returning it as is if it already fits
+
+    Args:
+        frame (np.ndarray): BGR frame
+        size (tuple): (width, height) to show it at, or None for the frame size
+
+    Returns:
+        np.ndarray: The scaled frame
+    """
+    height, width = frame.shape[:2]
+    if size is None or tuple(size) == (width, height):
+        return frame
+    # Area averaging is cheap only for whole-number shrink factors,
+    # bilinear (like Qt's smooth scaling) is several times faster otherwise
+    whole_factor = width % size[0] == 0 and height % size[1] == 0
+    interpolation = cv2.INTER_AREA if whole_factor else cv2.INTER_LINEAR
+    return cv2.resize(frame, tuple(size), interpolation=interpolation)
+
+
+def frame_to_pixmap(frame, size=None):
+    """Scale a BGR frame once to its display size and turn it into a pixmap
+
+    Args:
+        frame (np.ndarray): BGR frame
+        size (tuple): (width, height) to show it at, or None for the frame size
+
+    Returns:
+        QPixmap: The pixmap to put on a label
+    """
+    return QPixmap.fromImage(bgr_to_qimage(resize_frame(frame, size)))
@@ -32,3 +32,14 @@ def get_hand_colors(is_left_hand):
             (255, 128, 0),  # Ring (Light Blue)
             (128, 255, 0),  # Pinky (Lime)
         ]
+
+
+def get_landmark_color_table():
+    """Get the base color of every landmark, indexed [hand][landmark]
+
+    Hand 0 is the left hand and hand 1 the right, matching get_hand_colors.
+    """
+    return [
+        [get_hand_colors(is_left_hand)[get_finger_idx(idx)] for idx in range(21)]
+        for is_left_hand in [True, False]
+    ]
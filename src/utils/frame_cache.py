@@ -0,0 +1,72 @@
+from collections import OrderedDict
+
+
+class FrameCache:
+    """Least-recently-used cache of rendered frames with a memory budget
+
+    Frames are numpy arrays; their nbytes count against max_bytes and the
+    least recently used ones are evicted once the budget is exceeded.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.frames = OrderedDict()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Get a cached frame, or None on a miss"""
+        frame = self.frames.get(key)
+        if frame is None:
+            self.misses += 1
+            return None
+        self.frames.move_to_end(key)
+        self.hits += 1
+        return frame
+
+    def pop(self, key):
+        """Remove and return a cached frame, or None on a miss"""
+        frame = self.frames.pop(key, None)
+        if frame is None:
+            self.misses += 1
+            return None
+        self.used_bytes -= frame.nbytes
+        self.hits += 1
+        return frame
+
+    def put(self, key, frame):
+        """Store a frame, evicting old ones to stay within the budget"""
+        if frame.nbytes > self.max_bytes:
+            return
+        if key in self.frames:
+            self.used_bytes -= self.frames.pop(key).nbytes
+        self.frames[key] = frame
+        self.used_bytes += frame.nbytes
+        while self.used_bytes > self.max_bytes:
+            _, evicted = self.frames.popitem(last=False)
+            self.used_bytes -= evicted.nbytes
+
+    def clear(self):
+        """Drop all frames, keeping the hit/miss counters"""
+        self.frames.clear()
+        self.used_bytes = 0
+
+    def set_max_bytes(self, max_bytes):
+        """Change the budget, evicting frames if it shrank"""
+        self.max_bytes = max_bytes
+        while self.used_bytes > self.max_bytes and self.frames:
+            _, evicted = self.frames.popitem(last=False)
+            self.used_bytes -= evicted.nbytes
+
+    def get_stats(self):
+        """Get hit/miss counts, hit rate and memory use"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.frames),
+            "used_bytes": self.used_bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,181 @@
+import cv2
+import numpy as np
+from src.core.hand_landmarks import LANDMARK_DICT
+
+
+def parse_coordinate(value):
+    """Parse a normalized landmark coordinate the way the CSV views do
+
+    Returns:
+        float or None: The coordinate, or None if it can't be parsed
+    """
+    try:
+        parts = str(value).split(".")
+        return float(parts[0] + "." + parts[1])
+    except (ValueError, IndexError):
+        return None
+
+
+def get_frame_points(frame_dict, width, height):
+    """Get the pixel positions of all landmarks of both hands in a frame
+
+    Returns:
+        np.ndarray: (N, 2) int array of x, y positions inside the frame
+    """
+    points = []
+    for hand in ["left", "right"]:
+        for landmark in LANDMARK_DICT.values():
+            x = frame_dict.get(f"{hand}_{landmark}_x")
+            y = frame_dict.get(f"{hand}_{landmark}_y")
+            if x is None or y is None:
+                continue
+            x_float = parse_coordinate(x)
+            y_float = parse_coordinate(y)
+            if x_float is None or y_float is None:
+                continue
+            pos_x = int(x_float * width)
+            pos_y = int(y_float * height)
+            if 0 <= pos_x < width and 0 <= pos_y < height:
+                points.append((pos_x, pos_y))
+    return np.array(points, dtype=np.int32).reshape(-1, 2)
+
+
+class HeatmapAccumulator:
+    """Running heatmap coverage over a sliding range of analyzed frames
+
+    Every landmark stamps a filled disk of the heatmap radius into a
+    per-pixel coverage count. Moving the frame range only adds the frames
+    entering it and subtracts the frames leaving it, so sequential playback
+    and export cost the same per frame whatever the range length. Pixels
+    with a non-zero count form exactly the mask the circle-drawing heatmap
+    produced; blur, normalize and colormap run only when a frame is output.
+
+    Jumps that would touch more frames than a rebuild (seeks, new data,
+    other resolution or radius) start over from an empty buffer.
+    """
+
+    def __init__(self):
+        self.coverage = None
+        self.data = None
+        self.data_length = 0
+        self.shape = None
+        self.radius = None
+        self.disk = None
+        self.points = {}  # Parsed landmark pixels per frame index
+        self.start = 0
+        self.end = -1  # Inclusive, empty range
+
+    def reset(self):
+        """Drop all accumulated frames"""
+        if self.coverage is not None:
+            self.coverage.fill(0)
+        self.start = 0
+        self.end = -1
+
+    def get_mask(self, analyzed_data, shape, radius, start_frame, end_frame):
+        """Get the heatmap coverage for analyzed_data[start_frame:end_frame + 1]
+
+        Args:
+            analyzed_data (list): Per-frame landmark dicts
+            shape (tuple): (height, width) of the heatmap
+            radius (int): Radius of each landmark disk
+            start_frame (int): First frame of the range
+            end_frame (int): Last frame of the range (inclusive)
+
+        Returns:
+            np.ndarray: float32 mask, 1 where any landmark disk covers the pixel
+        """
+        self._prepare(analyzed_data, tuple(shape[:2]), radius)
+
+        start = max(0, start_frame)
+        end = min(end_frame, len(analyzed_data) - 1)
+        if end < start:
+            self.reset()
+        else:
+            self._move_to(start, end)
+
+        return (self.coverage > 0).astype(np.float32)
+
+    def _prepare(self, analyzed_data, shape, radius):
+        """Start over if the data, resolution or radius changed"""
+        if (
+            analyzed_data is self.data
+            and len(analyzed_data) == self.data_length
+            and shape == self.shape
+            and radius == self.radius
+        ):
+            return
+
+        if (
+            analyzed_data is not self.data
+            or len(analyzed_data) != self.data_length
+            or shape != self.shape
+        ):
+            self.points = {}
+        self.data = analyzed_data
+        self.data_length = len(analyzed_data)
+        self.shape = shape
+        self.radius = radius
+
+        # Same pixels cv2.circle fills for any integer center
+        size = radius * 2 + 1
+        self.disk = np.zeros((size, size), dtype=np.uint8)
+        cv2.circle(self.disk, (radius, radius), radius, 1, -1)
+        self.disk = self.disk.astype(np.int32)
+
+        self.coverage = np.zeros(shape, dtype=np.int32)
+        self.start = 0
+        self.end = -1
+
+    def _move_to(self, start, end):
+        """Shift the accumulated range to [start, end] with the fewest updates"""
+        if self.end < self.start:
+            changed = end - start + 1
+        else:
+            overlap = max(0, min(end, self.end) - max(start, self.start) + 1)
+            changed = (self.end - self.start + 1 - overlap) + (
+                end - start + 1 - overlap
+            )
+
+        if self.end < self.start or changed > end - start + 1:
+            # Rebuilding is cheaper than walking across the gap
+            self.reset()
+            for index in range(start, end + 1):
+                self._stamp(index, 1)
+        else:
+            for index in range(self.start, self.end + 1):
+                if index < start or index > end:
+                    self._stamp(index, -1)
+            for index in range(start, end + 1):
+                if index < self.start or index > self.end:
+                    self._stamp(index, 1)
+
+        self.start = start
+        self.end = end
+
+    def _get_points(self, index):
+        points = self.points.get(index)
+        if points is None:
+            height, width = self.shape
+            points = get_frame_points(self.data[index], width, height)
+            self.points[index] = points
+        return points
+
+    def _stamp(self, index, sign):
+        """Add (sign=1) or remove (sign=-1) one frame's landmark disks"""
+        height, width = self.shape
+        r = self.radius
+        for pos_x, pos_y in self._get_points(index):
+            # Clip the disk at the frame border
+            x0, y0 = pos_x - r, pos_y - r
+            x1, y1 = pos_x + r + 1, pos_y + r + 1
+            dx0, dy0 = max(0, -x0), max(0, -y0)
+            dx1 = self.disk.shape[1] - max(0, x1 - width)
+            dy1 = self.disk.shape[0] - max(0, y1 - height)
+            region = self.coverage[
+                max(0, y0) : min(height, y1), max(0, x0) : min(width, x1)
+            ]
+            if sign > 0:
+                region += self.disk[dy0:dy1, dx0:dx1]
+            else:
+                region -= self.disk[dy0:dy1, dx0:dx1]
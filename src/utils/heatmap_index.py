@@ -0,0 +1,133 @@
+import math
+import cv2
+import numpy as np
+from src.utils.heatmap_accumulator import get_frame_points
+
+
+class HeatmapIndex:
+    """Cumulative landmark counts for heatmaps over arbitrary frame ranges
+
+    Landmark hits are counted on a grid `scale` times smaller than the
+    frame. Every `interval` frames a checkpoint stores the cumulative count
+    of all frames before it, so the counts of any [start, end] range are
+    the difference of two checkpoints plus the few frames between each end
+    and its nearest checkpoint. The interval grows with the recording so
+    the checkpoints stay within `max_bytes`.
+
+    The coverage mask is built on the coarse grid and scaled up, which is
+    close to but not pixel-identical with the full resolution heatmap; it is
+    meant for interactive range selection, exports keep the exact path.
+    """
+
+    def __init__(self, analyzed_data, width, height, scale=4, max_bytes=64 << 20):
+        self.data = analyzed_data
+        self.data_length = len(analyzed_data)
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.grid_width = math.ceil(width / scale)
+        self.grid_height = math.ceil(height / scale)
+        self.grid_size = self.grid_width * self.grid_height
+
+        grid_bytes = self.grid_size * np.dtype(np.int32).itemsize
+        max_checkpoints = max(2, max_bytes // grid_bytes)
+        self.interval = max(16, math.ceil(self.data_length / (max_checkpoints - 1)))
+
+        self.points = None  # Flat grid index of every landmark hit
+        self.offsets = None  # Frame i owns points[offsets[i]:offsets[i + 1]]
+        self.checkpoints = []
+        self.ready = False
+        self.cancelled = False
+
+    def matches(self, analyzed_data, width, height):
+        """Check if the index was built for this data and frame size"""
+        return (
+            analyzed_data is self.data
+            and len(analyzed_data) == self.data_length
+            and (width, height) == (self.width, self.height)
+        )
+
+    def cancel(self):
+        """Stop a build running on another thread"""
+        self.cancelled = True
+
+    def build(self):
+        """Parse all frames and compute the checkpoints (may run on a thread)"""
+        try:
+            flat_points = []
+            offsets = np.zeros(self.data_length + 1, dtype=np.int64)
+            for index, frame_dict in enumerate(self.data):
+                if self.cancelled:
+                    return
+                points = get_frame_points(frame_dict, self.width, self.height)
+                grid = points // self.scale
+                flat_points.append(grid[:, 1] * self.grid_width + grid[:, 0])
+                offsets[index + 1] = offsets[index] + len(points)
+
+            self.points = (
+                np.concatenate(flat_points).astype(np.int64)
+                if flat_points
+                else np.zeros(0, dtype=np.int64)
+            )
+            self.offsets = offsets
+
+            counts = np.zeros(self.grid_size, dtype=np.int32)
+            checkpoints = [counts.copy()]
+            for start in range(0, self.data_length, self.interval):
+                if self.cancelled:
+                    return
+                end = min(start + self.interval, self.data_length)
+                counts += self._count(start, end)
+                checkpoints.append(counts.copy())
+            self.checkpoints = checkpoints
+            self.ready = True
+        except Exception as e:
+            print(f"Error building heatmap index: {str(e)}")
+
+    def _count(self, start, end):
+        """Landmark counts of frames [start, end)"""
+        points = self.points[self.offsets[start] : self.offsets[end]]
+        return np.bincount(points, minlength=self.grid_size).astype(np.int32)
+
+    def _prefix(self, frame):
+        """Cumulative counts of frames [0, frame) from the nearest checkpoint"""
+        below = frame // self.interval
+        below_frame = below * self.interval
+        above = below + 1
+        above_frame = min(above * self.interval, self.data_length)
+
+        if above < len(self.checkpoints) and above_frame - frame < frame - below_frame:
+            return self.checkpoints[above] - self._count(frame, above_frame)
+        if frame == below_frame:
+            return self.checkpoints[below]
+        return self.checkpoints[below] + self._count(below_frame, frame)
+
+    def get_counts(self, start_frame, end_frame):
+        """Get landmark counts on the coarse grid for frames [start, end]"""
+        start = max(0, start_frame)
+        end = min(end_frame, self.data_length - 1)
+        if end < start:
+            return np.zeros((self.grid_height, self.grid_width), dtype=np.int32)
+        counts = self._prefix(end + 1) - self._prefix(start)
+        return counts.reshape(self.grid_height, self.grid_width)
+
+    def get_mask(self, analyzed_data, shape, radius, start_frame, end_frame):
+        """Get the heatmap coverage for a frame range, scaled to `shape`
+
+        Same interface as HeatmapAccumulator.get_mask, so either can be
+        passed to VisualizationManager.generate_heatmap_frame.
+        """
+        counts = self.get_counts(start_frame, end_frame)
+        mask = (counts > 0).astype(np.uint8)
+
+        # Radius is given in pixels of the requested shape
+        height, width = shape[:2]
+        grid_radius = max(0, int(round(radius * self.grid_width / width)))
+        if grid_radius > 0:
+            disk = np.zeros((grid_radius * 2 + 1,) * 2, dtype=np.uint8)
+            cv2.circle(disk, (grid_radius, grid_radius), grid_radius, 1, -1)
+            mask = cv2.dilate(mask, disk)
+
+        return cv2.resize(
+            mask.astype(np.float32), (width, height), interpolation=cv2.INTER_LINEAR
+        )
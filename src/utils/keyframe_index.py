@@ -0,0 +1,127 @@
+import bisect
+import json
+import os
+import cv2
+
+
+class KeyframeIndex:
+    """Keyframe numbers of a video, to choose between grab() and a seek
+
+    A seek with CAP_PROP_POS_FRAMES makes OpenCV jump back to a keyframe
+    before the target and decode forward to it, which on mp4v recordings
+    costs as much as decoding a few dozen frames wherever it lands. When the
+    capture is already at or past the keyframe the target frame depends on,
+    grabbing forward never decodes more than the seek would and counts the
+    frames exactly, so such jumps grab instead; short forward gaps grab too.
+
+    The keyframes come from one scan over the compressed packets (nothing is
+    decoded) and are saved as JSON in `index_folder`, tied to the video's
+    size and modification time. Until the index is ready, seeks fall back
+    to grabbing short gaps only.
+    """
+
+    MAX_GRAB_FRAMES = 16  # Forward gaps grabbed even without the index
+
+    def __init__(self, video_path, index_folder="src/data/keyframe_index"):
+        self.video_path = video_path
+        self.index_path = os.path.join(
+            index_folder, os.path.basename(video_path) + ".json"
+        )
+        self.keyframes = []
+        self.frame_count = 0
+        self.ready = False
+
+    def get_keyframe(self, frame_index):
+        """Get the last keyframe at or before frame_index"""
+        position = bisect.bisect_right(self.keyframes, frame_index) - 1
+        return self.keyframes[max(0, position)]
+
+    def seek(self, cap, frame_index, position=None):
+        """Position a capture of this video so its next read returns frame_index
+
+        Args:
+            cap (cv2.VideoCapture): Capture to move
+            frame_index (int): Frame to read next
+            position (int): Frame the capture reads next now, None if unknown
+        """
+        if position == frame_index:
+            return
+        if position is not None and position < frame_index:
+            gap = frame_index - position
+            if gap <= self.MAX_GRAB_FRAMES or (
+                self.ready and position >= self.get_keyframe(frame_index)
+            ):
+                for _ in range(gap):
+                    cap.grab()
+                return
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+
+    def load_or_build(self):
+        """Load the saved index, or scan the video and save it (may run on a thread)"""
+        try:
+            if not self.load():
+                self.build()
+                self.save()
+        except Exception as e:
+            print(f"Error building keyframe index: {str(e)}")
+
+    def get_signature(self):
+        """Get what identifies the video file the index belongs to"""
+        stat = os.stat(self.video_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def load(self):
+        """Load the saved index if it matches the video
+
+        Returns:
+            bool: True if the index is ready
+        """
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+            if data.get("signature") != self.get_signature():
+                return False
+            self.keyframes = data["keyframes"]
+            self.frame_count = data["frame_count"]
+            self.ready = bool(self.keyframes)
+            return self.ready
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def build(self):
+        """Scan the video's packets for keyframes"""
+        cap = cv2.VideoCapture(self.video_path)
+        try:
+            # Raw mode: grab() reads compressed packets without decoding them
+            if not cap.isOpened() or not cap.set(cv2.CAP_PROP_FORMAT, -1):
+                print(f"Cannot scan keyframes of {self.video_path}")
+                return
+            keyframes = []
+            frame_count = 0
+            while cap.grab():
+                if cap.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                    keyframes.append(frame_count)
+                frame_count += 1
+        finally:
+            cap.release()
+
+        if keyframes:
+            self.keyframes = keyframes
+            self.frame_count = frame_count
+            self.ready = True
+
+    def save(self):
+        """Save the index next to the other recording data"""
+        if not self.ready:
+            return
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        with open(self.index_path, "w") as f:
+            json.dump(
+                {
+                    "video": os.path.basename(self.video_path),
+                    "signature": self.get_signature(),
+                    "frame_count": self.frame_count,
+                    "keyframes": self.keyframes,
+                },
+                f,
+            )
@@ -0,0 +1,66 @@
+import numpy as np
+from src.core.hand_landmarks import LANDMARK_DICT
+from src.utils.heatmap_accumulator import parse_coordinate
+
+HANDS = ["left", "right"]
+
+
+class LandmarkTracks:
+    """Landmark positions of a whole recording as arrays
+
+    The CSV rows hold every coordinate as a separate value that used to be
+    re-parsed on each drawn frame. Here they are parsed once into a
+    (frames, 2 hands, 21 landmarks, x/y) array, NaN where a landmark is
+    missing, and pixel positions are cached per output resolution.
+    """
+
+    def __init__(self, analyzed_data):
+        self.data = analyzed_data
+        self.data_length = len(analyzed_data)
+        self.coordinates = np.full(
+            (self.data_length, len(HANDS), len(LANDMARK_DICT), 2), np.nan
+        )
+        for hand_idx, hand in enumerate(HANDS):
+            for landmark_idx, landmark in enumerate(LANDMARK_DICT.values()):
+                for axis, suffix in enumerate(["x", "y"]):
+                    key = f"{hand}_{landmark}_{suffix}"
+                    values = [frame_dict.get(key) for frame_dict in analyzed_data]
+                    self.coordinates[:, hand_idx, landmark_idx, axis] = [
+                        np.nan if value is None else self._parse(value)
+                        for value in values
+                    ]
+        self.pixel_cache = {}
+
+    @staticmethod
+    def _parse(value):
+        parsed = parse_coordinate(value)
+        return np.nan if parsed is None else parsed
+
+    def matches(self, analyzed_data):
+        """Check if the tracks were built from this data"""
+        return analyzed_data is self.data and len(analyzed_data) == self.data_length
+
+    def get_pixels(self, width, height):
+        """Get pixel positions for a frame size
+
+        Returns:
+            tuple: (pixels, valid) where pixels is an int32 array shaped like
+                the coordinates and valid marks landmarks inside the frame
+        """
+        key = (width, height)
+        if key not in self.pixel_cache:
+            present = ~np.isnan(self.coordinates).any(axis=-1)
+            scaled = np.nan_to_num(self.coordinates) * np.array([width, height])
+            # Keep far out-of-frame values from overflowing the int cast
+            scaled = np.clip(scaled, -1, np.array([width, height]))
+            # Truncate toward zero like int(), so -0.5 px still lands on column 0
+            pixels = np.trunc(scaled).astype(np.int32)
+            valid = (
+                present
+                & (pixels[..., 0] >= 0)
+                & (pixels[..., 0] < width)
+                & (pixels[..., 1] >= 0)
+                & (pixels[..., 1] < height)
+            )
+            self.pixel_cache[key] = (pixels, valid)
+        return self.pixel_cache[key]
@@ -0,0 +1,114 @@
+import math
+from fractions import Fraction
+import cv2
+import numpy as np
+
+
+class MosaicCompositor:
+    """Lays several views of a frame out on one canvas
+
+    `rows` lists the views of each row; the tiles of a row share its width
+    and keep the source aspect ratio, so a row with fewer views is taller
+    (the Mixed tab puts original and trailed above a heatmap twice their
+    size). Views already at their tile size are copied in, others are
+    scaled straight into the canvas; tiles of missing views stay black.
+
+    With `reuse_canvas` the canvas is allocated once per size and
+    overwritten by the next compose, so it has to be shown or copied before
+    that; otherwise every compose returns a new array.
+    """
+
+    def __init__(self, rows, spacing=0, reuse_canvas=False):
+        self.rows = rows
+        self.spacing = spacing
+        self.reuse_canvas = reuse_canvas
+        self.canvas = None
+        self.layout_key = None
+        self.layout = None
+
+    def get_layout(self, source_size, max_width, max_height):
+        """Get the largest mosaic of source-shaped tiles fitting a box
+
+        Args:
+            source_size (tuple): (width, height) whose aspect ratio the tiles
+                keep
+            max_width (int): Box width
+            max_height (int): Box height
+
+        Returns:
+            tuple: ((width, height) of the canvas, dict of (x, y, width,
+                height) tile of each view)
+        """
+        key = (tuple(source_size), max_width, max_height)
+        if key == self.layout_key:
+            return self.layout
+
+        source_width, source_height = source_size
+        spacing = self.spacing
+        # Mosaic height is linear in its width; solve for the width filling
+        # max_height exactly (Fraction keeps whole sizes exact, e.g. a row
+        # of three 640x480 views is exactly 1920 wide)
+        per_width = sum(
+            Fraction(source_height, len(row) * source_width) for row in self.rows
+        )
+        offset = sum(
+            Fraction(spacing * (len(row) - 1) * source_height, len(row) * source_width)
+            for row in self.rows
+        )
+        gaps = spacing * (len(self.rows) - 1)
+        width = min(Fraction(max_width), (max_height - gaps + offset) / per_width)
+
+        tiles = {}
+        y = 0
+        canvas_width = 0
+        for row in self.rows:
+            count = len(row)
+            tile_width = max(1, math.floor((width - spacing * (count - 1)) / count))
+            tile_height = max(1, tile_width * source_height // source_width)
+            for column, view in enumerate(row):
+                x = column * (tile_width + spacing)
+                tiles[view] = (x, y, tile_width, tile_height)
+            canvas_width = max(
+                canvas_width, count * tile_width + spacing * (count - 1)
+            )
+            y += tile_height + spacing
+        canvas_size = (canvas_width, y - spacing)
+
+        self.layout_key = key
+        self.layout = (canvas_size, tiles)
+        return self.layout
+
+    def compose(self, views, source_size, max_width, max_height):
+        """Lay the views out on the canvas
+
+        Args:
+            views (dict): BGR frame of each view; views left out (or None)
+                leave their tile black
+            source_size (tuple): (width, height) the tiles are shaped like
+            max_width (int): Largest canvas width
+            max_height (int): Largest canvas height
+
+        Returns:
+            np.ndarray: The BGR canvas
+        """
+        (canvas_width, canvas_height), tiles = self.get_layout(
+            source_size, max_width, max_height
+        )
+        shape = (canvas_height, canvas_width, 3)
+        if not self.reuse_canvas or self.canvas is None or self.canvas.shape != shape:
+            # Gaps between the tiles are never drawn, clear them once
+            self.canvas = np.zeros(shape, dtype=np.uint8)
+        canvas = self.canvas
+
+        for view, (x, y, width, height) in tiles.items():
+            tile = canvas[y : y + height, x : x + width]
+            image = views.get(view)
+            if image is None:
+                tile.fill(0)
+            elif image.shape[:2] == (height, width):
+                tile[:] = image
+            else:
+                cv2.resize(
+                    image, (width, height), dst=tile, interpolation=cv2.INTER_LINEAR
+                )
+        return canvas
@@ -0,0 +1,80 @@
+import cv2
+import numpy as np
+
+COLORMAPS = {
+    "jet": cv2.COLORMAP_JET,
+    "hot": cv2.COLORMAP_HOT,
+    "rainbow": cv2.COLORMAP_RAINBOW,
+    "ocean": cv2.COLORMAP_OCEAN,
+    "viridis": cv2.COLORMAP_VIRIDIS,
+    "plasma": cv2.COLORMAP_PLASMA,
+    "magma": cv2.COLORMAP_MAGMA,
+    "inferno": cv2.COLORMAP_INFERNO,
+}
+
+
+class RenderContext:
+    """Per-renderer state reused from frame to frame
+
+    Holds a snapshot of the settings sections, refreshed only when the
+    settings handler's section versions change, scratch buffers kept per name and
+    shape so intermediate images are not reallocated for every frame, and
+    the colormap lookup tables.
+
+    Buffers are overwritten by the next frame; only the final output of a
+    render may be handed out.
+    """
+
+    def __init__(self, settings_handler):
+        self.settings_handler = settings_handler
+        self.settings_version = None
+        self.settings = {}
+        self.buffers = {}
+        self.colormap_luts = {}
+
+    def get_settings(self, section):
+        """Get a copy of a settings section, refreshed after set_setting calls"""
+        version = self.settings_handler.get_version(*self.settings_handler.settings)
+        if version != self.settings_version:
+            self.settings = {
+                name: dict(values)
+                for name, values in self.settings_handler.settings.items()
+                if isinstance(values, dict)
+            }
+            self.settings_version = version
+        return self.settings[section]
+
+    def get_buffer(self, name, shape, dtype=np.uint8):
+        """Get a scratch array, reused while the shape and dtype stay the same"""
+        buffer = self.buffers.get(name)
+        if buffer is None or buffer.shape != tuple(shape) or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self.buffers[name] = buffer
+        return buffer
+
+    def get_zeros(self, name, shape, dtype=np.uint8):
+        """Get a scratch array cleared to zero"""
+        buffer = self.get_buffer(name, shape, dtype)
+        buffer.fill(0)
+        return buffer
+
+    def get_colormap_lut(self, color_map):
+        """Get the 256 entry BGR lookup table of a colormap (jet if unknown)"""
+        lut = self.colormap_luts.get(color_map)
+        if lut is None:
+            colormap_value = COLORMAPS.get(color_map, cv2.COLORMAP_JET)
+            gray = np.arange(256, dtype=np.uint8).reshape(256, 1)
+            lut = cv2.applyColorMap(gray, colormap_value).reshape(256, 1, 3)
+            self.colormap_luts[color_map] = lut
+        return lut
+
+    def apply_colormap(self, gray, color_map):
+        """Color a uint8 image like cv2.applyColorMap, into a reused buffer"""
+        # A user colormap is a plain table lookup; this is faster than
+        # cv2.LUT on a 3-channel copy of the image
+        height, width = gray.shape[:2]
+        return cv2.applyColorMap(
+            gray,
+            self.get_colormap_lut(color_map),
+            dst=self.get_buffer("colored", (height, width, 3)),
+        )
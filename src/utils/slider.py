@@ -191,9 +191,21 @@ class RangeSlider(QtWidgets.QSlider):
                 )
                 self.triggerAction(self.SliderMove)
                 self.setRepeatAction(self.SliderNoAction)
+                self.setSliderDown(True)
         else:
             event.ignore()
 
+    def mouseReleaseEvent(self, event):
+        if self.pressed_control != QtWidgets.QStyle.SC_SliderHandle:
+            event.ignore()
+            return
+
+        event.accept()
+        self.pressed_control = QtWidgets.QStyle.SC_None
+        # Emits sliderReleased, so listeners know the handle is let go
+        self.setSliderDown(False)
+        self.update()
+
     def mouseMoveEvent(self, event):
         if self.pressed_control != QtWidgets.QStyle.SC_SliderHandle:
             event.ignore()
@@ -0,0 +1,163 @@
+import math
+import time
+import cv2
+import numpy as np
+
+
+class SyntheticCapture:
+    """Camera stand-in producing frames at an exact rate and resolution
+
+    Mimics the parts of cv2.VideoCapture used by CameraManager, so it runs
+    through the same capture thread as a real device. Frames are either
+    replayed from a video file (looping) or generated procedurally.
+
+    Frame n becomes available at start + n / fps. A read() that comes too
+    early blocks until the next frame is due; a read() that comes late gets
+    the newest due frame and the frames in between count as dropped, like a
+    camera driver with a one-frame buffer. Passing a custom clock and sleep
+    makes the timing fully deterministic.
+    """
+
+    def __init__(
+        self,
+        source=None,
+        width=640,
+        height=480,
+        fps=30.0,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.source = source
+        self.width = int(width)
+        self.height = int(height)
+        self.fps = float(fps)
+        self.clock = clock
+        self.sleep = sleep
+
+        self.start_time = None
+        self.frame_index = -1  # Index of the last delivered frame
+        self.dropped_frames = 0
+        self.background = None
+
+        self.video = None
+        self.video_frame_count = 0
+        self.opened = True
+        if source:
+            self.video = cv2.VideoCapture(source)
+            if not self.video.isOpened():
+                print(f"Failed to open synthetic source: {source}")
+                self.video = None
+                self.opened = False
+                return
+            self.video_frame_count = int(self.video.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    def isOpened(self):
+        return self.opened
+
+    def release(self):
+        if self.video is not None:
+            self.video.release()
+            self.video = None
+        self.opened = False
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self.width)
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self.height)
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.frame_index + 1)
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self.video_frame_count)
+        return 0.0
+
+    def set(self, prop, value):
+        """Accept resolution and rate changes before the first read"""
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            self.width = int(value)
+        elif prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            self.height = int(value)
+        elif prop == cv2.CAP_PROP_FPS and value > 0:
+            self.fps = float(value)
+        else:
+            return False
+        self.background = None
+        return True
+
+    def read(self):
+        if not self.opened:
+            return False, None
+
+        now = self.clock()
+        if self.start_time is None:
+            self.start_time = now
+
+        # Newest frame that is already due
+        due_index = int(math.floor((now - self.start_time) * self.fps))
+        if due_index <= self.frame_index:
+            # Too early: wait for the next frame like a blocking camera read
+            next_index = self.frame_index + 1
+            wait = self.start_time + next_index / self.fps - now
+            if wait > 0:
+                self.sleep(wait)
+            due_index = next_index
+
+        skipped = due_index - self.frame_index - 1
+        self.dropped_frames += skipped
+        self.frame_index = due_index
+
+        if self.video is not None:
+            frame = self._read_video_frame(skipped)
+        else:
+            frame = self._generate_frame(due_index)
+        return frame is not None, frame
+
+    def _read_video_frame(self, skipped):
+        """Read the next file frame, skipping frames the reader missed"""
+        for _ in range(skipped):
+            if not self.video.grab():
+                self.video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+        ret, frame = self.video.read()
+        if not ret:
+            # Loop back to the start of the file
+            self.video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.video.read()
+            if not ret:
+                return None
+
+        if frame.shape[:2] != (self.height, self.width):
+            frame = cv2.resize(frame, (self.width, self.height))
+        return frame
+
+    def _generate_frame(self, index):
+        """Draw a procedural frame with a moving marker and the frame number"""
+        if self.background is None or self.background.shape[:2] != (
+            self.height,
+            self.width,
+        ):
+            gradient = np.linspace(20, 80, self.width, dtype=np.uint8)
+            self.background = np.repeat(
+                np.tile(gradient, (self.height, 1))[:, :, np.newaxis], 3, axis=2
+            )
+
+        frame = self.background.copy()
+        phase = index / max(self.fps, 1.0)
+        center = (
+            int(self.width / 2 + self.width / 3 * math.cos(phase)),
+            int(self.height / 2 + self.height / 3 * math.sin(2 * phase)),
+        )
+        radius = max(4, min(self.width, self.height) // 20)
+        cv2.circle(frame, center, radius, (0, 200, 255), -1)
+        cv2.putText(
+            frame,
+            f"{index}",
+            (10, max(30, self.height // 12)),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            max(0.5, self.height / 480),
+            (255, 255, 255),
+            2,
+        )
+        return frame
@@ -0,0 +1,80 @@
+import cv2
+import numpy as np
+
+
+class TrailCanvas:
+    """Persistent trail overlay for sequential playback and export
+
+    Instead of redrawing trail_length frames of history for every output
+    frame, the overlay is kept between frames: each step multiplies it by a
+    decay factor and stamps only the newest frame's landmarks. The decay
+    d = n^(-1/(n-1)) makes a dot n frames old reach 1/n of its brightness,
+    the same range the linear alpha fade covers, but the falloff is
+    exponential and old dots fade out instead of disappearing after exactly
+    trail_length frames.
+
+    Any jump other than one frame forward, or a change of data, resolution
+    or trail settings, rebuilds the canvas from the last trail_length frames.
+    """
+
+    def __init__(self):
+        self.canvas = None
+        self.key = None
+        self.last_frame = None  # Newest frame stamped into the canvas
+        self.decay = 1.0
+
+    def reset(self):
+        """Forget the canvas so the next frame rebuilds it"""
+        self.key = None
+        self.last_frame = None
+
+    def get_overlay(
+        self, tracks, colors, width, height, frame_index, trail_length, size
+    ):
+        """Get the trail overlay for frame_index (trail of the frames before it)
+
+        Args:
+            tracks (LandmarkTracks): Parsed landmark positions
+            colors (np.ndarray): Color of each landmark (hand, landmark, BGR),
+                already scaled by the trail alpha
+            width (int): Frame width
+            height (int): Frame height
+            frame_index (int): Frame being rendered
+            trail_length (int): Number of previous frames in the trail
+            size (int): Landmark circle radius
+
+        Returns:
+            np.ndarray: uint8 overlay of shape (height, width, 3)
+        """
+        key = (id(tracks), width, height, trail_length, size, colors.tobytes())
+        if key != self.key:
+            self.key = key
+            self.canvas = np.zeros((height, width, 3), dtype=np.float32)
+            self.last_frame = None
+            self.decay = (
+                trail_length ** (-1.0 / (trail_length - 1)) if trail_length > 1 else 0.0
+            )
+
+        pixels, valid = tracks.get_pixels(width, height)
+        newest = min(frame_index, tracks.data_length) - 1
+
+        if self.last_frame is None or not (
+            self.last_frame <= newest <= self.last_frame + 1
+        ):
+            # Seek: replay the visible part of the trail
+            self.canvas.fill(0)
+            self.last_frame = max(-1, frame_index - trail_length - 1)
+
+        while self.last_frame < newest:
+            self.last_frame += 1
+            self.canvas *= self.decay
+            self._stamp(pixels, valid, colors, self.last_frame, size)
+
+        return self.canvas.astype(np.uint8)
+
+    def _stamp(self, pixels, valid, colors, index, size):
+        frame_valid = valid[index]
+        for position, color in zip(
+            pixels[index][frame_valid].tolist(), colors[frame_valid].tolist()
+        ):
+            cv2.circle(self.canvas, position, size, color, -1)
@@ -0,0 +1,223 @@
+import json
+import os
+import tempfile
+import cv2
+import numpy as np
+
+
+class VideoProxy:
+    """Low-resolution copy of a video and a thumbnail strip, for scrubbing
+
+    The proxy is PROXY_WIDTH pixels wide and Motion JPEG encoded, so every
+    frame is a keyframe and any frame is one small JPEG decode away; a
+    random jump costs about a millisecond instead of a seek through the
+    original recording. THUMBNAIL_COUNT thumbnails spread evenly over the
+    video are kept for the strip drawn above the frame slider.
+
+    Both are made by one background pass over the video and saved in
+    `proxy_folder`, tied to the video's size and modification time.
+    """
+
+    PROXY_WIDTH = 320
+    THUMBNAIL_HEIGHT = 40
+    THUMBNAIL_COUNT = 64
+
+    def __init__(self, video_path, proxy_folder="src/data/proxy_movie"):
+        self.video_path = video_path
+        name = os.path.basename(video_path)
+        self.proxy_path = os.path.join(proxy_folder, name + ".avi")
+        self.info_path = os.path.join(proxy_folder, name + ".json")
+        self.thumbnails_path = os.path.join(proxy_folder, name + "_thumbnails.png")
+        self.frame_count = 0
+        self.thumbnails = None  # (count, height, width, 3) BGR thumbnails
+        self.thumbnail_frames = []  # Video frame of each thumbnail
+        self.cap = None  # Proxy capture, only used from the GUI thread
+        self.position = None  # Frame the proxy capture decodes next
+        self.ready = False
+        self.finished = False  # Loaded, built, failed or cancelled
+        self.cancelled = False
+
+    def cancel(self):
+        """Stop a build running on another thread"""
+        self.cancelled = True
+
+    def close(self):
+        """Release the proxy capture"""
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    def get_frame(self, frame_index):
+        """Get a frame of the proxy
+
+        Returns:
+            np.ndarray: BGR frame, or None if the proxy isn't ready
+        """
+        if not self.ready or not 0 <= frame_index < self.frame_count:
+            return None
+        if self.cap is None:
+            self.cap = cv2.VideoCapture(self.proxy_path)
+            self.position = None
+        if self.position != frame_index:
+            # Every frame is a keyframe, seeking decodes only the target
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        ret, frame = self.cap.read()
+        self.position = frame_index + 1 if ret else None
+        return frame if ret else None
+
+    def get_thumbnail_strip(self, width, height):
+        """Lay the thumbnails side by side over a strip the slider's width
+
+        Each slot shows the thumbnail nearest to the frame under its middle.
+
+        Args:
+            width (int): Strip width
+            height (int): Strip height
+
+        Returns:
+            np.ndarray: BGR strip, or None if the thumbnails aren't ready
+        """
+        if not self.ready or self.thumbnails is None or width < 1 or height < 1:
+            return None
+        thumbnail_height, thumbnail_width = self.thumbnails.shape[1:3]
+        slot_width = max(1, int(thumbnail_width * height / thumbnail_height))
+        slots = -(-width // slot_width)
+        centers = (np.arange(slots) + 0.5) / slots * self.frame_count
+        nearest = np.abs(
+            np.asarray(self.thumbnail_frames)[np.newaxis, :] - centers[:, np.newaxis]
+        ).argmin(axis=1)
+        strip = np.hstack(self.thumbnails[nearest])
+        strip = cv2.resize(
+            strip, (slot_width * slots, height), interpolation=cv2.INTER_AREA
+        )
+        return np.ascontiguousarray(strip[:, :width])
+
+    def load_or_build(self):
+        """Load the saved proxy, or make it and save it (may run on a thread)"""
+        try:
+            if not self.load():
+                self.build()
+        except Exception as e:
+            print(f"Error building video proxy: {str(e)}")
+        finally:
+            self.finished = True
+
+    def get_signature(self):
+        """Get what identifies the video file the proxy belongs to"""
+        stat = os.stat(self.video_path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def load(self):
+        """Load the saved proxy if it matches the video
+
+        Returns:
+            bool: True if the proxy is ready
+        """
+        try:
+            with open(self.info_path, "r") as f:
+                info = json.load(f)
+            if info.get("signature") != self.get_signature():
+                return False
+            if not os.path.exists(self.proxy_path):
+                return False
+            strip = cv2.imread(self.thumbnails_path)
+            if strip is None:
+                return False
+            count = len(info["thumbnail_frames"])
+            self.thumbnails = np.stack(np.split(strip, count, axis=1))
+            self.thumbnail_frames = info["thumbnail_frames"]
+            self.frame_count = info["frame_count"]
+            self.ready = self.frame_count > 0
+            return self.ready
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def build(self):
+        """Make the proxy and thumbnails in one pass over the video and save them"""
+        cap = cv2.VideoCapture(self.video_path)
+        writer = None
+        partial_path = None
+        try:
+            if not cap.isOpened():
+                print(f"Cannot open {self.video_path} to make a proxy")
+                return
+            fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            expected_frames = max(1, int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))
+            proxy_width = min(width, self.PROXY_WIDTH)
+            proxy_size = (proxy_width, max(2, round(height * proxy_width / width)))
+            thumbnail_size = (
+                max(1, round(width * self.THUMBNAIL_HEIGHT / height)),
+                self.THUMBNAIL_HEIGHT,
+            )
+            thumbnail_at = set(
+                np.linspace(0, expected_frames - 1, self.THUMBNAIL_COUNT)
+                .round()
+                .astype(int)
+                .tolist()
+            )
+
+            os.makedirs(os.path.dirname(self.proxy_path), exist_ok=True)
+            # A build of the same video cancelled by switching recordings may
+            # still be running, so each build writes its own partial file
+            fd, partial_path = tempfile.mkstemp(
+                prefix=os.path.basename(self.proxy_path) + ".",
+                suffix=".part.avi",
+                dir=os.path.dirname(self.proxy_path),
+            )
+            os.close(fd)
+            writer = cv2.VideoWriter(
+                partial_path,
+                cv2.VideoWriter_fourcc(*"MJPG"),
+                fps,
+                proxy_size,
+                isColor=True,
+            )
+            if not writer.isOpened():
+                print(f"Cannot write video proxy {partial_path}")
+                return
+
+            thumbnails = []
+            thumbnail_frames = []
+            frame_count = 0
+            while not self.cancelled:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                small = cv2.resize(frame, proxy_size, interpolation=cv2.INTER_AREA)
+                writer.write(small)
+                if frame_count in thumbnail_at:
+                    thumbnails.append(
+                        cv2.resize(small, thumbnail_size, interpolation=cv2.INTER_AREA)
+                    )
+                    thumbnail_frames.append(frame_count)
+                frame_count += 1
+            writer.release()
+            writer = None
+            if self.cancelled or not thumbnails:
+                return
+
+            os.replace(partial_path, self.proxy_path)
+            cv2.imwrite(self.thumbnails_path, np.hstack(thumbnails))
+            with open(self.info_path, "w") as f:
+                json.dump(
+                    {
+                        "video": os.path.basename(self.video_path),
+                        "signature": self.get_signature(),
+                        "frame_count": frame_count,
+                        "proxy_size": list(proxy_size),
+                        "thumbnail_frames": thumbnail_frames,
+                    },
+                    f,
+                )
+            self.thumbnails = np.stack(thumbnails)
+            self.thumbnail_frames = thumbnail_frames
+            self.frame_count = frame_count
+            self.ready = True
+        finally:
+            cap.release()
+            if writer is not None:
+                writer.release()
+            if partial_path is not None and os.path.exists(partial_path):
+                os.remove(partial_path)